@@ -1,7 +1,7 @@
 from flask import Flask, render_template
 import os, logging
 
-from app.extensions import db
+from app.extensions import db, deck_cache, fragment_cache, page_cache, init_query_analysis
 from flask_wtf.csrf import CSRFProtect
 
 PATH = os.path.dirname(os.path.abspath(__file__))
@@ -31,6 +31,18 @@ def init_app(configure='config.DevConfig'):
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
     db.init_app(app)
+    with app.app_context():
+        # Slow query log and repeated statement detector
+        init_query_analysis(app)
+    deck_cache.configure(max_size=app.config['DECK_CACHE_SIZE'], ttl=app.config['DECK_CACHE_TTL'])
+    fragment_cache.configure(max_size=app.config['FRAGMENT_CACHE_SIZE'])
+    page_cache.configure(
+        max_entries=app.config['PAGE_CACHE_SIZE'],
+        max_bytes=app.config['PAGE_CACHE_MAX_BYTES'],
+        ttl=app.config['PAGE_CACHE_TTL'],
+        stale_ttl=app.config['PAGE_CACHE_STALE_TTL'],
+        refresh_ahead=app.config['PAGE_CACHE_REFRESH_AHEAD']
+    )
     CSRFProtect(app)
 
     from app.models.flashcard_model import view_all_categories
@@ -54,13 +66,33 @@ def init_app(configure='config.DevConfig'):
 
     with app.app_context():
         # NOTE: Include routes and custom modules here
-        from . import utils
+        from . import utils, fragments
+
+        # Stream uploaded images to disk while the form is parsed
+        app.request_class = utils.UploadRequest
+
+        # Widths of the resized image copies used for srcset in the templates
+        app.jinja_env.globals['IMAGE_WIDTHS'] = utils.IMAGE_WIDTHS
+        # Languages of the Prism bundle loaded by pages with code left for the browser to highlight
+        app.jinja_env.globals['prism_languages'] = utils.prism_languages
+        # Cached html of each card, pages concatenate the fragments instead of rendering every card
+        app.jinja_env.globals['render_card'] = fragments.render_card
 
         from app.main import bp as main_bp
         from app.manage import bp as manage_bp
 
         app.register_blueprint(main_bp)
         app.register_blueprint(manage_bp, url_prefix='/manage')
+
+        # Request, SQL, template, and cache metrics at /metrics
+        if app.config.get('METRICS'):
+            from app.metrics import init_metrics
+            init_metrics(app, db.engine)
+
+        # Profiles single requests that carry the profiling secret
+        if app.config.get('PROFILING') and app.config.get('PROFILE_SECRET'):
+            from app.profiling import init_profiling
+            init_profiling(app)
         app.register_error_handler(404, page_not_found)
 
     return app
\ No newline at end of file
@@ -1,6 +1,123 @@
 '''
 Manages flask application extensions 
 '''
+import time
+from flask import g, request, has_request_context
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
-db = SQLAlchemy()
\ No newline at end of file
+from app.utils import LOGGER, Cache
+from app.page_cache import PageCache
+
+db = SQLAlchemy()
+
+# Read-through cache for deck queries, sized by init_app from the config
+deck_cache = Cache()
+
+# Rendered html of each card keyed by template, card id, and a digest of the card data, sized by init_app from the config
+fragment_cache = Cache()
+
+# Whole responses of the main blueprint pages, configured by init_app from the config
+page_cache = PageCache()
+
+# ==============================================================================================================
+# Query analysis
+# ==============================================================================================================
+class RepeatedQueryError(Exception):
+    '''
+    Raised at the end of a request that issued the same statement more times than N_PLUS_ONE_THRESHOLD, when
+    N_PLUS_ONE_RAISE is enabled
+    '''
+
+def explain(cursor, dialect:str, statement:str, parameters):
+    '''
+    Fetches the query plan of a statement on the DBAPI connection of the cursor, so the plan is not recorded
+    as another statement
+
+    Parameter(s):
+        cursor (object): the DBAPI cursor that executed the statement
+        dialect (str): the name of the database dialect
+        statement (str): the executed statement
+        parameters (tuple or dict): the parameters of the statement
+
+    Output(s):
+        plan (str): the lines of the query plan, else None if it could not be fetched
+    '''
+    prefix = 'EXPLAIN QUERY PLAN ' if dialect == 'sqlite' else 'EXPLAIN '
+    try:
+        explain_cursor = cursor.connection.cursor()
+        try:
+            explain_cursor.execute(prefix + statement, parameters)
+            return '; '.join(' '.join(str(column) for column in row) for row in explain_cursor.fetchall())
+        finally:
+            explain_cursor.close()
+
+    except Exception as e:
+        LOGGER.warning(f"Failed to explain a slow query: {e}")
+        return None
+
+# --------------------------------------------------------------------------------------------------------------
+def init_query_analysis(app):
+    '''
+    Adds the slow query log and the repeated statement detector to the database engine of the application.
+    Statements slower than SLOW_QUERY_THRESHOLD seconds are logged with their query plan. Requests issuing the
+    same parameterized statement more than N_PLUS_ONE_THRESHOLD times are logged, and raise a
+    RepeatedQueryError if N_PLUS_ONE_RAISE is enabled.
+
+    Parameter(s):
+        app (Flask): the flask application, called with its app context pushed
+
+    Output(s): None
+    '''
+    engine = db.engine
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('query_start')
+        elapsed = time.perf_counter() - starts.pop() if starts else 0
+
+        slow_threshold = app.config.get('SLOW_QUERY_THRESHOLD')
+        if slow_threshold is not None and elapsed >= slow_threshold:
+            plan = None
+            if not executemany and statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+                plan = explain(cursor, conn.dialect.name, statement, parameters)
+            LOGGER.warning(f"Slow query ({elapsed * 1000:.1f} ms): {' '.join(statement.split())} | plan: {plan}")
+
+        if has_request_context() and 'query_counts' in g:
+            g.query_counts[statement] = g.query_counts.get(statement, 0) + 1
+
+    def handle_error(context):
+        starts = context.connection.info.get('query_start') if context.connection is not None else None
+        if starts:
+            starts.pop()
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+    event.listen(engine, 'handle_error', handle_error)
+
+    @app.before_request
+    def count_queries():
+        # The app context, and with it g, can outlive a single request
+        if app.config.get('N_PLUS_ONE_THRESHOLD') is not None:
+            g.query_counts = {}
+
+    @app.after_request
+    def check_repeated_queries(response):
+        repeat_threshold = app.config.get('N_PLUS_ONE_THRESHOLD')
+        if repeat_threshold is None:
+            return response
+
+        repeated = {statement: count for statement, count in g.pop('query_counts', {}).items() if count > repeat_threshold}
+
+        for statement, count in repeated.items():
+            LOGGER.warning(f"Repeated query in {request.endpoint} ({count} times): {' '.join(statement.split())}")
+
+        if repeated and app.config.get('N_PLUS_ONE_RAISE'):
+            raise RepeatedQueryError(
+                f"{request.endpoint} issued {len(repeated)} statements more than {repeat_threshold} times, "
+                f"the most repeated {max(repeated.values())} times"
+            )
+
+        return response
@@ -0,0 +1,88 @@
+'''
+Cache of the rendered html of each flashcard
+
+The card templates branch on the figure types of both sides, so the html of a card is rendered once and pages
+concatenate the cached fragments. Fragments are keyed on a digest of the card data they are rendered from, so
+a card changed by another process (an update, highlighting the code again with rebuild_code_html, or a new card
+reusing the id of a deleted one) gets a new key even though this process was not told about it. Old fragments
+are never served again and age out of the LRU cache. Deleted cards drop their fragments to free the space early.
+'''
+import hashlib, json, threading, time
+from flask import render_template
+from markupsafe import Markup
+
+from app.extensions import fragment_cache
+from app.profiling import profiling
+
+# Fragment templates by name, rendered with the flashcard from FlashcardModel.view()
+FRAGMENTS = {
+    'flashcard': 'fragments/flashcard.html',
+    'manage_row': 'fragments/manage_row.html',
+}
+
+# Time spent rendering fragments on cache misses
+_render_lock = threading.Lock()
+_renders = 0
+_render_seconds = 0.0
+
+def render_card(fragment:str, flashcard:dict):
+    '''
+    Gets the rendered html of a card, rendering and caching it on a miss
+
+    Parameter(s):
+        fragment (str): the name of the fragment template in FRAGMENTS
+        flashcard (dict): the flashcard data from FlashcardModel.view()
+
+    Output(s):
+        html (Markup): the rendered fragment, safe to insert into a page
+    '''
+    global _renders, _render_seconds
+
+    digest = hashlib.blake2b(json.dumps(flashcard, sort_keys=True, default=str).encode('utf-8'), digest_size=16).digest()
+    key = (fragment, flashcard['id'], digest)
+    html = fragment_cache.get(key) if not profiling() else None
+    if html is not None:
+        return html
+
+    start = time.perf_counter()
+    html = Markup(render_template(FRAGMENTS[fragment], flashcard=flashcard))
+    elapsed = time.perf_counter() - start
+
+    with _render_lock:
+        _renders += 1
+        _render_seconds += elapsed
+
+    fragment_cache.set(key, html)
+    return html
+
+# --------------------------------------------------------------------------------------------------------------
+def drop_card_fragments(*ids:int):
+    '''
+    Drops the cached fragments of deleted cards
+
+    Parameter(s):
+        ids (int): the ids of the deleted cards
+
+    Output(s): None
+    '''
+    fragment_cache.drop_if(lambda key: key[1] in ids)
+
+# --------------------------------------------------------------------------------------------------------------
+def fragment_stats():
+    '''
+    Gets the fragment cache counters and the time spent rendering fragments
+
+    Output(s):
+        response (dict): the cache counters, the hit rate, and the number and total seconds of renders
+    '''
+    stats = fragment_cache.stats()
+    lookups = stats['hits'] + stats['misses']
+
+    with _render_lock:
+        stats['renders'] = _renders
+        stats['render_seconds'] = round(_render_seconds, 6)
+
+    stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else None
+    stats['avg_render_ms'] = round(stats['render_seconds'] * 1000 / stats['renders'], 3) if stats['renders'] else None
+
+    return stats
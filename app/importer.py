@@ -0,0 +1,227 @@
+'''
+Import pipeline for loading flashcards from JSON exports
+
+Cards are validated, normalized, and hashed in chunks, either inline or by a pool of worker processes, while
+the calling process is the only database writer. Prepared chunks are written in the order they were read, so
+errors are reported by their position in the source file.
+'''
+import hashlib, json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from app.utils import LOGGER
+
+# Common spellings of code types mapped to the names used by the syntax highlighter
+CODE_TYPE_ALIASES = {
+    'py': 'python',
+    'python3': 'python',
+    'js': 'javascript',
+    'c++': 'cpp',
+    'c#': 'csharp',
+    'cs': 'csharp',
+}
+
+# ==============================================================================================================
+# Functions run by the worker processes
+# ==============================================================================================================
+def normalize_code_type(code_type:str):
+    '''
+    Normalizes the name of a programming language
+
+    Parameter(s):
+        code_type (str): the code type entered for a figure
+
+    Output(s):
+        str: the lowercase code type with aliases resolved, else None if it is empty
+    '''
+    if not code_type or not code_type.strip():
+        return None
+
+    code_type = code_type.strip().lower()
+    return CODE_TYPE_ALIASES.get(code_type, code_type)
+
+# --------------------------------------------------------------------------------------------------------------
+def content_hash(card:dict):
+    '''
+    Hashes the content of a prepared card so identical cards can be detected
+
+    Parameter(s):
+        card (dict): the prepared card
+
+    Output(s):
+        str: the hex sha256 digest of the card content
+    '''
+    fields = ['category', 'question', 'answer', 'q_code_type', 'q_code_example', 'a_code_type', 'a_code_example']
+    content = json.dumps([card.get(field) for field in fields], ensure_ascii=False)
+
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+# --------------------------------------------------------------------------------------------------------------
+def normalize_card(card:dict):
+    '''
+    Converts a card from the JSON export format into the inputs of FlashcardModel.bulk_create without validating it
+
+    Parameter(s):
+        card (dict): a card in the export format (category, question, answer, q_code_type, q_code_block, ...)
+
+    Output(s):
+        card (dict): the card with its text stripped and its code types normalized
+    '''
+    def text(value):
+        return value.strip() if isinstance(value, str) and value.strip() else None
+
+    return {
+        'key': card.get('key'),
+        'category': text(card.get('category')),
+        'question': text(card.get('question')),
+        'answer': text(card.get('answer')),
+        'q_code_type': normalize_code_type(card.get('q_code_type')),
+        'q_code_example': card.get('q_code_block') or None,
+        'a_code_type': normalize_code_type(card.get('a_code_type')),
+        'a_code_example': card.get('a_code_block') or None,
+    }
+
+# --------------------------------------------------------------------------------------------------------------
+def prepare_card(card:dict):
+    '''
+    Converts a card from the JSON export format into the inputs of FlashcardModel.bulk_create and validates it
+
+    Parameter(s):
+        card (dict): a card in the export format (category, question, answer, q_code_type, q_code_block, ...)
+
+    Output(s):
+        card (dict): the prepared card with its content hash, else raises an error describing the invalid input
+    '''
+    prepared = normalize_card(card)
+
+    if not prepared['category']:
+        raise ValueError("Missing category input!")
+    if len(prepared['category']) > 100:
+        raise ValueError("Category is longer than 100 characters!")
+
+    for f, side in (('q', 'question'), ('a', 'answer')):
+        code_type, code_example = prepared[f'{f}_code_type'], prepared[f'{f}_code_example']
+
+        if bool(code_type) != bool(code_example):
+            raise ValueError(f"Missing {side} figure inputs!")
+        if code_type and len(code_type) > 25:
+            raise ValueError(f"The {side} code type is longer than 25 characters!")
+        if not (prepared[side] or code_example):
+            raise ValueError(f"No {side} inputs!")
+
+    prepared['content_hash'] = content_hash(prepared)
+    return prepared
+
+# --------------------------------------------------------------------------------------------------------------
+def prepare_chunk(start:int, cards:list):
+    '''
+    Prepares a chunk of cards, collecting errors instead of stopping at the first invalid card
+
+    Parameter(s):
+        start (int): the position of the first card of the chunk in the source file
+        cards (list): the cards in the export format
+
+    Output(s):
+        a tuple containing the prepared cards and a list of (position, error message) tuples
+    '''
+    prepared, errors = [], []
+
+    for position, card in enumerate(cards, start=start):
+        try:
+            prepared.append(prepare_card(card))
+        except Exception as e:
+            errors.append((position, str(e)))
+
+    return (prepared, errors)
+
+# ==============================================================================================================
+# Functions run by the writer
+# ==============================================================================================================
+def chunked(cards, size:int):
+    '''
+    Splits an iterable of cards into (position, list) chunks without materializing it
+    '''
+    cards, start = iter(cards), 0
+
+    while True:
+        chunk = list(islice(cards, size))
+        if not chunk:
+            return
+        yield (start, chunk)
+        start += len(chunk)
+
+# --------------------------------------------------------------------------------------------------------------
+def import_cards(cards, write, workers:int=1, chunk_size:int=1000, max_pending:int=None, progress=None):
+    '''
+    Prepares cards and passes them to a single writer. With more than one worker, chunks are prepared by a
+    process pool and at most max_pending chunks are in flight, so a slow writer holds back the reader instead
+    of letting prepared chunks pile up in memory.
+
+    Parameter(s):
+        cards (iterable): cards in the export format, can be a generator
+        write (callable): writes a list of prepared cards to the database and returns the number of inserted,
+            updated, and unchanged cards as a dictionary
+        workers (int, default=1): the number of processes preparing cards, prepares inline if 1 or less
+        chunk_size (int, default=1000): the number of cards prepared and written together
+        max_pending (int, default=None): the number of chunks in flight, defaults to twice the workers
+        progress (callable, default=None): called with the summary after each chunk is written
+
+    Output(s):
+        summary (dict): the number of written and duplicate cards and the errors ordered by position. Duplicates
+            are counted within a chunk, a key repeated in a later chunk is counted as unchanged or updated.
+
+        summary = {
+            'inserted': int,
+            'updated': int,
+            'unchanged': int,
+            'duplicates': int,
+            'errors': [(position, message), ... ]
+        }
+    '''
+    summary = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'duplicates': 0, 'errors': []}
+
+    def drain(prepared, errors):
+        # Skip cards repeating a key, or the content of an unkeyed card, earlier in the chunk. Keys repeated
+        # across chunks are matched by the upsert of the writer, so memory does not grow with the import.
+        unique, seen = [], set()
+        for card in prepared:
+            identity = ('key', str(card['key'])) if card['key'] is not None else ('hash', card['content_hash'])
+
+            if identity in seen:
+                summary['duplicates'] += 1
+            else:
+                seen.add(identity)
+                unique.append(card)
+
+        if unique:
+            for name, count in write(unique).items():
+                summary[name] += count
+
+        summary['errors'].extend(errors)
+
+        for position, message in errors:
+            LOGGER.warning(f"Skipped card {position}: {message}")
+        if progress:
+            progress(summary)
+
+    if workers <= 1:
+        for start, chunk in chunked(cards, chunk_size):
+            drain(*prepare_chunk(start, chunk))
+        return summary
+
+    max_pending = max_pending or workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+
+        for start, chunk in chunked(cards, chunk_size):
+            pending.append(pool.submit(prepare_chunk, start, chunk))
+
+            # Back-pressure: write the oldest chunk before reading more
+            if len(pending) >= max_pending:
+                drain(*pending.popleft().result())
+
+        while pending:
+            drain(*pending.popleft().result())
+
+    return summary
@@ -0,0 +1,174 @@
+'''
+Background job functions and the worker loop
+
+Functions registered with @register_job can be queued by name with enqueue() and are run by the worker command:
+
+python commands.py worker
+'''
+import json, os, threading, time
+
+from app.extensions import db
+from app.importer import import_cards
+from app.utils import LOGGER, JSONStream, create_image_variants
+from app.models.flashcard_model import FlashcardModel
+from app.models.deletion_model import drain_image_deletions
+from app.models.job_model import claim_job, extend_job, finish_job
+
+# Job functions by name
+JOBS = {}
+# The job run by the worker of this thread, read by keep_alive
+CURRENT_JOB = threading.local()
+
+class ClaimLostError(Exception):
+    '''
+    Raised when the visibility timeout of a running job passed and another worker claimed it
+    '''
+
+def register_job(name:str):
+    '''
+    Registers a function as a background job
+
+    Parameter(s):
+        name (str): the name the job is queued under
+
+    Output(s):
+        a decorator that registers the function and returns it unchanged
+    '''
+    def register(function):
+        JOBS[name] = function
+        return function
+    return register
+
+# --------------------------------------------------------------------------------------------------------------
+def keep_alive():
+    '''
+    Extends the visibility timeout of the job being run, called by long jobs as they make progress. Raises
+    ClaimLostError if the job was claimed by another worker, so the job stops instead of running twice.
+
+    Parameter(s): None
+
+    Output(s): None
+    '''
+    claim = getattr(CURRENT_JOB, 'claim', None)
+    if claim is None:
+        return
+
+    job, attempt, visibility_timeout = claim
+    if not extend_job(job, attempt, visibility_timeout=visibility_timeout):
+        raise ClaimLostError(f"Job {job.id} was claimed again by another worker")
+
+# ==============================================================================================================
+# Jobs
+# ==============================================================================================================
+@register_job('create_image_variants')
+def image_variants_job(filename:str):
+    '''
+    Creates the resized copies of an uploaded image
+    '''
+    return create_image_variants(filename)
+
+# --------------------------------------------------------------------------------------------------------------
+@register_job('drain_image_deletions')
+def image_deletions_job():
+    '''
+    Removes the images queued for deletion
+    '''
+    return drain_image_deletions()
+
+# --------------------------------------------------------------------------------------------------------------
+@register_job('import_json')
+def import_json_job(filename:str, batch_size:int=1000, remove:bool=False):
+    '''
+    Imports the flashcards in a JSON file, streaming it so large uploads are not loaded into memory
+
+    Parameter(s):
+        filename (str): the path of the JSON file
+        batch_size (int, default=1000): the number of flashcards written per transaction
+        remove (bool, default=False): removes the file once it is imported
+
+    Output(s):
+        summary (dict): the number of inserted, updated, unchanged, and duplicate cards and the errors
+    '''
+    # Large files take longer than the visibility timeout, so the claim is extended after every chunk
+    summary = import_cards(
+        JSONStream(filename=filename),
+        write=lambda cards: FlashcardModel.bulk_upsert(cards, batch_size=batch_size),
+        chunk_size=batch_size,
+        progress=lambda summary: keep_alive()
+    )
+
+    if remove and os.path.exists(filename):
+        os.remove(filename)
+
+    return summary
+
+# ==============================================================================================================
+# Functions for running jobs
+# ==============================================================================================================
+def run_next_job(visibility_timeout:int=300, retry_delay:int=10):
+    '''
+    Claims and runs the next job that is ready
+
+    Parameter(s):
+        visibility_timeout (int, default=300): the number of seconds the job is hidden from other workers
+        retry_delay (int, default=10): the number of seconds before the first retry of a failed job
+
+    Output(s):
+        job (JobModel): the job that was run, else None if no job is ready
+    '''
+    job = claim_job(visibility_timeout=visibility_timeout)
+    if job is None:
+        return None
+
+    # The attempts of the job are reloaded after every commit, so the claim is kept as it was when claimed
+    attempt = job.attempts
+    CURRENT_JOB.claim = (job, attempt, visibility_timeout)
+
+    try:
+        function = JOBS.get(job.name)
+        if function is None:
+            raise LookupError(f"No job is registered as {job.name}")
+
+        function(**json.loads(job.payload))
+        if finish_job(job, attempt=attempt):
+            LOGGER.info(f"Successfully ran job {job.id}: {job.name}")
+
+    except ClaimLostError as e:
+        db.session.rollback()
+        LOGGER.warning(f"Stopped job {job.id}: {job.name} (attempt {attempt}): {e}")
+
+    except Exception as e:
+        LOGGER.error(f"An error occurred when running job {job.id}: {job.name} (attempt {attempt}): {e}")
+        db.session.rollback()
+        finish_job(job, error=str(e) or type(e).__name__, retry_delay=retry_delay, attempt=attempt)
+
+    finally:
+        CURRENT_JOB.claim = None
+
+    return job
+
+# --------------------------------------------------------------------------------------------------------------
+def run_worker(poll_interval:float=1.0, visibility_timeout:int=300, retry_delay:int=10, burst:bool=False):
+    '''
+    Runs jobs until interrupted, sleeping while the queue is empty
+
+    Parameter(s):
+        poll_interval (float, default=1.0): the number of seconds between checks of an empty queue
+        visibility_timeout (int, default=300): the number of seconds a claimed job is hidden from other workers
+        retry_delay (int, default=10): the number of seconds before the first retry of a failed job
+        burst (bool, default=False): stops once the queue is empty instead of waiting for more jobs
+
+    Output(s):
+        count (int): the number of jobs run
+    '''
+    count = 0
+
+    while True:
+        job = run_next_job(visibility_timeout=visibility_timeout, retry_delay=retry_delay)
+
+        if job is not None:
+            count += 1
+        elif burst:
+            return count
+        else:
+            time.sleep(poll_interval)
@@ -1,12 +1,27 @@
-from flask import render_template
+from flask import render_template, request, jsonify, url_for, current_app, abort, make_response
+import hashlib
 
 from app.main import bp
-from app.utils import LOGGER
-from app.models.flashcard_model import view_all_categories, view_all_cards
+from app.utils import LOGGER, get_page_args, decode_cursor, prism_bundle, not_modified, set_validators
+from app.models.category_model import get_deck_versions
+from app.page_cache import cached_page
+from app.models.flashcard_model import view_all_categories, view_cards_page
+from app.models.search_model import search_flashcards
+
+# Versions of the data each cached page is built from
+def deck_version(**kwargs):
+    return get_deck_versions()[1]
+
+def category_version(category:str):
+    return get_deck_versions(category)[:2]
+
+def api_version(**kwargs):
+    return get_deck_versions(request.args.get('category', default=None, type=str) or None)[0]
 
 # ==============================================================================================================
 @bp.route("/")
 @bp.route("/home")
+@cached_page(deck_version)
 def index():
     '''
     Builds and returns an html page that displays the categories and the number of questions in 
@@ -24,18 +39,115 @@ def index():
 
 # ==============================================================================================================
 @bp.route("/flashcards/<category>")
+@cached_page(category_version)
 def flashcard(category):
     '''
-    Builds and returns an html page based on the specified question category.
+    Builds and returns an html page based on the specified question category. The page changes with the cards
+    of the category and with the category counts shown in the menu, so its ETag is built from the category and 
+    deck versions and repeat visits are answered with a 304 before any card is read.
 
     Parameter(s):
         category (str): the type of questions being queried from the database
+        after (str, query string): cursor of the page being viewed, starts at the first card if missing
+        limit (int, query string): the number of flashcards in the page
 
     Output(s):
-        a built html page that displays the flashcards
+        a built html page that displays the flashcards, else a 304 response if the client's copy is current
     '''
-    # Query database for questions related to specified category
-    flashcards = view_all_cards(category=category)
-    categories = view_all_categories()
+    after, limit = get_page_args(request, current_app.config['CARDS_PER_PAGE'], current_app.config['MAX_CARDS_PER_PAGE'])
+
+    category_version, deck_version, updated_at = get_deck_versions(category)
+    etag = f"cards-{category_version}-{deck_version}"
+    cached = not_modified(request, etag, updated_at, weak=True)
+    if cached:
+        return cached
+
+    # Query database for a page of questions related to specified category
+    # The cards are read at the versions of the ETag, so a 304 is never sent for an older page
+    page = view_cards_page(category=category, after=after, limit=limit, version=category_version)
+    categories = view_all_categories(version=deck_version)
+
+    next_page = url_for('main.flashcard', category=category, after=page['next'], limit=limit) if page['next'] else None
+
+    response = make_response(render_template('flashcards.html', nav_id="flashcard-page", flashcards=page['flashcards'], categories=categories, next_page=next_page))
+    return set_validators(response, etag, updated_at, weak=True)
+
+# ==============================================================================================================
+@bp.route("/api/flashcards")
+@cached_page(api_version)
+def flashcards_api():
+    '''
+    Returns a page of flashcards as json, ordered by category and id. The ETag is the version of the category, 
+    or of the whole deck if no category is given.
+
+    Parameter(s):
+        category (str, query string): the category the flashcards are filtered by, all categories if missing
+        after (str, query string): the cursor returned with the previous page
+        limit (int, query string): the number of flashcards in the page
+
+    Output(s):
+        a json object with the flashcards and the cursor of the next page, else a 304 response if the client's
+        copy is current
+    '''
+    category = request.args.get('category', default=None, type=str) or None
+    after, limit = get_page_args(request, current_app.config['CARDS_PER_PAGE'], current_app.config['MAX_CARDS_PER_PAGE'])
+
+    if after and not decode_cursor(after):
+        return jsonify(error="Invalid cursor!"), 400
+
+    version, _, updated_at = get_deck_versions(category)
+    etag = f"api-{version}"
+    cached = not_modified(request, etag, updated_at)
+    if cached:
+        return cached
+
+    page = view_cards_page(category=category, after=after, limit=limit, version=version)
+
+    return set_validators(jsonify(flashcards=page['flashcards'], next=page['next']), etag, updated_at)
+
+# ==============================================================================================================
+@bp.route("/api/search")
+@cached_page(deck_version)
+def search_api():
+    '''
+    Searches the questions, answers, and code of the flashcards and returns the results ordered by relevance.
+
+    Parameter(s):
+        q (str, query string): the search text
+        page (int, query string): the page of results starting at 1
+        limit (int, query string): the number of results in a page
+
+    Output(s):
+        a json object with the results, matched words in each snippet are wrapped in <mark> tags
+    '''
+    query = request.args.get('q', default='', type=str)
+    page = max(1, request.args.get('page', default=1, type=int))
+    limit = max(1, min(request.args.get('limit', default=20, type=int), current_app.config['MAX_CARDS_PER_PAGE']))
+
+    response = search_flashcards(query, page=page, limit=limit)
+
+    return jsonify(**response)
+
+# ==============================================================================================================
+@bp.route("/prism/<languages>.js")
+def prism_script(languages):
+    '''
+    Serves the Prism core with only the components of the requested languages, so pages load the highlighting 
+    they need instead of every language
+
+    Parameter(s):
+        languages (str): the Prism component names joined by '+'
+
+    Output(s):
+        the javascript bundle, else a 404 error if a language is unknown
+    '''
+    script = prism_bundle(languages)
+    if script is None:
+        abort(404)
+
+    response = current_app.response_class(script, mimetype='application/javascript')
+    response.set_etag(hashlib.sha256(script.encode('utf-8')).hexdigest())
+    response.cache_control.public = True
+    response.cache_control.max_age = 24 * 60 * 60
 
-    return render_template('flashcards.html', nav_id="flashcard-page", flashcards=flashcards, categories=categories)
\ No newline at end of file
+    return response.make_conditional(request)
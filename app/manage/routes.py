@@ -1,13 +1,18 @@
-from flask import render_template, url_for, redirect, request, flash, jsonify, send_from_directory
+from flask import render_template, url_for, redirect, request, flash, jsonify, send_from_directory, current_app, abort, make_response
+from werkzeug.security import safe_join
 from os import path
+import mimetypes, os, time, uuid
 
 from app.manage import bp
-from app.extensions import db
-from app.utils import LOGGER
+from app.extensions import db, deck_cache, page_cache
+from app.fragments import fragment_stats
+from app.utils import LOGGER, DATA_FOLDER, get_page_args, nearest_image, is_final_image, image_etag, verify_file, not_modified, set_validators
 
 from app.forms.flashcard_form import FlashcardForm
 from app.forms.search_form import SearchForm
-from app.models.flashcard_model import FlashcardModel, view_all_cards, view_all_categories
+from app.models.flashcard_model import FlashcardModel, get_flashcard, view_cards_page, view_all_categories
+from app.models.job_model import JobModel, enqueue
+from app.models.category_model import get_deck_versions
 
 PATH = path.dirname(path.abspath(__file__))
 IMAGE_FOLDER = path.join(PATH, "../uploads/images")
@@ -16,24 +21,53 @@ IMAGE_FOLDER = path.join(PATH, "../uploads/images")
 @bp.route("/", methods=['GET', 'POST'])
 def index():
     '''
-    Builds and returns an html page where all the flashcard data can be viewed and edited.
+    Builds and returns an html page where all the flashcard data can be viewed and edited. Pages requested with
+    GET carry an ETag built from the deck versions, so unchanged pages are answered with a 304 before any card
+    is read.
 
-    Parameter(s): None
+    Parameter(s):
+        search (str, query string): the category being searched when paging through results
+        after (str, query string): cursor of the page being viewed, starts at the first card if missing
+        limit (int, query string): the number of flashcards in the page
 
     Output(s):
-        a built html page that displays the flashcard data
+        a built html page that displays the flashcard data, else a 304 response if the client's copy is current
     '''
     try:
+        after, limit = get_page_args(request, current_app.config['CARDS_PER_PAGE'], current_app.config['MAX_CARDS_PER_PAGE'])
+
         form = SearchForm(request.form)
         if form.validate_on_submit(): 
-            flashcards = view_all_cards(category=form.search.data)
+            category = form.search.data
+            # A new search starts on the first page
+            after = None
         else:
-            # Query database for all questions
-            flashcards = view_all_cards(category=None)
-
-        categories = view_all_categories()
+            # Query database for all questions unless paging through a search
+            category = request.args.get('search', default=None, type=str) or None
+
+        etag = None
+        category_version, deck_version, _ = get_deck_versions(category)
+        if request.method == 'GET':
+            # The page holds CSRF tokens, a new page is built before the tokens of a cached one expire. Without a
+            # Last-Modified date only the ETag can revalidate the page.
+            time_limit = current_app.config.get('WTF_CSRF_TIME_LIMIT', 3600)
+            window = int(time.time() // (time_limit / 2)) if time_limit else 0
+            etag = f"manage-{category_version}-{deck_version}-{window}"
+
+            cached = not_modified(request, etag, weak=True, private=True)
+            if cached:
+                return cached
+
+        page = view_cards_page(category=category, after=after, limit=limit, version=category_version)
+        next_page = url_for('manage.index', search=category, after=page['next'], limit=limit) if page['next'] else None
+
+        categories = view_all_categories(version=deck_version)
         form = SearchForm(request.form)
-        return render_template('./manage/manage_flashcards.html', nav_id="manage-page", flashcards=flashcards, categories=categories, form=form)
+        response = make_response(render_template('./manage/manage_flashcards.html', nav_id="manage-page", flashcards=page['flashcards'], categories=categories, form=form, next_page=next_page))
+
+        if etag:
+            set_validators(response, etag, weak=True, private=True)
+        return response
     
     except Exception as e:
         LOGGER.error(f"Failed to load manage flashcard page: {e}")
@@ -115,7 +149,7 @@ def view_flashcard(id):
     '''
     try:
         # Query database for flashcard data
-        flashcard = FlashcardModel.query.get(id)
+        flashcard = get_flashcard(id)
 
         if not flashcard:
             LOGGER.error(f"Flashcard {id} not found!")
@@ -143,7 +177,7 @@ def edit_flashcard(id):
         a built html page that displays the flashcard data for editing
     '''
     try:
-        flashcard = FlashcardModel.query.get(id)
+        flashcard = get_flashcard(id)
 
         if not flashcard:
             LOGGER.error(f"Flashcard {id} not found!")
@@ -202,7 +236,7 @@ def delete_flashcard(id):
     '''
     try:
         # Query database for flashcard
-        flashcard = FlashcardModel.query.get(id)
+        flashcard = get_flashcard(id)
 
         if not flashcard:
             raise Exception(f"Flashcard {id} not found!")
@@ -218,7 +252,118 @@ def delete_flashcard(id):
     
     return redirect(url_for('manage.index'))
 
+# ==============================================================================================================
+@bp.route("/import_flashcards", methods=['POST'])
+def import_flashcards():
+    '''
+    Saves an uploaded JSON file and queues it to be imported by the worker, so large imports do not hold up the
+    request
+
+    Parameter(s):
+        file (file, form data): the JSON file in the import format
+
+    Output(s):
+        None, redirects to the manage page
+    '''
+    try:
+        file = request.files.get('file')
+
+        if not file or not verify_file(file.filename):
+            raise Exception("A JSON file is required!")
+
+        # Save under a unique name, the worker removes the file once it is imported
+        folder = path.join(DATA_FOLDER, 'imports')
+        os.makedirs(folder, exist_ok=True)
+        filename = path.join(folder, f"{uuid.uuid4().hex}.json")
+        file.save(filename)
+
+        job = enqueue('import_json', {'filename': filename, 'remove': True})
+
+        LOGGER.info(f"Queued import of {file.filename} as job {job.id}")
+        flash(f"Import of {file.filename} was queued as job {job.id}!", "success")
+
+    except Exception as e:
+        LOGGER.error(f"An error occurred when queueing the import: {e}")
+        flash("Failed to queue the import!", "error")
+
+    return redirect(url_for('manage.index'))
+
+# ==============================================================================================================
+@bp.route("/jobs/<int:id>")
+def job_status(id):
+    '''
+    Gets the state of a background job
+
+    Parameter(s):
+        id (int): the primary key of the job
+
+    Output(s):
+        a json object with the job state, else a 404 error
+    '''
+    job = db.session.get(JobModel, id)
+
+    if job is None:
+        return jsonify(error=f"Job {id} not found!"), 404
+
+    return jsonify(job.view())
+
+# ==============================================================================================================
+@bp.route("/cache_stats")
+def cache_stats():
+    '''
+    Gets the counters of the in-process caches for monitoring
+
+    Parameter(s): None
+
+    Output(s):
+        a json object with the counters of the deck query, card fragment, and page caches
+    '''
+    return jsonify(deck_cache=deck_cache.stats(), fragment_cache=fragment_stats(), page_cache=page_cache.stats())
+
 # ==============================================================================================================
 @bp.route('/get_image/<filename>')
 def get_image(filename):
-    return send_from_directory(IMAGE_FOLDER, filename)
\ No newline at end of file
+    '''
+    Serves an uploaded image, or the nearest resized copy if a width is requested. Images stored under their
+    content hash never change, so they are cached as immutable with a strong ETag. While the copy for the
+    requested width is not created yet, the fallback is only cached for IMAGE_FALLBACK_MAX_AGE so browsers
+    fetch the copy once it exists. Conditional and range requests are answered by send_from_directory, or by 
+    the proxy when IMAGE_ACCEL_REDIRECT or USE_X_SENDFILE is configured.
+
+    Parameter(s):
+        filename (str): the filename of the image
+        w (int, query string): the width the image is displayed at
+
+    Output(s):
+        the image file
+    '''
+    width = request.args.get('w', default=None, type=int)
+    image = nearest_image(filename, width)
+    etag = image_etag(image)
+    final = bool(etag) and is_final_image(filename, width, image)
+
+    max_age = None
+    if etag:
+        max_age = current_app.config['IMAGE_CACHE_MAX_AGE'] if final else current_app.config['IMAGE_FALLBACK_MAX_AGE']
+    accel_redirect = current_app.config.get('IMAGE_ACCEL_REDIRECT')
+
+    if accel_redirect:
+        # nginx reads the file from its internal location, only the headers are built here
+        file_path = safe_join(IMAGE_FOLDER, image)
+        if file_path is None or not path.isfile(file_path):
+            abort(404)
+
+        response = current_app.response_class(mimetype=mimetypes.guess_type(image)[0] or 'application/octet-stream')
+        response.headers['X-Accel-Redirect'] = accel_redirect.rstrip('/') + '/' + image
+        if etag:
+            response.set_etag(etag)
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+        response.make_conditional(request)
+    else:
+        response = send_from_directory(IMAGE_FOLDER, image, etag=etag or True, max_age=max_age)
+
+    if final:
+        response.cache_control.immutable = True
+
+    return response
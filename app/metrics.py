@@ -0,0 +1,277 @@
+'''
+Request, SQL, template, and cache metrics served at /metrics in the Prometheus text format
+
+Requests are timed by before_request and after_request hooks, statements by the cursor events of the database
+engine, and templates by the Flask template signals. Counters are kept in process, so every worker process
+serves its own metrics and Prometheus adds them up across the targets it scrapes.
+'''
+import threading, time
+from flask import g, request, has_request_context, before_render_template, template_rendered
+from sqlalchemy import event
+
+# Upper bounds of the latency buckets in seconds
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# Upper bounds of the statements per request buckets
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+def escape_label(value):
+    '''
+    Escapes a label value for the Prometheus text format
+    '''
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def format_labels(names:tuple, values:tuple, extra:str=''):
+    '''
+    Formats label names and values as {name="value",...}
+    '''
+    labels = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        labels.append(extra)
+    return '{' + ','.join(labels) + '}' if labels else ''
+
+# ==============================================================================================================
+class Counter:
+    '''
+    Creates a thread-safe counter with labels
+    '''
+    def __init__(self, name:str, help:str, labels:tuple=()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.values = {}
+        self.lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    def inc(self, *labels, amount:float=1):
+        '''
+        Adds the amount to the counter of the label values
+        '''
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    # ------------------------------------------------------------
+    def collect(self):
+        '''
+        Formats the counter in the Prometheus text format
+
+        Output(s):
+            lines (list): the lines of the counter
+        '''
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            for labels, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{format_labels(self.labels, labels)} {value:g}")
+        return lines
+
+# ==============================================================================================================
+class Histogram:
+    '''
+    Creates a thread-safe histogram with labels, observations are counted in cumulative buckets
+    '''
+    def __init__(self, name:str, help:str, labels:tuple=(), buckets:tuple=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self.values = {}
+        self.lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    def observe(self, value:float, *labels):
+        '''
+        Records an observation for the label values
+        '''
+        with self.lock:
+            counts = self.values.get(labels)
+            if counts is None:
+                # One count per bucket, then the sum and the total count
+                counts = self.values[labels] = [0] * len(self.buckets) + [0.0, 0]
+
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[-2] += value
+            counts[-1] += 1
+
+    # ------------------------------------------------------------
+    def collect(self):
+        '''
+        Formats the histogram in the Prometheus text format
+
+        Output(s):
+            lines (list): the lines of the histogram
+        '''
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            for labels, counts in sorted(self.values.items()):
+                for bound, count in zip(self.buckets, counts):
+                    le = 'le="%g"' % bound
+                    lines.append(f"{self.name}_bucket{format_labels(self.labels, labels, le)} {count}")
+                le = 'le="+Inf"'
+                lines.append(f"{self.name}_bucket{format_labels(self.labels, labels, le)} {counts[-1]}")
+                lines.append(f"{self.name}_sum{format_labels(self.labels, labels)} {counts[-2]:g}")
+                lines.append(f"{self.name}_count{format_labels(self.labels, labels)} {counts[-1]}")
+        return lines
+
+# ==============================================================================================================
+# Metrics
+# ==============================================================================================================
+REQUESTS = Counter('flashcards_requests_total', 'Requests handled', ('endpoint', 'method', 'status'))
+REQUEST_LATENCY = Histogram('flashcards_request_duration_seconds', 'Time spent handling a request', ('endpoint', 'method'))
+REQUEST_STATEMENTS = Histogram(
+    'flashcards_request_sql_statements', 'SQL statements executed per request', ('endpoint',), STATEMENT_BUCKETS
+)
+SQL_STATEMENTS = Counter('flashcards_sql_statements_total', 'SQL statements executed', ('endpoint',))
+SQL_SECONDS = Counter('flashcards_sql_seconds_total', 'Time spent executing SQL statements', ('endpoint',))
+TEMPLATE_LATENCY = Histogram('flashcards_template_render_seconds', 'Time spent rendering a template', ('template',))
+
+METRICS = [REQUESTS, REQUEST_LATENCY, REQUEST_STATEMENTS, SQL_STATEMENTS, SQL_SECONDS, TEMPLATE_LATENCY]
+
+def endpoint():
+    '''
+    Gets the endpoint label of the current request, statements run outside of a request are labeled 'background'
+    '''
+    if not has_request_context():
+        return 'background'
+    return request.endpoint or 'unmatched'
+
+# ==============================================================================================================
+# Hooks
+# ==============================================================================================================
+def before_request():
+    g.metrics_start = time.perf_counter()
+    g.metrics_statements = 0
+
+# --------------------------------------------------------------------------------------------------------------
+def after_request(response):
+    start = g.pop('metrics_start', None)
+    if start is None:
+        return response
+
+    name = endpoint()
+    REQUESTS.inc(name, request.method, response.status_code)
+    REQUEST_LATENCY.observe(time.perf_counter() - start, name, request.method)
+    REQUEST_STATEMENTS.observe(g.pop('metrics_statements', 0), name)
+
+    return response
+
+# --------------------------------------------------------------------------------------------------------------
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('metrics_start', []).append(time.perf_counter())
+
+# --------------------------------------------------------------------------------------------------------------
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('metrics_start')
+    if not starts:
+        return
+
+    name = endpoint()
+    SQL_STATEMENTS.inc(name)
+    SQL_SECONDS.inc(name, amount=time.perf_counter() - starts.pop())
+
+    if has_request_context() and 'metrics_statements' in g:
+        g.metrics_statements += 1
+
+# --------------------------------------------------------------------------------------------------------------
+def handle_error(context):
+    # Failed statements never reach after_cursor_execute
+    starts = context.connection.info.get('metrics_start') if context.connection is not None else None
+    if starts:
+        starts.pop()
+
+# --------------------------------------------------------------------------------------------------------------
+def before_render(sender, template, context, **extra):
+    # Templates render inside each other, so the start times are kept as a stack
+    g.setdefault('metrics_templates', []).append(time.perf_counter())
+
+# --------------------------------------------------------------------------------------------------------------
+def after_render(sender, template, context, **extra):
+    starts = g.get('metrics_templates')
+    if starts:
+        TEMPLATE_LATENCY.observe(time.perf_counter() - starts.pop(), template.name or 'string')
+
+# ==============================================================================================================
+def hit_count(stats:dict):
+    '''
+    Gets the lookups of a cache that did not build or load the entry, including stale and coalesced page lookups
+    '''
+    return stats['hits'] + stats.get('stale_hits', 0) + stats.get('coalesced', 0)
+
+# --------------------------------------------------------------------------------------------------------------
+def collect_caches():
+    '''
+    Formats the counters of the in-process caches in the Prometheus text format
+
+    Output(s):
+        lines (list): the lines of the cache metrics
+    '''
+    # Imported here since the fragment module renders templates of the app
+    from app.extensions import deck_cache, page_cache
+    from app.fragments import fragment_stats
+
+    caches = {'deck': deck_cache.stats(), 'fragment': fragment_stats(), 'page': page_cache.stats()}
+    metrics = [
+        ('flashcards_cache_hits_total', 'counter', 'Cache lookups that found a valid entry', hit_count),
+        ('flashcards_cache_misses_total', 'counter', 'Cache lookups that built or loaded the entry', lambda s: s['misses']),
+        ('flashcards_cache_evictions_total', 'counter', 'Entries evicted to stay within the cache size', lambda s: s['evictions']),
+        ('flashcards_cache_entries', 'gauge', 'Entries in the cache', lambda s: s['size']),
+        ('flashcards_cache_hit_ratio', 'gauge', 'Share of cache lookups that found a valid entry',
+            lambda s: hit_count(s) / (hit_count(s) + s['misses']) if hit_count(s) + s['misses'] else 0),
+    ]
+
+    lines = []
+    for name, kind, help, value in metrics:
+        lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+        for cache, stats in caches.items():
+            lines.append(f'{name}{{cache="{cache}"}} {value(stats):g}')
+
+    lines += [
+        "# HELP flashcards_fragment_render_seconds_total Time spent rendering card fragments on cache misses",
+        "# TYPE flashcards_fragment_render_seconds_total counter",
+        f"flashcards_fragment_render_seconds_total {caches['fragment']['render_seconds']:g}",
+    ]
+    return lines
+
+# --------------------------------------------------------------------------------------------------------------
+def render_metrics():
+    '''
+    Formats every metric in the Prometheus text format
+
+    Output(s):
+        str: the metrics page
+    '''
+    lines = []
+    for metric in METRICS:
+        lines += metric.collect()
+    lines += collect_caches()
+
+    return '\n'.join(lines) + '\n'
+
+# --------------------------------------------------------------------------------------------------------------
+def init_metrics(app, engine):
+    '''
+    Adds the request, template, and SQL hooks and the /metrics route to the application
+
+    Parameter(s):
+        app (Flask): the flask application
+        engine (Engine): the database engine of the application
+
+    Output(s): None
+    '''
+    app.before_request(before_request)
+    app.after_request(after_request)
+
+    before_render_template.connect(before_render, app)
+    template_rendered.connect(after_render, app)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+    event.listen(engine, 'handle_error', handle_error)
+
+    def metrics():
+        '''
+        Serves the metrics of this process in the Prometheus text format
+        '''
+        return app.response_class(render_metrics(), mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule('/metrics', 'metrics', metrics)
@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+from sqlalchemy import update
+from sqlalchemy.dialects.sqlite import insert
+
+from app.extensions import db
+
+# Scope of the version shared by every category
+GLOBAL_SCOPE = ''
+
+class CategoryModel(db.Model):
+    '''
+    Model for flashcard categories and the number of flashcards in them
+    '''
+    __tablename__ = "categories"
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False, unique=True, index=True)
+    card_count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __init__(self, name:str, card_count:int=0):
+        '''
+        Initializes the category, the entry is added to the session but not committed so it is saved in the
+        same transaction as the flashcard that created it
+
+        Parameter(s):
+            name (str): the name of the category
+            card_count (int, default=0): the number of flashcards in the category
+        '''
+        self.name = name
+        self.card_count = card_count
+
+    #-----------------------------------------------------------------------------------------------------------
+    def __repr__(self):
+        return f"Category: {self.name} ({self.card_count})"
+
+# ==============================================================================================================
+class DeckVersionModel(db.Model):
+    '''
+    Model for the version of each category and of the whole deck, bumped by every flashcard write so clients
+    can revalidate cached pages with a single primary key lookup
+    '''
+    __tablename__ = "deck_versions"
+
+    # The category name, or GLOBAL_SCOPE for the version of the whole deck
+    scope = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
+    updated_at = db.Column(db.DateTime, nullable=False)
+
+    #-----------------------------------------------------------------------------------------------------------
+    def __repr__(self):
+        return f"Deck Version: {self.scope or '*'} ({self.version})"
+
+# ==============================================================================================================
+# Functions for maintaining card counts
+# ==============================================================================================================
+def adjust_card_count(name:str, amount:int):
+    '''
+    Adds the amount to the card count of the category, creating the category if it does not exist. The change
+    is only added to the session, it is committed with the flashcard write that caused it.
+
+    Parameter(s):
+        name (str): the name of the category
+        amount (int): the number of cards being added (positive) or removed (negative)
+
+    Output(s): None
+    '''
+    category = CategoryModel.query.filter_by(name=name).one_or_none()
+
+    if category is None:
+        db.session.add(CategoryModel(name=name, card_count=max(amount, 0)))
+    else:
+        # Increment in SQL so concurrent writers do not overwrite each other's counts
+        category.card_count = CategoryModel.card_count + amount
+
+# ==============================================================================================================
+# Functions for maintaining deck versions
+# ==============================================================================================================
+def bump_deck_versions(*categories:str):
+    '''
+    Increments the version of the categories and of the whole deck. The change is only added to the session, it
+    is committed with the write that caused it.
+
+    Parameter(s):
+        categories (str): the categories that changed, bumps every category if none are given
+
+    Output(s): None
+    '''
+    # Second resolution, the precision of Last-Modified
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+    if not categories:
+        db.session.execute(update(DeckVersionModel).values(version=DeckVersionModel.version + 1, updated_at=now))
+        db.session.execute(
+            insert(DeckVersionModel).values(scope=GLOBAL_SCOPE, version=1, updated_at=now)
+            .on_conflict_do_nothing(index_elements=['scope'])
+        )
+        return
+
+    # Upsert so concurrent writers never collide on the first version of a category
+    for scope in {*categories, GLOBAL_SCOPE}:
+        db.session.execute(
+            insert(DeckVersionModel).values(scope=scope, version=1, updated_at=now)
+            .on_conflict_do_update(index_elements=['scope'], set_={'version': DeckVersionModel.version + 1, 'updated_at': now})
+        )
+
+# --------------------------------------------------------------------------------------------------------------
+def get_deck_versions(category:str=None):
+    '''
+    Fetches the versions of a category and of the whole deck in one primary key lookup
+
+    Parameter(s):
+        category (str, default=None): the category, only the deck version is fetched if None
+
+    Output(s):
+        a tuple containing the category version, the deck version, and the time of the latest change. Versions 
+        of categories that were never written are 0 and the time is None if the deck was never written.
+    '''
+    scopes = [GLOBAL_SCOPE] if category is None else [category, GLOBAL_SCOPE]
+    rows = {row.scope: row for row in db.session.execute(
+        db.select(DeckVersionModel.scope, DeckVersionModel.version, DeckVersionModel.updated_at)
+        .where(DeckVersionModel.scope.in_(scopes))
+    )}
+
+    deck = rows.get(GLOBAL_SCOPE)
+    scoped = rows.get(category) if category is not None else deck
+
+    return (
+        scoped.version if scoped else 0,
+        deck.version if deck else 0,
+        deck.updated_at if deck else None
+    )
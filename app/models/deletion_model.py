@@ -0,0 +1,128 @@
+'''
+Deferred removal of stored image files
+
+Figure writes add the images they stop using to the pending_deletions table in the same transaction as the
+write, so a rolled back transaction never removes a file. Once the transaction commits the queue is drained
+in the background, keeping the filesystem work out of the request. Rows left by a crash are drained by
+the next write or by the gc_images command.
+'''
+from datetime import datetime, timezone
+from flask import current_app
+
+from app.extensions import db
+from app.utils import LOGGER, IMAGE_EXECUTOR
+from app.models.job_model import enqueue
+
+class PendingDeletionModel(db.Model):
+    '''
+    Model for image files waiting to be removed
+    '''
+    __tablename__ = "pending_deletions"
+
+    id = db.Column(db.Integer, primary_key=True)
+    filename = db.Column(db.String(200), nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __init__(self, filename:str):
+        '''
+        Initializes the pending deletion, the entry is added to the session but not committed so it is saved in
+        the same transaction as the figure write that released the image
+
+        Parameter(s):
+            filename (str): the filename of the image no longer used by a figure
+        '''
+        self.filename = filename
+
+    #-----------------------------------------------------------------------------------------------------------
+    def __repr__(self):
+        return f"Pending Deletion: {self.filename}"
+
+# ==============================================================================================================
+# Functions for queueing and draining deletions
+# ==============================================================================================================
+def queue_image_deletion(filename:str):
+    '''
+    Queues an image for removal. The change is only added to the session, it is committed with the figure write
+    that caused it.
+
+    Parameter(s):
+        filename (str): the filename of the image no longer used by a figure
+
+    Output(s): None
+    '''
+    db.session.add(PendingDeletionModel(filename=filename))
+
+# --------------------------------------------------------------------------------------------------------------
+def drain_image_deletions(batch_size:int=100, min_age:int=None):
+    '''
+    Removes the queued images that no figure references anymore and clears them from the queue, committing
+    once per batch. Images modified shortly before or after they were queued may be reused by an upload and
+    are kept, gc_images removes them later if the upload never commits.
+
+    Parameter(s):
+        batch_size (int, default=100): the number of queued images handled per transaction
+        min_age (int, default=None): images modified less than this many seconds before they were queued are kept,
+            IMAGE_RELEASE_MIN_AGE if None
+
+    Output(s):
+        count (int): the number of queue entries handled, else raises error
+    '''
+    # Imported here since the flashcard model queues deletions
+    from app.models.flashcard_model import release_image
+
+    if min_age is None:
+        min_age = current_app.config.get('IMAGE_RELEASE_MIN_AGE', 3600)
+
+    count = 0
+
+    while True:
+        try:
+            pending = PendingDeletionModel.query.order_by(PendingDeletionModel.id).limit(batch_size).all()
+            if not pending:
+                break
+
+            for entry in pending:
+                release_image(entry.filename, released_at=entry.created_at, min_age=min_age)
+                db.session.delete(entry)
+
+            db.session.commit()
+            count += len(pending)
+
+        except Exception as e:
+            db.session.rollback()
+            LOGGER.error(f"An error occurred when removing queued images: {e}")
+            raise
+
+    if count:
+        LOGGER.info(f"Successfully handled {count} queued image deletions")
+    return count
+
+# --------------------------------------------------------------------------------------------------------------
+def schedule_image_deletions():
+    '''
+    Drains the deletion queue after a commit. With BACKGROUND_JOBS enabled a job is queued for the worker 
+    process, else the queue is drained by a thread of this process unless DELETE_FILES_ASYNC is disabled.
+
+    Parameter(s): None
+
+    Output(s):
+        the queued job, a future of the number of handled entries if run in a thread, else the number of 
+        handled entries
+    '''
+    app = current_app._get_current_object()
+
+    if app.config.get('BACKGROUND_JOBS'):
+        return enqueue('drain_image_deletions')
+
+    if not app.config.get('DELETE_FILES_ASYNC', True):
+        return drain_image_deletions()
+
+    def drain():
+        with app.app_context():
+            try:
+                return drain_image_deletions()
+            except Exception:
+                # Entries stay queued and are retried by the next drain
+                return 0
+
+    return IMAGE_EXECUTOR.submit(drain)
@@ -1,6 +1,17 @@
-from app.extensions import db
-from app.utils import LOGGER, save_image_file, remove_image
-from sqlalchemy import func
+from app.extensions import db, deck_cache, fragment_cache
+from app.models.category_model import CategoryModel, adjust_card_count, bump_deck_versions, get_deck_versions
+from app.models.search_model import index_flashcard, index_flashcards, remove_flashcard
+from app.models.deletion_model import queue_image_deletion, schedule_image_deletions
+from app.fragments import drop_card_fragments
+from app.profiling import profiling
+from app.importer import normalize_card, content_hash
+from app.utils import LOGGER, save_image_file, remove_image, encode_cursor, decode_cursor, scan_images, scan_orphaned_variants, image_exists, image_modified, highlight_code
+from sqlalchemy import func, tuple_, insert, select, update, or_
+from sqlalchemy.orm import joinedload, aliased
+from collections import Counter
+from datetime import datetime, timezone
+from itertools import islice
+from uuid import uuid4
 
 class FigureModel(db.Model):
     '''
@@ -11,7 +22,10 @@ class FigureModel(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     code_type = db.Column(db.String(25), nullable=True)
     code_example = db.Column(db.Text, nullable=True)
-    image_example = db.Column(db.String(200), nullable=True)
+    # Images are stored under the hash of their content and shared by every figure referencing the filename
+    image_example = db.Column(db.String(200), nullable=True, index=True)
+    # Code highlighted on the server when the figure is written, so pages do not highlight it in the browser
+    code_html = db.Column(db.Text, nullable=True)
 
     def __init__(self, code_type:str=None, code_example:str=None, image_example:str=None):
         '''
@@ -33,6 +47,7 @@ class FigureModel(db.Model):
             
             self.code_type = code_type
             self.code_example = code_example
+            self.code_html = highlight_code(code_example, code_type)
 
             # Save the image if there is one
             if image_example:
@@ -66,6 +81,8 @@ class FigureModel(db.Model):
             Nothing if the figure is successfully updated, else raises error
         '''
         try:
+            old_image = self.image_example
+
             # Check if there are valid figure inputs
             if not (code_type and code_example or image_example):
                 raise Exception("Missing figure inputs!")
@@ -76,10 +93,8 @@ class FigureModel(db.Model):
             if code_type and code_example:
                 self.code_type = code_type
                 self.code_example = code_example
-
-                if self.image_example:
-                    remove_image(self.image_example)
-                    self.image_example
+                self.code_html = highlight_code(code_example, code_type)
+                self.image_example = None
             
             # Update image example if there is a new images
             if image_example and not isinstance(image_example, str):
@@ -87,19 +102,34 @@ class FigureModel(db.Model):
                 # Check if a filename is returned
                 if not file: 
                     raise Exception("Failed to save file!")
-                if self.image_example:
-                    remove_image(self.image_example)
                 
                 self.image_example = file
                 self.code_type = None
                 self.code_example = None
+                self.code_html = None
             # Check if the image example is the old image
             elif image_example and isinstance(image_example, str):
                 if self.image_example != image_example:
                     raise Exception("Invalid image filename!")
 
+            # Remove the replaced image once the change is committed
+            released = old_image and old_image != self.image_example
+            if released:
+                queue_image_deletion(old_image)
+
+            categories = figure_categories(self.id)
+            if categories:
+                bump_deck_versions(*categories)
+
             db.session.flush()
             db.session.commit()
+            # Figures not used by a card are not part of any cached query
+            if categories:
+                invalidate_deck_cache(*categories)
+
+            if released:
+                schedule_image_deletions()
+
             LOGGER.info(f"Successfully updated figure {self.id}")
 
         except Exception as e:
@@ -107,22 +137,39 @@ class FigureModel(db.Model):
             LOGGER.error(f"An error occurred when updating figure {self.id} : {e}")
             raise
     #-----------------------------------------------------------------------------------------------------------
-    def delete(self):
+    def delete(self, commit:bool=True):
         '''
-        Deletes the figure data from the database
+        Deletes the figure data from the database, its image is queued for removal once the delete is committed
 
-        Parameter(s): None
+        Parameter(s):
+            commit (bool, default=True): commits the delete, else only adds it to the session so it is committed
+                with the flashcard write that caused it
 
         Output(s):
             Nothing if the data is successfully deleted, else raises error
         '''
         try:
-            if self.image_example:
-                remove_image(self.image_example)
+            image = self.image_example
 
             db.session.delete(self)
+            if image:
+                queue_image_deletion(image)
+
+            if not commit:
+                return
+
+            categories = figure_categories(self.id)
+            if categories:
+                bump_deck_versions(*categories)
+
             db.session.flush()
             db.session.commit()
+            # Figures not used by a card are not part of any cached query
+            if categories:
+                invalidate_deck_cache(*categories)
+
+            if image:
+                schedule_image_deletions()
 
             LOGGER.info(f"Successfully Deleted figure {self.id} from the database!")
 
@@ -137,13 +184,26 @@ class FlashcardModel(db.Model):
     Model for flashcards
     '''
     __tablename__ = "flashcards"
+    __table_args__ = (
+        # Supports the (category, id) keyset used for paginating cards
+        db.Index('ix_flashcards_category_id', 'category', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    category = db.Column(db.String(100), nullable=False)
+    category = db.Column(db.String(100), db.ForeignKey('categories.name'), nullable=False)
     question = db.Column(db.Text, nullable=True)
     answer = db.Column(db.Text, nullable=True)
-    q_figure = db.Column(db.Integer, nullable=True)
-    a_figure = db.Column(db.Integer, nullable=True)
+    q_figure = db.Column(db.Integer, db.ForeignKey('figures.id'), nullable=True)
+    a_figure = db.Column(db.Integer, db.ForeignKey('figures.id'), nullable=True)
+    # Identifies a card across exports and imports so re-imports update it instead of adding a duplicate.
+    # Imported cards keep the key of the file, cards added in the app are given a random key.
+    external_key = db.Column(db.String(100), nullable=True, unique=True, index=True)
+    content_hash = db.Column(db.String(64), nullable=True)
+    # Bumped by every update and returned by the api, fragments are keyed on a digest of the card data instead
+    version = db.Column(db.Integer, nullable=False, default=1)
+
+    question_figure = db.relationship('FigureModel', foreign_keys=[q_figure])
+    answer_figure = db.relationship('FigureModel', foreign_keys=[a_figure])
 
     def __init__(
         self, 
@@ -212,10 +272,17 @@ class FlashcardModel(db.Model):
             self.category = category
             self.question = question
             self.answer = answer
+            self.external_key = uuid4().hex
+            self.version = 1
+
+            adjust_card_count(category, 1)
+            bump_deck_versions(category)
 
             db.session.add(self)
             db.session.flush()
+            index_flashcard(self.id, question, answer, [self.q_figure, self.a_figure])
             db.session.commit()
+            invalidate_deck_cache(category)
             LOGGER.info(f"Successfully created flashcard: {self.id}")
 
         except Exception as e:
@@ -234,34 +301,38 @@ class FlashcardModel(db.Model):
 
             response = {
                 'id':int, 
+                'version':int,
                 'category':str, 
                 'question':str, 
                 'answer':str, 
                 'q_code_type':str,
                 'q_code_example':str,
+                'q_code_html':str,
                 'q_image_example':str,
                 'a_code_type':str,
                 'a_code_example':str,
+                'a_code_html':str,
                 'a_image_example':str
             }
         '''
         try:
-            response = {}
-
-            # Get flashcard figures if there are any
-            q_figure = FigureModel.query.get(self.q_figure) if self.q_figure else None
-            a_figure = FigureModel.query.get(self.a_figure) if self.a_figure else None
+            # Figures are read through the relationships, load the card with get_flashcard() to avoid extra queries
+            q_figure = self.question_figure
+            a_figure = self.answer_figure
 
             response = {
                 'id': self.id,
+                'version': self.version,
                 'category': self.category,
                 'question': self.question,
                 'answer': self.answer,
                 'q_code_type': q_figure.code_type if q_figure else None,
                 'q_code_example': q_figure.code_example if q_figure else None,
+                'q_code_html': q_figure.code_html if q_figure else None,
                 'q_image_example': q_figure.image_example if q_figure else None,
                 'a_code_type': a_figure.code_type if a_figure else None,
                 'a_code_example': a_figure.code_example if a_figure else None,
+                'a_code_html': a_figure.code_html if a_figure else None,
                 'a_image_example': a_figure.image_example if a_figure else None
             }
 
@@ -302,13 +373,21 @@ class FlashcardModel(db.Model):
             Nothing if the flashcard is successfully updated, else raises error
         '''
         try:
+            old_category = self.category
+
+            # Move the card between category counts along with the category change
+            if category != self.category:
+                adjust_card_count(self.category, -1)
+                adjust_card_count(category, 1)
+
             self.category = category
             self.question = question
             self.answer = answer
+            self.version = (self.version or 0) + 1
 
             # Update question figure if there is one
             if self.q_figure:
-                figure = FigureModel.query.get(self.q_figure)
+                figure = self.question_figure
 
                 # Check if there are figure inputs for question, if not delete the figure
                 if not (q_code_type or q_code_example or q_image_example):
@@ -328,7 +407,7 @@ class FlashcardModel(db.Model):
 
             # Update answer figure if there is one
             if self.a_figure:
-                figure = FigureModel.query.get(self.a_figure)
+                figure = self.answer_figure
                 
                 # Check if there are figure inputs for answer, if not delete the figure
                 if not (a_code_type or a_code_example or a_image_example):
@@ -346,8 +425,12 @@ class FlashcardModel(db.Model):
                 
                 self.a_figure = a_figure.id
 
+            bump_deck_versions(old_category, category)
+
             db.session.flush()
+            index_flashcard(self.id, question, answer, [self.q_figure, self.a_figure])
             db.session.commit()
+            invalidate_deck_cache(old_category, category)
             LOGGER.info(f"Successfully updated flashcard ID: {self.id}")
 
         except Exception as e:
@@ -365,16 +448,25 @@ class FlashcardModel(db.Model):
             Nothing if the flashcard is successfully deleted, else raises error
         '''
         try:
-            if self.q_figure:
-                figure = FigureModel.query.get(self.q_figure)
-                figure.delete()
-            if self.a_figure:
-                figure = FigureModel.query.get(self.a_figure)
-                figure.delete()
+            # The card, its figures, and the queued image removals are committed in one transaction
+            figures = [figure for figure in (self.question_figure, self.answer_figure) if figure]
+            released = any(figure.image_example for figure in figures)
+            for figure in figures:
+                figure.delete(commit=False)
+
+            adjust_card_count(self.category, -1)
+            bump_deck_versions(self.category)
+
+            remove_flashcard(self.id)
 
             db.session.delete(self)
             db.session.flush()
             db.session.commit()
+            invalidate_deck_cache(self.category)
+            drop_card_fragments(self.id)
+
+            if released:
+                schedule_image_deletions()
 
             LOGGER.info(f"Successfully deleted flashcard {self.id} from the database!")
 
@@ -383,6 +475,177 @@ class FlashcardModel(db.Model):
             LOGGER.error(f"An error occurred when deleting flashcard {self.id} from the database: {e}")
             raise
     #-----------------------------------------------------------------------------------------------------------
+    @classmethod
+    def bulk_create(cls, cards, batch_size:int=1000, progress=None):
+        '''
+        Inserts many flashcards and their code figures with one multi-row insert per table and one commit per 
+        batch, instead of the up to three commits per card made by the constructor. Image figures are not 
+        supported since they require an uploaded file.
+
+        Parameter(s):
+            cards (iterable): dictionaries with the constructor inputs (category, question, answer, q_code_type,
+                q_code_example, a_code_type, a_code_example), can be a generator
+            batch_size (int, default=1000): the number of flashcards written per transaction
+            progress (callable, default=None): called with the number of inserted flashcards after each batch
+
+        Output(s):
+            count (int): the number of flashcards inserted, else raises error. Batches committed before an
+                error are kept.
+        '''
+        count = 0
+        cards = iter(cards)
+
+        while True:
+            batch = list(islice(cards, batch_size))
+            if not batch:
+                break
+
+            try:
+                cls._insert_batch(batch)
+                db.session.commit()
+
+            except Exception as e:
+                db.session.rollback()
+                LOGGER.error(f"An error occurred when bulk inserting flashcards {count} to {count + len(batch)}: {e}")
+                raise
+
+            invalidate_deck_cache(*{card['category'] for card in batch})
+            count += len(batch)
+            LOGGER.info(f"Successfully bulk inserted {count} flashcards")
+
+            if progress:
+                progress(count)
+
+        return count
+    #-----------------------------------------------------------------------------------------------------------
+    @classmethod
+    def bulk_upsert(cls, cards, batch_size:int=1000):
+        '''
+        Synchronizes flashcards with an import keyed on their external key. Cards with a new key (or no key) are 
+        bulk inserted, cards whose content hash changed are updated, and unchanged cards are not written.
+
+        Parameter(s):
+            cards (iterable): dictionaries with the bulk_create inputs plus the source key and content_hash
+            batch_size (int, default=1000): the number of flashcards looked up and inserted together
+
+        Output(s):
+            response (dict): the number of inserted, updated, and unchanged flashcards, else raises error
+
+            response = {'inserted': int, 'updated': int, 'unchanged': int}
+        '''
+        response = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        cards = iter(cards)
+
+        while True:
+            batch = list(islice(cards, batch_size))
+            if not batch:
+                break
+
+            # Look up the existing cards of the whole batch in one query
+            keys = [str(card['key']) for card in batch if card.get('key') is not None]
+            existing = {}
+            if keys:
+                existing = {key: (id, content_hash) for id, key, content_hash in db.session.query(
+                    cls.id, cls.external_key, cls.content_hash
+                ).filter(cls.external_key.in_(keys)).all()}
+
+            new_cards = []
+            for card in batch:
+                match = existing.get(str(card['key'])) if card.get('key') is not None else None
+
+                if match is None:
+                    new_cards.append(card)
+                elif match[1] == card.get('content_hash'):
+                    response['unchanged'] += 1
+                else:
+                    flashcard = get_flashcard(match[0])
+                    flashcard.content_hash = card.get('content_hash')
+
+                    # Cards added or edited in the app have no stored hash, compare their content instead
+                    if card_hash(flashcard.view()) == card.get('content_hash'):
+                        db.session.commit()
+                        response['unchanged'] += 1
+                        continue
+
+                    flashcard.update(
+                        category=card['category'],
+                        question=card.get('question'),
+                        answer=card.get('answer'),
+                        q_code_type=card.get('q_code_type'),
+                        q_code_example=card.get('q_code_example'),
+                        a_code_type=card.get('a_code_type'),
+                        a_code_example=card.get('a_code_example')
+                    )
+                    response['updated'] += 1
+
+            if new_cards:
+                response['inserted'] += cls.bulk_create(new_cards, batch_size=batch_size)
+
+        LOGGER.info(f"Successfully synchronized flashcards: {response}")
+        return response
+    #-----------------------------------------------------------------------------------------------------------
+    @classmethod
+    def _insert_batch(cls, batch:list):
+        '''
+        Adds a batch of flashcards, their figures, category counts, and search entries to the session
+        '''
+        figures = []
+        for card in batch:
+            # Check the same inputs as the constructor
+            if not card.get('category'):
+                raise Exception("Missing category input!")
+            if not (card.get('question') or (card.get('q_code_type') and card.get('q_code_example'))):
+                raise Exception("No question inputs!")
+            if not (card.get('answer') or (card.get('a_code_type') and card.get('a_code_example'))):
+                raise Exception("No answer inputs!")
+
+            for f in ('q', 'a'):
+                code_type, code_example = card.get(f'{f}_code_type'), card.get(f'{f}_code_example')
+                if code_type or code_example:
+                    if not (code_type and code_example):
+                        raise Exception("Missing figure inputs!")
+                    figures.append({
+                        'code_type': code_type,
+                        'code_example': code_example,
+                        'code_html': highlight_code(code_example, code_type)
+                    })
+
+        # Insert all the figures at once, the ids are returned in the order of the rows
+        figure_ids = iter([])
+        if figures:
+            figure_ids = iter(db.session.execute(
+                insert(FigureModel).returning(FigureModel.id, sort_by_parameter_order=True), figures
+            ).scalars().all())
+
+        rows = []
+        for card in batch:
+            rows.append({
+                'category': card['category'],
+                'question': card.get('question'),
+                'answer': card.get('answer'),
+                'q_figure': next(figure_ids) if card.get('q_code_example') else None,
+                'a_figure': next(figure_ids) if card.get('a_code_example') else None,
+                'external_key': str(card['key']) if card.get('key') is not None else uuid4().hex,
+                'content_hash': card.get('content_hash')
+            })
+
+        counts = Counter(row['category'] for row in rows)
+        for category, amount in counts.items():
+            adjust_card_count(category, amount)
+        bump_deck_versions(*counts)
+        db.session.flush()
+
+        ids = db.session.execute(
+            insert(cls).returning(cls.id, sort_by_parameter_order=True), rows
+        ).scalars().all()
+
+        index_flashcards([{
+            'id': id,
+            'question': card.get('question'),
+            'answer': card.get('answer'),
+            'code': '\n'.join(code for code in (card.get('q_code_example'), card.get('a_code_example')) if code)
+        } for id, card in zip(ids, batch)])
+    #-----------------------------------------------------------------------------------------------------------
     def __repr__(self):
         return (
             f"Category: {self.category}\n"
@@ -395,12 +658,132 @@ class FlashcardModel(db.Model):
 # ==============================================================================================================
 # Functions for performing queries
 # ==============================================================================================================
-def view_all_cards(category:str=None):
+def release_image(filename:str, released_at:datetime=None, min_age:int=3600):
+    '''
+    Removes a stored image if no figure references it anymore. Identical uploads share a file, so the number of
+    figures with the filename is its reference count.
+
+    Parameter(s):
+        filename (str): the filename of the image no longer used by a figure
+        released_at (datetime, default=None): when the image was released. A file modified after it was reused
+            by an upload whose figure may not be committed yet, so it is kept like gc_images --min-age does and
+            left to gc_images if the upload never commits.
+        min_age (int, default=3600): seconds before released_at a modification still counts as a reuse, since an
+            upload can save the file before the image is released and commit its figure after the release
+
+    Output(s):
+        True if the file was removed, else False
+    '''
+    references = FigureModel.query.filter_by(image_example=filename).count()
+
+    if references:
+        LOGGER.info(f"Keeping {filename}, still referenced by {references} figures")
+        return False
+
+    if released_at is not None:
+        # SQLite returns the stored UTC time without its timezone
+        if released_at.tzinfo is None:
+            released_at = released_at.replace(tzinfo=timezone.utc)
+
+        modified = image_modified(filename)
+        if modified is not None and modified > released_at.timestamp() - min_age:
+            LOGGER.info(f"Keeping {filename}, recently reused by an upload")
+            return False
+
+    remove_image(filename)
+    return True
+# ==============================================================================================================
+def figure_categories(id:int):
+    '''
+    Fetches the categories of the flashcards using a figure
+
+    Parameter(s):
+        id (int): the primary key of the figure
+
+    Output(s):
+        categories (list): the names of the categories
+    '''
+    return db.session.scalars(
+        select(FlashcardModel.category).where(or_(FlashcardModel.q_figure == id, FlashcardModel.a_figure == id)).distinct()
+    ).all()
+# ==============================================================================================================
+def invalidate_deck_cache(*categories:str):
+    '''
+    Drops the cached deck queries affected by a write. The queries are keyed on the deck versions, so the old
+    entries would never be read again, dropping them only frees the space before the LRU evicts them. New 
+    figures are not referenced by any card until the card write that uses them, so only figure updates and 
+    deletes need to invalidate.
+
+    Parameter(s):
+        categories (str): the categories that changed, drops every cached query if none are given
+
+    Output(s): None
+    '''
+    if not categories:
+        deck_cache.clear()
+        return
+
+    # The category counts and the unfiltered listings change along with any category
+    deck_cache.drop_if(lambda key: key[0] == 'categories' or key[1] is None or key[1] in categories)
+# ==============================================================================================================
+def query_with_figures():
+    '''
+    Builds a flashcard query that loads the question and answer figures in the same statement
+
+    Parameter(s): None
+
+    Output(s):
+        a flashcard query with the figure relationships eagerly joined
+    '''
+    return FlashcardModel.query.options(
+        joinedload(FlashcardModel.question_figure),
+        joinedload(FlashcardModel.answer_figure)
+    )
+# ==============================================================================================================
+def get_flashcard(id:int):
+    '''
+    Fetches a single flashcard and its figures from the database
+
+    Parameter(s):
+        id (int): the primary key of the flashcard being queried
+
+    Output(s):
+        the FlashcardModel with its figures loaded if found, else None
+    '''
+    try:
+        return query_with_figures().filter(FlashcardModel.id == id).one_or_none()
+
+    except Exception as e:
+        LOGGER.error(f"An error occurred when fetching flashcard {id}: {e}")
+        return None
+# ==============================================================================================================
+def card_hash(flashcard:dict):
+    '''
+    Computes the import content hash of a stored flashcard, so it can be compared with the cards of an import
+
+    Parameter(s):
+        flashcard (dict): the flashcard data returned by FlashcardModel.view
+
+    Output(s):
+        the sha256 hex digest computed by the importer for the same content
+    '''
+    return content_hash(normalize_card({
+        'category': flashcard['category'],
+        'question': flashcard['question'],
+        'answer': flashcard['answer'],
+        'q_code_type': flashcard['q_code_type'],
+        'q_code_block': flashcard['q_code_example'],
+        'a_code_type': flashcard['a_code_type'],
+        'a_code_block': flashcard['a_code_example']
+    }))
+# ==============================================================================================================
+def view_all_cards(category:str=None, version:int=None):
     '''
     Fetches flashcards from the database with a matching category
     
     Parameter(s):
         category (str, default=None): the question category the flashcards are being filtered by
+        version (int, default=None): the version of the category (or deck) from get_deck_versions, looked up if None
         
     Output(s):
         Returns a dictionary list of all the related flashcard data, else returns an empty list
@@ -421,32 +804,28 @@ def view_all_cards(category:str=None):
         }, ... ]
     '''
     try:
+        # Serve the deck from the cache between edits. The version is read before the cards and is part of the 
+        # key, so a write by any process is seen by the next read and an older read never replaces a newer one.
+        if version is None:
+            version = get_deck_versions(category)[0]
+
+        key = ('cards', category, version)
+        cached = deck_cache.get(key) if not profiling() else None
+        if cached is not None:
+            return cached
+
+        # Figures are joined into the same statement instead of being fetched per card
+        query = query_with_figures()
+
         # Return the flashcards with the specified category
         if category:
-            flashcards = FlashcardModel.query.filter_by(category=category).all()
+            flashcards = query.filter_by(category=category).all()
         # Return all Flashcards
         else:
-            flashcards = FlashcardModel.query.all()
-
-        response = []
-        for flashcard in flashcards:
-
-            # Get flashcard figures if there are any
-            q_figure = FigureModel.query.get(flashcard.q_figure) if flashcard.q_figure else None
-            a_figure = FigureModel.query.get(flashcard.a_figure) if flashcard.a_figure else None
+            flashcards = query.all()
 
-            response.append({
-                'id': flashcard.id,
-                'category': flashcard.category,
-                'question': flashcard.question,
-                'answer': flashcard.answer,
-                'q_code_type': q_figure.code_type if q_figure else None,
-                'q_code_example': q_figure.code_example if q_figure else None,
-                'q_image_example': q_figure.image_example if q_figure else None,
-                'a_code_type': a_figure.code_type if a_figure else None,
-                'a_code_example': a_figure.code_example if a_figure else None,
-                'a_image_example': a_figure.image_example if a_figure else None
-            })
+        response = [flashcard.view() for flashcard in flashcards]
+        deck_cache.set(key, response)
 
         return response
         
@@ -454,11 +833,71 @@ def view_all_cards(category:str=None):
         LOGGER.error(f"An error occurred when fetching flashcard data: {e}")
         return []
 # ==============================================================================================================
-def view_all_categories():
+def view_cards_page(category:str=None, after:str=None, limit:int=50, version:int=None):
+    '''
+    Fetches a page of flashcards ordered by (category, id) using a keyset cursor instead of an offset, so the
+    cost of a page does not depend on how deep into the deck it is
+
+    Parameter(s):
+        category (str, default=None): the question category the flashcards are being filtered by
+        after (str, default=None): the cursor returned with the previous page, starts at the first card if None
+        limit (int, default=50): the maximum number of flashcards in the page
+        version (int, default=None): the version of the category (or deck) from get_deck_versions, looked up if None
+
+    Output(s):
+        response (dict): the flashcards in the page and the cursor of the next page if there is one
+
+        response = {
+            'flashcards': [{...}, ... ],
+            'next': str or None
+        }
+    '''
+    try:
+        # Serve the page from the cache between edits, keyed on the version like view_all_cards
+        if version is None:
+            version = get_deck_versions(category)[0]
+
+        key = ('page', category, after, limit, version)
+        cached = deck_cache.get(key) if not profiling() else None
+        if cached is not None:
+            return cached
+
+        query = query_with_figures()
+
+        if category:
+            query = query.filter(FlashcardModel.category == category)
+
+        # Continue after the last card of the previous page
+        cursor = decode_cursor(after) if after else None
+        if cursor:
+            query = query.filter(tuple_(FlashcardModel.category, FlashcardModel.id) > tuple_(*cursor))
+
+        # Fetch one extra card to check if there is a next page
+        flashcards = query.order_by(FlashcardModel.category, FlashcardModel.id).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(flashcards) > limit:
+            flashcards = flashcards[:limit]
+            next_cursor = encode_cursor(flashcards[-1].category, flashcards[-1].id)
+
+        response = {
+            'flashcards': [flashcard.view() for flashcard in flashcards],
+            'next': next_cursor
+        }
+        deck_cache.set(key, response)
+
+        return response
+
+    except Exception as e:
+        LOGGER.error(f"An error occurred when fetching a page of flashcard data: {e}")
+        return {'flashcards': [], 'next': None}
+# ==============================================================================================================
+def view_all_categories(version:int=None):
     '''
     Fetches all the categories from the database
     
-    Parameter(s): None
+    Parameter(s):
+        version (int, default=None): the version of the deck from get_deck_versions, looked up if None
     
     Output(s):
         response (dict): a dictionary containing the question category and its count if successful, else an empty list
@@ -466,17 +905,235 @@ def view_all_categories():
         response = {category: count, ... }
     '''
     try:
+        # Keyed on the version like view_all_cards
+        if version is None:
+            version = get_deck_versions()[1]
+
+        key = ('categories', version)
+        cached = deck_cache.get(key) if not profiling() else None
+        if cached is not None:
+            return cached
+
+        # Counts are maintained by the flashcard write methods, so this only reads the categories table
         categories = db.session.query(
-            FlashcardModel.category, 
-            func.count(FlashcardModel.id)
-        ).group_by(FlashcardModel.category).all()
+            CategoryModel.name,
+            CategoryModel.card_count
+        ).filter(CategoryModel.card_count > 0).order_by(CategoryModel.name).all()
 
         response = {}
         for category in categories:
             response[category[0]] = category[1]
 
+        deck_cache.set(key, response)
         return response
 
     except Exception as e:
         LOGGER.error(f"An error occurred when fetching categories from the database: {e}")
-        return {}
\ No newline at end of file
+        return {}
+# ==============================================================================================================
+def rebuild_category_counts():
+    '''
+    Recounts the flashcards in every category from the flashcards table and overwrites the stored card counts
+
+    Parameter(s): None
+
+    Output(s):
+        response (dict): the rebuilt category counts if successful, else raises error
+
+        response = {category: count, ... }
+    '''
+    try:
+        counts = dict(db.session.query(
+            FlashcardModel.category, 
+            func.count(FlashcardModel.id)
+        ).group_by(FlashcardModel.category).all())
+
+        categories = {category.name: category for category in CategoryModel.query.all()}
+
+        # Overwrite the stored counts, categories that no longer have cards drop to zero
+        for name, category in categories.items():
+            category.card_count = counts.get(name, 0)
+
+        # Add categories that are missing from the table
+        for name, count in counts.items():
+            if name not in categories:
+                db.session.add(CategoryModel(name=name, card_count=count))
+
+        bump_deck_versions()
+        db.session.flush()
+        db.session.commit()
+        invalidate_deck_cache()
+        LOGGER.info(f"Successfully rebuilt the counts of {len(counts)} categories")
+
+        return dict(sorted(counts.items()))
+
+    except Exception as e:
+        db.session.rollback()
+        LOGGER.error(f"An error occurred when rebuilding the category counts: {e}")
+        raise
+# ==============================================================================================================
+def rebuild_code_html(batch_size:int=1000):
+    '''
+    Highlights the code of every figure again, used to fill in figures written before server side highlighting
+    or after Pygments is installed or upgraded
+
+    Parameter(s):
+        batch_size (int, default=1000): the number of figures highlighted per transaction
+
+    Output(s):
+        count (int): the number of highlighted figures if successful, else raises error
+    '''
+    try:
+        count, last_id = 0, 0
+
+        while True:
+            figures = FigureModel.query.filter(
+                FigureModel.id > last_id, FigureModel.code_example.isnot(None)
+            ).order_by(FigureModel.id).limit(batch_size).all()
+
+            if not figures:
+                break
+
+            for figure in figures:
+                figure.code_html = highlight_code(figure.code_example, figure.code_type)
+                count += figure.code_html is not None
+
+            last_id = figures[-1].id
+            db.session.commit()
+
+        bump_deck_versions()
+        db.session.commit()
+        invalidate_deck_cache()
+        # The cached html of the cards holds the old highlighting
+        fragment_cache.clear()
+        LOGGER.info(f"Successfully highlighted {count} code figures")
+        return count
+
+    except Exception as e:
+        db.session.rollback()
+        LOGGER.error(f"An error occurred when highlighting the code figures: {e}")
+        raise
+# ==============================================================================================================
+def export_cards(chunk_size:int=1000):
+    '''
+    Streams every flashcard and its figures in the JSON import format. Rows are read with a server side cursor
+    in chunks, so memory use does not grow with the number of flashcards. Cards written before every card was
+    given an external key are given a random one first, so re-importing the export updates them in place.
+
+    Parameter(s):
+        chunk_size (int, default=1000): the number of rows fetched from the database at a time
+
+    Output(s):
+        a generator of dictionaries in the format read by from_json
+
+        {
+            'key':str,
+            'category':str,
+            'question':str,
+            'answer':str,
+            'qid':int,
+            'aid':int,
+            'q_code_block':str,
+            'q_code_type':str,
+            'q_image_file':str,
+            'a_code_block':str,
+            'a_code_type':str,
+            'a_image_file':str
+        }
+    '''
+    db.session.execute(
+        update(FlashcardModel).where(FlashcardModel.external_key.is_(None)).values(
+            external_key=func.lower(func.hex(func.randomblob(16)))
+        )
+    )
+    db.session.commit()
+
+    q_figure = aliased(FigureModel)
+    a_figure = aliased(FigureModel)
+
+    query = select(
+        FlashcardModel.id, FlashcardModel.external_key, FlashcardModel.category, FlashcardModel.question, 
+        FlashcardModel.answer, FlashcardModel.q_figure, FlashcardModel.a_figure,
+        q_figure.code_example, q_figure.code_type, q_figure.image_example,
+        a_figure.code_example, a_figure.code_type, a_figure.image_example
+    ).outerjoin(
+        q_figure, q_figure.id == FlashcardModel.q_figure
+    ).outerjoin(
+        a_figure, a_figure.id == FlashcardModel.a_figure
+    ).order_by(FlashcardModel.id)
+
+    rows = db.session.execute(query.execution_options(stream_results=True, yield_per=chunk_size))
+
+    for row in rows:
+        # The stored key is exported unchanged so the export can be re-imported as an upsert
+        yield {
+            'key': row[1],
+            'category': row[2],
+            'question': row[3],
+            'answer': row[4],
+            'qid': row[5],
+            'aid': row[6],
+            'q_code_block': row[7],
+            'q_code_type': row[8],
+            'q_image_file': row[9],
+            'a_code_block': row[10],
+            'a_code_type': row[11],
+            'a_image_file': row[12]
+        }
+
+# ==============================================================================================================
+# Functions for finding orphaned images
+# ==============================================================================================================
+def find_orphaned_images(batch_size:int=1000, min_age:int=3600):
+    '''
+    Streams the stored files that no figure references. The directory listing is read in batches and each batch
+    is checked against the indexed image_example column, so memory use is bounded by the batch size no matter
+    how many files are stored. Resized copies whose original is gone are included.
+
+    Parameter(s):
+        batch_size (int, default=1000): the number of filenames checked per query
+        min_age (int, default=3600): files modified more recently are skipped, since an upload is saved before 
+            the figure referencing it is committed
+
+    Output(s):
+        a generator of lists of orphaned paths relative to the image directory
+    '''
+    files = scan_images(min_age)
+
+    while True:
+        batch = list(islice(files, batch_size))
+        if not batch:
+            break
+
+        referenced = set(db.session.scalars(
+            select(FigureModel.image_example).where(FigureModel.image_example.in_(batch))
+        ))
+        orphaned = [filename for filename in batch if filename not in referenced]
+        if orphaned:
+            yield orphaned
+
+    variants = scan_orphaned_variants(min_age)
+    while True:
+        batch = list(islice(variants, batch_size))
+        if not batch:
+            break
+        yield batch
+
+# --------------------------------------------------------------------------------------------------------------
+def find_dangling_figures(chunk_size:int=1000):
+    '''
+    Streams the figures whose image file is missing from the image directory
+
+    Parameter(s):
+        chunk_size (int, default=1000): the number of rows fetched from the database at a time
+
+    Output(s):
+        a generator of (figure id, filename) tuples
+    '''
+    query = select(FigureModel.id, FigureModel.image_example).where(
+        FigureModel.image_example.isnot(None)
+    ).order_by(FigureModel.id)
+
+    for row in db.session.execute(query.execution_options(stream_results=True, yield_per=chunk_size)):
+        if not image_exists(row[1]):
+            yield (row[0], row[1])
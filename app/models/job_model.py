@@ -0,0 +1,223 @@
+'''
+Durable background job queue stored in the jobs table
+
+Request handlers enqueue jobs by name with a JSON payload and a worker process started with the worker command
+claims and runs them. A claimed job is hidden from other workers until its visibility timeout passes, so the
+job is retried if the worker running it crashes. Failed jobs are retried with exponential backoff until they
+run out of attempts.
+'''
+import json
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, update, or_, and_
+
+from app.extensions import db
+from app.utils import LOGGER
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+def utcnow():
+    # Naive UTC timestamps, SQLite does not store time zones
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+class JobModel(db.Model):
+    '''
+    Model for background jobs
+    '''
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Supports finding the next job that is ready to run
+        db.Index('ix_jobs_status_run_at', 'status', 'run_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    payload = db.Column(db.Text, nullable=False, default='{}')
+    status = db.Column(db.String(10), nullable=False, default=QUEUED)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=5)
+    run_at = db.Column(db.DateTime, nullable=False, default=utcnow)
+    locked_until = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def __init__(self, name:str, payload:dict=None, delay:int=0, max_attempts:int=5):
+        '''
+        Initializes the job, the entry is added to the session by enqueue
+
+        Parameter(s):
+            name (str): the name the job function is registered under
+            payload (dict, default=None): the keyword arguments of the job function, must be JSON serializable
+            delay (int, default=0): the number of seconds before the job can run
+            max_attempts (int, default=5): the number of times the job is run before it is marked failed
+        '''
+        self.name = name
+        self.payload = json.dumps(payload or {})
+        self.status = QUEUED
+        self.attempts = 0
+        self.max_attempts = max_attempts
+        self.run_at = utcnow() + timedelta(seconds=delay)
+
+    #-----------------------------------------------------------------------------------------------------------
+    def __repr__(self):
+        return f"Job {self.id}: {self.name} ({self.status})"
+
+    #-----------------------------------------------------------------------------------------------------------
+    def view(self):
+        '''
+        Fetches the job data for viewing
+
+        Output(s):
+            response (dict): the job state
+        '''
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'last_error': self.last_error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+# ==============================================================================================================
+# Functions for queueing and claiming jobs
+# ==============================================================================================================
+def enqueue(name:str, payload:dict=None, delay:int=0, max_attempts:int=5, commit:bool=True):
+    '''
+    Adds a job to the queue
+
+    Parameter(s):
+        name (str): the name the job function is registered under
+        payload (dict, default=None): the keyword arguments of the job function, must be JSON serializable
+        delay (int, default=0): the number of seconds before the job can run
+        max_attempts (int, default=5): the number of times the job is run before it is marked failed
+        commit (bool, default=True): commits the job, else only adds it to the session so it is committed with
+            the write that caused it
+
+    Output(s):
+        job (JobModel): the queued job, else raises error
+    '''
+    try:
+        job = JobModel(name=name, payload=payload, delay=delay, max_attempts=max_attempts)
+        db.session.add(job)
+
+        if commit:
+            db.session.commit()
+            LOGGER.info(f"Queued job {job.id}: {name}")
+
+        return job
+
+    except Exception as e:
+        db.session.rollback()
+        LOGGER.error(f"An error occurred when queueing job {name}: {e}")
+        raise
+
+# --------------------------------------------------------------------------------------------------------------
+def claim_job(visibility_timeout:int=300):
+    '''
+    Claims the oldest job that is ready to run, including running jobs whose visibility timeout passed. The
+    claim is a conditional update, so two workers never claim the same job.
+
+    Parameter(s):
+        visibility_timeout (int, default=300): the number of seconds the job is hidden from other workers
+
+    Output(s):
+        job (JobModel): the claimed job, else None if no job is ready
+    '''
+    now = utcnow()
+    claimable = or_(
+        JobModel.status == QUEUED,
+        and_(JobModel.status == RUNNING, JobModel.locked_until < now)
+    )
+
+    # Jobs that timed out on their last attempt are not retried
+    db.session.execute(
+        update(JobModel)
+        .where(JobModel.status == RUNNING, JobModel.locked_until < now, JobModel.attempts >= JobModel.max_attempts)
+        .values(status=FAILED, locked_until=None, finished_at=now, last_error='Visibility timeout expired')
+    )
+    db.session.commit()
+
+    while True:
+        id = db.session.scalar(
+            select(JobModel.id).where(claimable, JobModel.run_at <= now).order_by(JobModel.run_at, JobModel.id).limit(1)
+        )
+        if id is None:
+            return None
+
+        claimed = db.session.execute(
+            update(JobModel)
+            .where(JobModel.id == id, claimable)
+            .values(status=RUNNING, attempts=JobModel.attempts + 1, locked_until=now + timedelta(seconds=visibility_timeout))
+        ).rowcount
+        db.session.commit()
+
+        # Another worker claimed the job first, try the next one
+        if claimed:
+            return db.session.get(JobModel, id)
+
+# --------------------------------------------------------------------------------------------------------------
+def extend_job(job:JobModel, attempt:int, visibility_timeout:int=300):
+    '''
+    Extends the visibility timeout of a running job, so a job that runs longer than the timeout is not claimed
+    by another worker while it is still running
+
+    Parameter(s):
+        job (JobModel): the claimed job
+        attempt (int): the attempt number of the claim, the job is only extended while this claim holds it
+        visibility_timeout (int, default=300): the number of seconds from now the job is hidden from other workers
+
+    Output(s):
+        True if the claim is still held, else False if the job was claimed again by another worker
+    '''
+    extended = db.session.execute(
+        update(JobModel)
+        .where(JobModel.id == job.id, JobModel.attempts == attempt, JobModel.status == RUNNING)
+        .values(locked_until=utcnow() + timedelta(seconds=visibility_timeout))
+    ).rowcount
+    db.session.commit()
+
+    return bool(extended)
+
+# --------------------------------------------------------------------------------------------------------------
+def finish_job(job:JobModel, error:str=None, retry_delay:int=10, attempt:int=None):
+    '''
+    Records the result of a job. Failed jobs are queued again after a delay that doubles with every attempt,
+    unless they are out of attempts. The result is only recorded while the claim holds the job, so a worker 
+    whose job timed out and was claimed again can not mark it done or failed.
+
+    Parameter(s):
+        job (JobModel): the claimed job
+        error (str, default=None): the error raised by the job, None if it succeeded
+        retry_delay (int, default=10): the number of seconds before the first retry
+        attempt (int, default=None): the attempt number of the claim, defaults to the attempts of the job
+
+    Output(s):
+        True if the result was recorded, else False if the job was claimed again by another worker
+    '''
+    now = utcnow()
+    attempt = job.attempts if attempt is None else attempt
+
+    if error is None:
+        values = {'status': DONE, 'finished_at': now}
+    elif attempt >= job.max_attempts:
+        values = {'status': FAILED, 'last_error': error, 'finished_at': now}
+    else:
+        values = {'status': QUEUED, 'last_error': error, 'run_at': now + timedelta(seconds=retry_delay * 2 ** (attempt - 1))}
+
+    finished = db.session.execute(
+        update(JobModel)
+        .where(JobModel.id == job.id, JobModel.attempts == attempt, JobModel.status == RUNNING)
+        .values(locked_until=None, **values)
+    ).rowcount
+    db.session.commit()
+
+    if not finished:
+        LOGGER.warning(f"Job {job.id} was claimed again by another worker, the result of attempt {attempt} is dropped")
+    return bool(finished)
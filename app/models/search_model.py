@@ -0,0 +1,250 @@
+'''
+Full-text search index over the flashcard questions, answers, and code figures
+
+The index is an SQLite FTS5 virtual table (flashcards_fts) whose rowid is the flashcard id. It is created and
+dropped along with the other tables and kept in sync by the FlashcardModel write methods in the same
+transaction as the card. Databases other than SQLite fall back to a LIKE scan.
+'''
+import re
+from markupsafe import escape
+from sqlalchemy import event, text, bindparam
+
+from app.extensions import db
+from app.utils import LOGGER
+
+# Control characters used to mark snippet matches before the text is escaped
+MATCH_START = '\x02'
+MATCH_END = '\x03'
+
+# ==============================================================================================================
+# Functions for managing the index table
+# ==============================================================================================================
+@event.listens_for(db.metadata, 'after_create')
+def create_search_index(target, connection, **kw):
+    '''
+    Creates the FTS5 table after the model tables are created
+    '''
+    if connection.dialect.name == 'sqlite':
+        connection.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS flashcards_fts "
+            "USING fts5(question, answer, code, tokenize='porter unicode61')"
+        ))
+
+# --------------------------------------------------------------------------------------------------------------
+@event.listens_for(db.metadata, 'before_drop')
+def drop_search_index(target, connection, **kw):
+    '''
+    Drops the FTS5 table before the model tables are dropped
+    '''
+    if connection.dialect.name == 'sqlite':
+        connection.execute(text("DROP TABLE IF EXISTS flashcards_fts"))
+
+# --------------------------------------------------------------------------------------------------------------
+def search_enabled():
+    '''
+    Checks if the database supports the FTS5 index
+
+    Output(s):
+        True if the database is SQLite, else False
+    '''
+    return db.session.get_bind().dialect.name == 'sqlite'
+
+# ==============================================================================================================
+# Functions for keeping the index in sync
+# ==============================================================================================================
+def index_flashcard(id:int, question:str=None, answer:str=None, figure_ids:list=None):
+    '''
+    Adds or replaces the indexed text of a flashcard. The change is only added to the session, it is committed
+    with the flashcard write that caused it.
+
+    Parameter(s):
+        id (int): the primary key of the flashcard
+        question (str, default=None): the flashcard question
+        answer (str, default=None): the flashcard answer
+        figure_ids (list, default=None): the ids of the question and answer figures
+
+    Output(s): None
+    '''
+    if not search_enabled():
+        return
+
+    code = ''
+    figure_ids = [figure_id for figure_id in (figure_ids or []) if figure_id]
+    if figure_ids:
+        rows = db.session.execute(
+            text("SELECT code_example FROM figures WHERE id IN :ids").bindparams(bindparam('ids', expanding=True)),
+            {'ids': figure_ids}
+        ).all()
+        code = '\n'.join(row[0] for row in rows if row[0])
+
+    remove_flashcard(id)
+    db.session.execute(
+        text("INSERT INTO flashcards_fts(rowid, question, answer, code) VALUES (:id, :question, :answer, :code)"),
+        {'id': id, 'question': question or '', 'answer': answer or '', 'code': code}
+    )
+
+# --------------------------------------------------------------------------------------------------------------
+def index_flashcards(entries:list):
+    '''
+    Adds many new flashcards to the index with a single executemany, committed with the bulk insert that 
+    caused it
+
+    Parameter(s):
+        entries (list): dictionaries with the id, question, answer, and code of each flashcard
+
+    Output(s): None
+    '''
+    if not search_enabled() or not entries:
+        return
+
+    db.session.execute(
+        text("INSERT INTO flashcards_fts(rowid, question, answer, code) VALUES (:id, :question, :answer, :code)"),
+        [{
+            'id': entry['id'],
+            'question': entry.get('question') or '',
+            'answer': entry.get('answer') or '',
+            'code': entry.get('code') or ''
+        } for entry in entries]
+    )
+
+# --------------------------------------------------------------------------------------------------------------
+def remove_flashcard(id:int):
+    '''
+    Removes a flashcard from the index, committed with the flashcard write that caused it
+
+    Parameter(s):
+        id (int): the primary key of the flashcard
+
+    Output(s): None
+    '''
+    if search_enabled():
+        db.session.execute(text("DELETE FROM flashcards_fts WHERE rowid = :id"), {'id': id})
+
+# --------------------------------------------------------------------------------------------------------------
+def rebuild_search_index():
+    '''
+    Rebuilds the index from the flashcards and figures tables
+
+    Parameter(s): None
+
+    Output(s):
+        count (int): the number of indexed flashcards if successful, else raises error
+    '''
+    try:
+        if not search_enabled():
+            LOGGER.warning("Full-text search requires SQLite, the index was not rebuilt")
+            return 0
+
+        connection = db.session.connection()
+        create_search_index(db.metadata, connection)
+
+        db.session.execute(text("DELETE FROM flashcards_fts"))
+        db.session.execute(text(
+            "INSERT INTO flashcards_fts(rowid, question, answer, code) "
+            "SELECT f.id, COALESCE(f.question, ''), COALESCE(f.answer, ''), "
+            "TRIM(COALESCE(q.code_example, '') || char(10) || COALESCE(a.code_example, '')) "
+            "FROM flashcards f "
+            "LEFT JOIN figures q ON q.id = f.q_figure "
+            "LEFT JOIN figures a ON a.id = f.a_figure"
+        ))
+        count = db.session.execute(text("SELECT COUNT(*) FROM flashcards_fts")).scalar()
+
+        db.session.commit()
+        LOGGER.info(f"Successfully rebuilt the search index with {count} flashcards")
+        return count
+
+    except Exception as e:
+        db.session.rollback()
+        LOGGER.error(f"An error occurred when rebuilding the search index: {e}")
+        raise
+
+# ==============================================================================================================
+# Functions for performing searches
+# ==============================================================================================================
+def build_match(query:str):
+    '''
+    Converts user input into an FTS5 query that matches every word as a prefix, so operators and quotes in the
+    input cannot cause syntax errors
+
+    Parameter(s):
+        query (str): the search text entered by the user
+
+    Output(s):
+        str: the FTS5 match expression, empty if there are no words
+    '''
+    words = re.findall(r'\w+', query or '')
+    return ' '.join(f'"{word}"*' for word in words)
+
+# --------------------------------------------------------------------------------------------------------------
+def highlight(snippet:str):
+    '''
+    Escapes a snippet and wraps the matched words in <mark> tags
+
+    Parameter(s):
+        snippet (str): snippet text with the matches wrapped in MATCH_START and MATCH_END
+
+    Output(s):
+        str: html safe snippet
+    '''
+    html = str(escape(snippet or ''))
+    return html.replace(MATCH_START, '<mark>').replace(MATCH_END, '</mark>')
+
+# --------------------------------------------------------------------------------------------------------------
+def search_flashcards(query:str, page:int=1, limit:int=20):
+    '''
+    Searches the questions, answers, and code of all the flashcards ordered by relevance
+
+    Parameter(s):
+        query (str): the search text entered by the user
+        page (int, default=1): the page of results starting at 1
+        limit (int, default=20): the number of results in a page
+
+    Output(s):
+        response (dict): the matching flashcards and whether there is another page
+
+        response = {
+            'results': [{'id':int, 'category':str, 'question':str, 'answer':str, 'snippet':str}, ... ],
+            'page': int,
+            'has_next': bool
+        }
+    '''
+    response = {'results': [], 'page': page, 'has_next': False}
+
+    try:
+        match = build_match(query)
+        if not match:
+            return response
+
+        params = {'match': match, 'limit': limit + 1, 'offset': (page - 1) * limit}
+
+        if search_enabled():
+            rows = db.session.execute(text(
+                "SELECT f.id, f.category, f.question, f.answer, "
+                f"snippet(flashcards_fts, -1, '{MATCH_START}', '{MATCH_END}', '...', 16) "
+                "FROM flashcards_fts JOIN flashcards f ON f.id = flashcards_fts.rowid "
+                "WHERE flashcards_fts MATCH :match "
+                "ORDER BY rank LIMIT :limit OFFSET :offset"
+            ), params).all()
+        else:
+            params['pattern'] = f"%{query}%"
+            rows = db.session.execute(text(
+                "SELECT f.id, f.category, f.question, f.answer, COALESCE(f.question, f.answer) "
+                "FROM flashcards f WHERE f.question LIKE :pattern OR f.answer LIKE :pattern "
+                "ORDER BY f.id LIMIT :limit OFFSET :offset"
+            ), params).all()
+
+        response['has_next'] = len(rows) > limit
+        for row in rows[:limit]:
+            response['results'].append({
+                'id': row[0],
+                'category': row[1],
+                'question': row[2],
+                'answer': row[3],
+                'snippet': highlight(row[4])
+            })
+
+        return response
+
+    except Exception as e:
+        LOGGER.error(f"An error occurred when searching flashcards for {query}: {e}")
+        return response
@@ -0,0 +1,309 @@
+'''
+Whole-response cache for the pages of the main blueprint
+
+Responses are cached under their URL along with the deck version they were built from, so a write to the deck
+makes the next request build the page again. The views read the deck cache by the same versions, so a page
+built after a write by another process never holds older cards. Only one request builds a page at a time
+(single-flight), the others wait for it instead of all querying the database at once. Pages past their TTL
+are served stale while a background thread builds them again, and pages close to their TTL are refreshed ahead
+of time, so a popular page is never rebuilt in the request path. Memory is bounded by the number of pages and
+their total size, the least recently used pages are evicted first.
+'''
+import functools, io, threading, time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app, request, session
+
+from app.utils import LOGGER
+from app.profiling import profiling
+
+# Request headers left out of background refreshes, the cached page is shared by every client
+PRIVATE_HEADERS = ('HTTP_COOKIE', 'HTTP_AUTHORIZATION', 'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE')
+
+class CachedPage:
+    '''
+    The parts of a response needed to serve it again
+    '''
+    __slots__ = ('version', 'body', 'status', 'headers', 'created', 'size')
+
+    def __init__(self, version, body:bytes, status:int, headers:list):
+        self.version = version
+        self.body = body
+        self.status = status
+        self.headers = headers
+        self.created = time.monotonic()
+        self.size = len(body) + sum(len(name) + len(value) for name, value in headers)
+
+# ==============================================================================================================
+class PageCache:
+    '''
+    Creates a thread-safe, size-bounded LRU cache of responses with single-flight builds and stale-while-revalidate
+    '''
+    def __init__(
+        self,
+        max_entries:int=512,
+        max_bytes:int=64 * 1024 * 1024,
+        ttl:float=60,
+        stale_ttl:float=300,
+        refresh_ahead:float=10,
+        wait_timeout:float=5
+    ):
+        '''
+        Initializes the cache with no pages
+
+        Parameter(s):
+            max_entries (int, default=512): the maximum number of pages before the least recently used is evicted
+            max_bytes (int, default=64MB): the maximum total size of the cached pages
+            ttl (float, default=60): seconds a page is served as fresh
+            stale_ttl (float, default=300): seconds past the TTL a page is served while it is rebuilt
+            refresh_ahead (float, default=10): seconds before the TTL a page starts being rebuilt in the background
+            wait_timeout (float, default=5): seconds a request waits for another request building the same page
+        '''
+        self.pages = OrderedDict()
+        self.building = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='page-cache')
+        self.configure(max_entries, max_bytes, ttl, stale_ttl, refresh_ahead, wait_timeout)
+
+    # ------------------------------------------------------------
+    def configure(
+        self,
+        max_entries:int=512,
+        max_bytes:int=64 * 1024 * 1024,
+        ttl:float=60,
+        stale_ttl:float=300,
+        refresh_ahead:float=10,
+        wait_timeout:float=5
+    ):
+        '''
+        Changes the limits of the cache, drops all the cached pages, and resets the counters
+
+        Parameter(s): see __init__
+        '''
+        with self.lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self.ttl = ttl
+            self.stale_ttl = stale_ttl
+            self.refresh_ahead = refresh_ahead
+            self.wait_timeout = wait_timeout
+
+            self.pages.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.stale_hits = 0
+            self.misses = 0
+            self.coalesced = 0
+            self.refreshes = 0
+            self.evictions = 0
+
+    # ------------------------------------------------------------
+    def get(self, key, version, build, rebuild):
+        '''
+        Gets a page, building it on a miss. Requests for a page that is being built wait for that build.
+
+        Parameter(s):
+            key (hashable): the key of the page, usually its URL
+            version (hashable): the version of the data the page is built from, a different version is a miss
+            build (callable): function with no arguments that builds the response in the current request
+            rebuild (callable): function with no arguments that builds the response outside of a request, used
+                by background refreshes
+
+        Output(s):
+            a tuple containing the cached page (None if the response can not be cached), the response if it was
+            built by this call, and the cache state ('hit', 'stale', 'miss', or 'wait')
+        '''
+        with self.lock:
+            page = self.pages.get(key)
+
+            if page is not None and page.version == version:
+                age = time.monotonic() - page.created
+
+                if age < self.ttl + self.stale_ttl:
+                    self.pages.move_to_end(key)
+
+                    if age >= self.ttl:
+                        self.stale_hits += 1
+                        self._refresh(key, version, rebuild)
+                        return (page, None, 'stale')
+
+                    self.hits += 1
+                    if age >= self.ttl - self.refresh_ahead:
+                        self._refresh(key, version, rebuild)
+                    return (page, None, 'hit')
+
+            flight = self.building.get((key, version))
+            if flight is None:
+                flight = self.building[(key, version)] = _Flight()
+                self.misses += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            if flight.done.wait(self.wait_timeout) and flight.page is not None:
+                return (flight.page, None, 'wait')
+
+            # The build failed, was not cacheable, or is too slow, so this request builds its own response
+            return (None, build(), 'miss')
+
+        response = None
+        try:
+            response = build()
+            flight.page = self._store(key, version, response)
+        finally:
+            self._land(key, version, flight)
+
+        return (flight.page, response, 'miss')
+
+    # ------------------------------------------------------------
+    def clear(self):
+        '''
+        Drops all the cached pages
+        '''
+        with self.lock:
+            self.pages.clear()
+            self.bytes = 0
+
+    # ------------------------------------------------------------
+    def stats(self):
+        '''
+        Gets the cache counters
+
+        Output(s):
+            response (dict): the number and size of the cached pages and the hit, miss, and refresh counts
+        '''
+        with self.lock:
+            lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+
+            return {
+                'size': len(self.pages),
+                'max_size': self.max_entries,
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'refreshes': self.refreshes,
+                'evictions': self.evictions,
+                'hit_rate': round((self.hits + self.stale_hits + self.coalesced) / lookups, 4) if lookups else None
+            }
+
+    # ------------------------------------------------------------
+    def _refresh(self, key, version, rebuild):
+        '''
+        Rebuilds a page in the background unless it is already being built, called with the lock held
+        '''
+        if (key, version) in self.building:
+            return
+
+        flight = self.building[(key, version)] = _Flight()
+        self.refreshes += 1
+
+        def refresh():
+            try:
+                flight.page = self._store(key, version, rebuild())
+            except Exception as e:
+                LOGGER.error(f"An error occurred when refreshing the cached page {key}: {e}")
+            finally:
+                self._land(key, version, flight)
+
+        self.executor.submit(refresh)
+
+    # ------------------------------------------------------------
+    def _land(self, key, version, flight):
+        '''
+        Finishes a build and wakes the requests waiting for it
+        '''
+        with self.lock:
+            self.building.pop((key, version), None)
+        flight.done.set()
+
+    # ------------------------------------------------------------
+    def _store(self, key, version, response):
+        '''
+        Caches a successful response, evicting the least recently used pages until the cache is within its limits
+
+        Output(s):
+            page (CachedPage): the cached page, else None if the response can not be shared
+        '''
+        if (response.status_code != 200 or response.is_streamed or response.cache_control.no_store
+                or 'Set-Cookie' in response.headers):
+            return None
+
+        page = CachedPage(version, response.get_data(), response.status_code, list(response.headers.items()))
+        if page.size > self.max_bytes:
+            return None
+
+        with self.lock:
+            previous = self.pages.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous.size
+
+            self.pages[key] = page
+            self.bytes += page.size
+
+            while len(self.pages) > self.max_entries or self.bytes > self.max_bytes:
+                _, evicted = self.pages.popitem(last=False)
+                self.bytes -= evicted.size
+                self.evictions += 1
+
+        return page
+
+# --------------------------------------------------------------------------------------------------------------
+class _Flight:
+    '''
+    A build in progress, waited on by the requests for the same page
+    '''
+    __slots__ = ('done', 'page')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.page = None
+
+# ==============================================================================================================
+# Decorator for caching views
+# ==============================================================================================================
+def cached_page(version):
+    '''
+    Serves a GET view from the page cache
+
+    Parameter(s):
+        version (callable): called with the view arguments, returns the version of the data the page shows
+
+    Output(s):
+        a decorator for the view function
+    '''
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(**kwargs):
+            # Imported here since the extensions module creates the cache
+            from app.extensions import page_cache
+
+            # Pending flashed messages are only shown to this client, profiled requests build the page
+            if (request.method != 'GET' or not current_app.config.get('PAGE_CACHE') or session.get('_flashes')
+                    or profiling()):
+                return view(**kwargs)
+
+            app = current_app._get_current_object()
+            environ = {name: value for name, value in request.environ.items() if name not in PRIVATE_HEADERS}
+
+            def build():
+                return app.make_response(view(**kwargs))
+
+            def rebuild():
+                with app.request_context({**environ, 'wsgi.input': io.BytesIO(), 'CONTENT_LENGTH': '0'}):
+                    return app.make_response(view(**kwargs))
+
+            page, response, state = page_cache.get(request.full_path, version(**kwargs), build, rebuild)
+
+            if response is None:
+                response = app.response_class(page.body, status=page.status, headers=page.headers)
+                response.make_conditional(request)
+
+            response.headers['X-Page-Cache'] = state
+            return response
+        return wrapper
+    return decorator
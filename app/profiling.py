@@ -0,0 +1,213 @@
+'''
+On-demand profiling of single requests
+
+With PROFILING enabled, a request carrying PROFILE_SECRET in the X-Profile header or the _profile query
+argument is run under cProfile and a stack sampler. Its profile is written to PROFILE_FOLDER:
+
+<name>.collapsed: sampled stacks in the collapsed format read by flamegraph.pl and speedscope
+<name>.speedscope.json: the same samples in the speedscope file format
+<name>.txt: the top functions by cumulative time from cProfile
+
+The name of the profile is returned in the X-Profile response header. Profiled requests skip the lookups of
+the page, fragment, and deck caches, so the profile shows the queries and rendering the caches save. Other
+requests are not affected.
+'''
+import cProfile, hmac, io, json, os, pstats, sys, threading, time, uuid
+from collections import Counter
+from flask import g, request, has_request_context
+
+from app.utils import LOGGER
+
+class StackSampler:
+    '''
+    Samples the call stack of a thread at a fixed interval from a background thread
+    '''
+    def __init__(self, thread_id:int, interval:float=0.001):
+        '''
+        Initializes the sampler
+
+        Parameter(s):
+            thread_id (int): the identifier of the sampled thread
+            interval (float, default=0.001): seconds between samples
+        '''
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    # ------------------------------------------------------------
+    def start(self):
+        self.started = time.perf_counter()
+        self.thread.start()
+
+    # ------------------------------------------------------------
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        self.duration = time.perf_counter() - self.started
+
+    # ------------------------------------------------------------
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+
+            if stack:
+                # Root first
+                self.stacks[tuple(reversed(stack))] += 1
+
+    # ------------------------------------------------------------
+    def collapsed(self):
+        '''
+        Formats the samples as collapsed stacks, one 'frame;frame;frame count' line per distinct stack
+        '''
+        lines = []
+        for stack, count in self.stacks.most_common():
+            frames = ';'.join(f"{name} ({os.path.basename(filename)}:{line})" for name, filename, line in stack)
+            lines.append(f"{frames} {count}")
+        return '\n'.join(lines) + '\n'
+
+    # ------------------------------------------------------------
+    def speedscope(self, name:str):
+        '''
+        Formats the samples in the speedscope file format
+        '''
+        frames, index = [], {}
+        samples, weights = [], []
+
+        for stack, count in self.stacks.items():
+            sample = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+                sample.append(index[frame])
+            samples.append(sample)
+            weights.append(count * self.interval)
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'flashcards',
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights
+            }]
+        }
+
+# ==============================================================================================================
+# Hooks
+# ==============================================================================================================
+def requested(secret:str):
+    '''
+    Checks if the request carries the profiling secret in the X-Profile header or the _profile query argument
+    '''
+    if not secret:
+        return False
+
+    token = request.headers.get('X-Profile') or request.args.get('_profile') or ''
+    return hmac.compare_digest(token.encode('utf-8'), secret.encode('utf-8'))
+
+# --------------------------------------------------------------------------------------------------------------
+def profiling():
+    '''
+    Checks if the current request is being profiled, caches skip their lookups for profiled requests
+    '''
+    return has_request_context() and 'profile' in g
+
+# --------------------------------------------------------------------------------------------------------------
+def write_profile(folder:str, name:str, profiler:cProfile.Profile, sampler:StackSampler, top:int):
+    '''
+    Writes the collapsed stacks, the speedscope file, and the top functions of a profiled request
+
+    Parameter(s):
+        folder (str): the directory the profile is written to
+        name (str): the name of the profile files
+        profiler (cProfile.Profile): the stopped profiler
+        sampler (StackSampler): the stopped sampler
+        top (int): the number of functions in the table
+
+    Output(s): None
+    '''
+    os.makedirs(folder, exist_ok=True)
+
+    with open(os.path.join(folder, f"{name}.collapsed"), 'w') as file:
+        file.write(sampler.collapsed())
+
+    with open(os.path.join(folder, f"{name}.speedscope.json"), 'w') as file:
+        json.dump(sampler.speedscope(name), file)
+
+    table = io.StringIO()
+    table.write(f"{request.method} {request.path} ({sampler.duration * 1000:.1f} ms, {sum(sampler.stacks.values())} samples)\n\n")
+    pstats.Stats(profiler, stream=table).sort_stats('cumulative').print_stats(top)
+    with open(os.path.join(folder, f"{name}.txt"), 'w') as file:
+        file.write(table.getvalue())
+
+# --------------------------------------------------------------------------------------------------------------
+def init_profiling(app):
+    '''
+    Adds the request hooks that profile requests carrying the profiling secret
+
+    Parameter(s):
+        app (Flask): the flask application
+
+    Output(s): None
+    '''
+    def start_profile():
+        if not requested(app.config.get('PROFILE_SECRET')):
+            return
+
+        sampler = StackSampler(threading.get_ident(), interval=app.config.get('PROFILE_INTERVAL', 0.001))
+        profiler = cProfile.Profile()
+        g.profile = (profiler, sampler)
+
+        sampler.start()
+        profiler.enable()
+
+    def finish_profile():
+        '''
+        Stops the profile of the request and writes it, returns the name of the profile
+        '''
+        profiler, sampler = g.pop('profile')
+        profiler.disable()
+        sampler.stop()
+
+        endpoint = (request.endpoint or 'unmatched').replace('.', '-')
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{endpoint}-{uuid.uuid4().hex[:8]}"
+
+        try:
+            write_profile(app.config['PROFILE_FOLDER'], name, profiler, sampler, app.config.get('PROFILE_TOP', 30))
+            LOGGER.info(f"Profiled {request.method} {request.path} as {name}")
+            return name
+        except Exception as e:
+            LOGGER.error(f"An error occurred when writing the profile of {request.path}: {e}")
+            return None
+
+    def after_request(response):
+        if 'profile' in g:
+            name = finish_profile()
+            if name:
+                response.headers['X-Profile'] = name
+        return response
+
+    def teardown_request(exception):
+        # Requests that raised never reach after_request
+        if 'profile' in g:
+            finish_profile()
+
+    # Registered first so the profile covers the other request hooks
+    app.before_request_funcs.setdefault(None, []).insert(0, start_profile)
+    app.after_request(after_request)
+    app.teardown_request(teardown_request)
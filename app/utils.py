@@ -1,9 +1,44 @@
-import logging, os, re, mimetypes, json
+import logging, os, re, mimetypes, json, base64, threading, time, codecs, hashlib, tempfile, functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
+from flask import Request, current_app, has_app_context, session
+from flask.globals import request_ctx
+from werkzeug.exceptions import RequestEntityTooLarge, UnsupportedMediaType
+from werkzeug.http import is_resource_modified
+
+# Pillow is optional, without it images are only served at their original size
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Pygments is optional, without it code figures are highlighted in the browser
+try:
+    from pygments import highlight
+    from pygments.lexers import get_lexer_by_name
+    from pygments.formatters import HtmlFormatter
+    from pygments.util import ClassNotFound
+except ImportError:
+    highlight = None
 
 PATH = os.path.dirname(os.path.abspath(__file__))
 IMAGE_FOLDER = os.path.join(PATH, "./uploads/images")
 DATA_FOLDER = os.path.join(PATH, "../data")
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Leading bytes of each supported upload type, checked while the upload is received
+IMAGE_SIGNATURES = {
+    '.png': [b'\x89PNG\r\n\x1a\n'],
+    '.jpg': [b'\xff\xd8\xff'],
+    '.jpeg': [b'\xff\xd8\xff'],
+    '.pdf': [b'%PDF-'],
+}
+SIGNATURE_LENGTH = max(len(signature) for signatures in IMAGE_SIGNATURES.values() for signature in signatures)
+
+# Widths of the resized copies generated for each uploaded image
+IMAGE_WIDTHS = [160, 480, 960]
+IMAGE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='image-variants')
 
 logging.basicConfig(
     filename=os.path.join(PATH, '../logs/app.log'),
@@ -16,9 +51,145 @@ LOGGER = logging.getLogger(__name__)
 # ========================================================================================================================================
 # Functions used for processing files
 # ========================================================================================================================================
+def max_image_size():
+    '''
+    Gets the largest accepted image upload in bytes from the app configuration
+
+    Output(s):
+        int: the size limit, else None if there is no limit or no app context
+    '''
+    return current_app.config.get('MAX_IMAGE_SIZE') if has_app_context() else None
+
+# ----------------------------------------------------------------------------------------------------------------------------
+class ImageUpload:
+    '''
+    Writable stream that saves an upload to a temporary file in the image directory while hashing it, checking
+    its leading bytes, and counting its size. Invalid uploads raise an error on the chunk that reveals them, so
+    the rest of the request is never read, and only one chunk is held in memory at a time.
+    '''
+    def __init__(self, extension:str, max_size:int=None):
+        '''
+        Parameter(s):
+            extension (str): the extension of the uploaded filename, selects the expected signature
+            max_size (int, default=None): the largest accepted upload in bytes, unlimited if None
+        '''
+        self.extension = extension.lower()
+        self.max_size = max_size
+        self.size = 0
+        self.header = b''
+        self.digest = hashlib.sha256()
+
+        if self.extension not in IMAGE_SIGNATURES:
+            raise UnsupportedMediaType(f"{extension} files are not supported!")
+
+        os.makedirs(IMAGE_FOLDER, exist_ok=True)
+        descriptor, self.path = tempfile.mkstemp(dir=IMAGE_FOLDER, prefix='.upload-')
+        self.file = os.fdopen(descriptor, 'w+b')
+
+    #-------------------------------------------------------------------------------------------------------------------------
+    def __getattr__(self, name):
+        # Reading and seeking are passed to the temporary file
+        if name == 'file':
+            raise AttributeError(name)
+        return getattr(self.file, name)
+
+    #-------------------------------------------------------------------------------------------------------------------------
+    def write(self, data:bytes):
+        '''
+        Checks and writes a chunk of the upload, discarding the upload if it is too large or does not start
+        with the signature of its extension
+        '''
+        self.size += len(data)
+        if self.max_size is not None and self.size > self.max_size:
+            self.close()
+            raise RequestEntityTooLarge(f"Uploaded files are limited to {self.max_size} bytes!")
+
+        if len(self.header) < SIGNATURE_LENGTH:
+            self.header += data[:SIGNATURE_LENGTH - len(self.header)]
+            # Reject as soon as the received bytes cannot be the start of a signature
+            if not any(signature[:len(self.header)] == self.header[:len(signature)] for signature in IMAGE_SIGNATURES[self.extension]):
+                self.close()
+                raise UnsupportedMediaType(f"The upload is not a valid {self.extension} file!")
+
+        self.digest.update(data)
+        return self.file.write(data)
+
+    #-------------------------------------------------------------------------------------------------------------------------
+    def finish(self):
+        '''
+        Checks the complete upload and flushes it to disk
+
+        Output(s):
+            str: the hex sha256 digest of the upload, else raises an error if the upload is shorter than its
+            signature
+        '''
+        if not any(self.header.startswith(signature) for signature in IMAGE_SIGNATURES[self.extension]):
+            raise UnsupportedMediaType(f"The upload is not a valid {self.extension} file!")
+
+        self.file.flush()
+        return self.digest.hexdigest()
+
+    #-------------------------------------------------------------------------------------------------------------------------
+    def move(self, file_path:str):
+        '''
+        Atomically moves the upload into place, after which closing the stream keeps the file
+        '''
+        self.file.close()
+        os.replace(self.path, file_path)
+        self.path = None
+
+    #-------------------------------------------------------------------------------------------------------------------------
+    def close(self):
+        '''
+        Closes the stream and removes the temporary file if the upload was not moved into place
+        '''
+        self.file.close()
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+        self.path = None
+
+# ----------------------------------------------------------------------------------------------------------------------------
+class UploadRequest(Request):
+    '''
+    Request class that streams uploaded images into ImageUpload files while the form is parsed instead of
+    buffering them in memory
+    '''
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        extension = os.path.splitext(filename or '')[1].lower()
+
+        if extension not in IMAGE_SIGNATURES:
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+
+        # Reject uploads that declare their size before any of the file is read
+        max_size = max_image_size()
+        if max_size is not None and content_length and content_length > max_size:
+            raise RequestEntityTooLarge(f"Uploaded files are limited to {max_size} bytes!")
+
+        upload = ImageUpload(extension, max_size)
+        self.uploads.append(upload)
+        return upload
+
+    #-------------------------------------------------------------------------------------------------------------------------
+    @property
+    def uploads(self):
+        # Uploads opened while parsing, kept so they are removed even if a later part of the form is rejected
+        if '_uploads' not in self.__dict__:
+            self._uploads = []
+        return self._uploads
+
+    #-------------------------------------------------------------------------------------------------------------------------
+    def close(self):
+        super().close()
+        for upload in self.uploads:
+            upload.close()
+
+# ----------------------------------------------------------------------------------------------------------------------------
 def save_image_file(file:object):
     '''
-    Takes in a file object, sanitizes, validates, and saves it to the temp directory
+    Takes in a file object, validates it, and saves it to the image directory under the hash of its content. 
+    Identical uploads share one file, and the file is written to a temporary name and renamed into place so 
+    concurrent uploads never see or overwrite a partial file. Uploads parsed by UploadRequest are already 
+    hashed and checked, other files are streamed through an ImageUpload.
 
     Parameter(s):
         file (object): the user input file being saved
@@ -26,14 +197,9 @@ def save_image_file(file:object):
     Output(s):
         filename (str): name of the saved file
     '''
-    try:
-        # Replace special characters with underscores
-        sanitized_name = re.sub(r'[\\/*?:"<>| ]', '_', file.filename)
-        # Remove leading and trailing whitespace
-        sanitized_name = sanitized_name.strip()
-        # Getting the name of the file without the extension
-        sanitized_name = sanitized_name.split('.')[0]
+    upload = None
 
+    try:
         allowed_mime_types = ['image/jpeg', 'image/png', 'application/pdf']
         allowed_extensions = ['.jpg', '.jpeg', '.png', '.pdf']
 
@@ -50,27 +216,252 @@ def save_image_file(file:object):
             LOGGER.error(f'{file.filename} extension is not supported! Extension: {file_extension}')
             return None
 
-        # Create path if it doesn't exist
-        os.makedirs(IMAGE_FOLDER, exist_ok=True)
-
-        counter = 0
-        original_file_path = os.path.join(IMAGE_FOLDER, f'{sanitized_name}_{counter}{file_extension}')
-        new_file_path = original_file_path
+        upload = file.stream
+        if not isinstance(upload, ImageUpload):
+            upload = ImageUpload(file_extension, max_image_size())
+            for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                upload.write(chunk)
 
-        # loop thru the files to ensure the saved file does not have the same name as another
-        while os.path.exists(new_file_path):
-            new_file_path = os.path.join(IMAGE_FOLDER, f'{sanitized_name}_{counter}{file_extension}')
-            counter += 1
+        filename = f'{upload.finish()}{file_extension}'
+        file_path = os.path.join(IMAGE_FOLDER, filename)
 
-        LOGGER.info(f"Creating file: {new_file_path}")
-        file.save(new_file_path)
+        # Identical content is already stored, otherwise atomically move the upload into place
+        if os.path.exists(file_path):
+            # Refresh the modified time so gc_images does not remove a file that just gained a reference
+            os.utime(file_path)
+            LOGGER.info(f"Reusing stored file: {file_path}")
+        else:
+            upload.move(file_path)
+            LOGGER.info(f"Creating file: {file_path}")
+            schedule_image_variants(filename)
 
-        return os.path.basename(new_file_path)
+        return filename
     
     except Exception as e:
         LOGGER.error(f"An error occured when saving {file.filename}: {e}")
         return None
 
+    finally:
+        if upload is not None:
+            upload.close()
+
+# ========================================================================================================================================
+def variant_path(filename:str, width:int):
+    '''
+    Gets the path of a resized copy of an image relative to the image directory
+
+    Parameter(s):
+        filename (str): the filename of the original image
+        width (int): the width of the resized copy
+
+    Output(s):
+        str: the relative path of the resized copy
+    '''
+    return os.path.join('variants', str(width), filename)
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def create_image_variants(filename:str):
+    '''
+    Creates the resized copies of an image that are narrower than the original
+
+    Parameter(s):
+        filename (str): the filename of the original image
+
+    Output(s):
+        widths (list): the widths of the created copies
+    '''
+    widths = []
+
+    if Image is None or os.path.splitext(filename)[1].lower() not in ['.jpg', '.jpeg', '.png']:
+        return widths
+
+    try:
+        with Image.open(os.path.join(IMAGE_FOLDER, filename)) as image:
+            for width in IMAGE_WIDTHS:
+                if width >= image.width:
+                    break
+
+                height = max(1, round(image.height * width / image.width))
+                resized = image.resize((width, height), Image.LANCZOS)
+
+                # Write to a temporary file and rename it so a partial copy is never served
+                path = os.path.join(IMAGE_FOLDER, variant_path(filename, width))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.variant-')
+                with os.fdopen(descriptor, 'wb') as temp_file:
+                    resized.save(temp_file, format=image.format)
+                os.replace(temp_path, path)
+
+                widths.append(width)
+
+        LOGGER.info(f"Created {widths} width copies of {filename}")
+        return widths
+
+    except Exception as e:
+        LOGGER.error(f"An error occured when resizing {filename}: {e}")
+        return widths
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def schedule_image_variants(filename:str):
+    '''
+    Creates the resized copies of an image in the background so the upload request does not wait for them. With
+    BACKGROUND_JOBS enabled a job is queued for the worker process, committed with the figure using the image,
+    else the copies are created by a thread of this process.
+
+    Parameter(s):
+        filename (str): the filename of the original image
+
+    Output(s):
+        the queued job, else a future of the created widths
+    '''
+    if has_app_context() and current_app.config.get('BACKGROUND_JOBS'):
+        # Imported here since the job queue depends on this module
+        from app.models.job_model import enqueue
+        return enqueue('create_image_variants', {'filename': filename}, commit=False)
+
+    return IMAGE_EXECUTOR.submit(create_image_variants, filename)
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def nearest_image(filename:str, width:int=None):
+    '''
+    Finds the smallest stored copy of an image that is at least the requested width
+
+    Parameter(s):
+        filename (str): the filename of the original image
+        width (int, default=None): the requested width, the original is used if None
+
+    Output(s):
+        str: the path of the copy relative to the image directory, else the original filename
+    '''
+    if width:
+        for size in IMAGE_WIDTHS:
+            if size >= width and os.path.exists(os.path.join(IMAGE_FOLDER, variant_path(filename, size))):
+                return variant_path(filename, size)
+
+    return filename
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def is_final_image(filename:str, width:int, image:str):
+    '''
+    Checks if the copy found by nearest_image is the one served once every resized copy is created, only then is 
+    the response for the requested width safe to cache as immutable
+
+    Parameter(s):
+        filename (str): the filename of the original image
+        width (int): the requested width, None for the original
+        image (str): the path returned by nearest_image
+
+    Output(s):
+        bool: True if no copy of the image will be a better match for the width
+    '''
+    sizes = [size for size in IMAGE_WIDTHS if width and size >= width]
+    if not sizes:
+        return image == filename
+    if image != filename:
+        return image == variant_path(filename, sizes[0])
+
+    # The original is final if the copy will never be created, see create_image_variants
+    if Image is None or os.path.splitext(filename)[1].lower() not in ['.jpg', '.jpeg', '.png']:
+        return True
+    try:
+        with Image.open(os.path.join(IMAGE_FOLDER, filename)) as original:
+            return sizes[0] >= original.width
+    except Exception:
+        return True
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def image_etag(path:str):
+    '''
+    Builds a strong ETag from the content hash in the name of a stored image. Content addressed files never
+    change, so the name identifies the bytes without reading them.
+
+    Parameter(s):
+        path (str): the path of the image or resized copy relative to the image directory
+
+    Output(s):
+        str: the ETag value, else None if the filename is not a content hash
+    '''
+    match = re.fullmatch(r'(?:variants/(\d+)/)?([0-9a-f]{64})\.\w+', path)
+    if not match:
+        return None
+
+    width, digest = match.groups()
+    return f"{digest}-{width}" if width else digest
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def image_exists(filename:str):
+    '''
+    Checks if an image is stored in the image directory
+
+    Parameter(s):
+        filename (str): the filename of the image
+
+    Output(s):
+        True if the file exists, else False
+    '''
+    return os.path.isfile(os.path.join(IMAGE_FOLDER, filename))
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def image_modified(filename:str):
+    '''
+    Gets the last modified time of an image in the image directory
+
+    Parameter(s):
+        filename (str): the filename of the image
+
+    Output(s):
+        float: the modified time in seconds since the epoch, else None if the file does not exist
+    '''
+    try:
+        return os.path.getmtime(os.path.join(IMAGE_FOLDER, filename))
+    except OSError:
+        return None
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def scan_images(min_age:int=0):
+    '''
+    Streams the names of the files in the image directory, including unfinished temporary uploads, without 
+    listing the whole directory at once
+
+    Parameter(s):
+        min_age (int, default=0): only files last modified at least this many seconds ago are returned
+
+    Output(s):
+        a generator of filenames relative to the image directory
+    '''
+    if not os.path.isdir(IMAGE_FOLDER):
+        return
+
+    cutoff = time.time() - min_age
+    with os.scandir(IMAGE_FOLDER) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime <= cutoff:
+                yield entry.name
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def scan_orphaned_variants(min_age:int=0):
+    '''
+    Streams the resized copies whose original image no longer exists
+
+    Parameter(s):
+        min_age (int, default=0): only copies last modified at least this many seconds ago are returned
+
+    Output(s):
+        a generator of paths relative to the image directory
+    '''
+    variants_folder = os.path.join(IMAGE_FOLDER, 'variants')
+    if not os.path.isdir(variants_folder):
+        return
+
+    cutoff = time.time() - min_age
+    for width in os.listdir(variants_folder):
+        with os.scandir(os.path.join(variants_folder, width)) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.stat().st_mtime > cutoff:
+                    continue
+                if entry.name.startswith('.') or not os.path.exists(os.path.join(IMAGE_FOLDER, entry.name)):
+                    yield os.path.join('variants', width, entry.name)
+
 # ========================================================================================================================================
 def verify_file(file:str):
     '''
@@ -140,6 +531,39 @@ def to_json(data:dict, filename:str='data.json'):
     except Exception as e:
         LOGGER.error(f"Failed to save data to {file_path}: {str(e)}")
 
+# ======================================================================================================================================== 
+def write_json_stream(items, file, key:str='questions', ndjson:bool=False):
+    '''
+    Writes items to an open text file one at a time, either as a JSON object holding an array under the key
+    (the format read by from_json) or as newline delimited JSON
+
+    Parameter(s):
+        items (iterable): the JSON serializable items being written, can be a generator
+        file (file): the open text file or stream being written to
+        key (str, default='questions'): the key of the array when writing a JSON object
+        ndjson (bool, default=False): writes one item per line instead of a JSON object
+
+    Output(s):
+        count (int): the number of items written
+    '''
+    count = 0
+
+    if ndjson:
+        for item in items:
+            file.write(json.dumps(item, ensure_ascii=False))
+            file.write('\n')
+            count += 1
+        return count
+
+    file.write(f'{{\n    {json.dumps(key)}: [')
+    for item in items:
+        file.write(',\n        ' if count else '\n        ')
+        file.write(json.dumps(item, ensure_ascii=False))
+        count += 1
+    file.write('\n    ]\n}\n' if count else ']\n}\n')
+
+    return count
+
 # ======================================================================================================================================== 
 def from_json(filename:str=os.path.join(DATA_FOLDER, "data.json")):
     '''
@@ -169,6 +593,82 @@ def from_json(filename:str=os.path.join(DATA_FOLDER, "data.json")):
         LOGGER.error(f"An error occurred when migrating data from JSON file={filename} to database: {e}")
         raise
 
+# ======================================================================================================================================== 
+class JSONStream:
+    '''
+    Iterates over the items of an array in a JSON file without loading the whole file, so memory use stays
+    constant regardless of the file size. Tracks the bytes read for reporting progress.
+    '''
+    def __init__(self, filename:str=os.path.join(DATA_FOLDER, "data.json"), key:str='questions', chunk_size:int=64 * 1024):
+        '''
+        Initializes the stream
+
+        Parameter(s):
+            filename (str): name of the JSON file being imported
+            key (str, default='questions'): the top level key of the array being streamed
+            chunk_size (int, default=65536): the number of bytes read from the file at a time
+        '''
+        self.filename = filename
+        self.key = key
+        self.chunk_size = chunk_size
+        self.total_bytes = os.path.getsize(filename)
+        self.bytes_read = 0
+
+    # ------------------------------------------------------------
+    def __iter__(self):
+        '''
+        Yields each item in the array, raises a JSONDecodeError if the file is not valid
+        '''
+        LOGGER.info(f"Streaming data from JSON file: {self.filename} ...")
+
+        decoder = json.JSONDecoder()
+        array_start = re.compile(r'"%s"\s*:\s*\[' % re.escape(self.key))
+
+        with open(self.filename, 'rb') as file:
+            reader = codecs.getincrementaldecoder('utf-8')()
+
+            def read():
+                chunk = file.read(self.chunk_size)
+                self.bytes_read += len(chunk)
+                return reader.decode(chunk, final=not chunk), not chunk
+
+            # Skip ahead to the start of the array
+            buffer, done = '', False
+            while True:
+                match = array_start.search(buffer)
+                if match:
+                    buffer = buffer[match.end():]
+                    break
+                if done:
+                    raise json.JSONDecodeError(f"Missing '{self.key}' array", buffer, 0)
+                # Keep the end of the buffer in case the key is split between chunks
+                chunk, done = read()
+                buffer = buffer[-256:] + chunk
+
+            # Decode one item at a time, reading more of the file when an item is incomplete
+            while True:
+                buffer = buffer.lstrip(' \t\r\n,')
+
+                if buffer.startswith(']'):
+                    return
+
+                try:
+                    if not buffer:
+                        raise json.JSONDecodeError("Incomplete array", buffer, 0)
+                    item, end = decoder.raw_decode(buffer)
+                    # A value that ends the buffer may continue in the next chunk
+                    if end == len(buffer) and not done:
+                        raise json.JSONDecodeError("Incomplete item", buffer, end)
+                except json.JSONDecodeError:
+                    if done:
+                        raise
+                    chunk, done = read()
+                    buffer += chunk
+                    continue
+
+                buffer = buffer[end:]
+                yield item
+
 # ======================================================================================================================================== 
 def process_figure(request, f:str):
     '''
@@ -238,6 +738,12 @@ def remove_image(filename:str):
         else:
             LOGGER.warning(f"The file {file_path} does not exist.")
 
+        # Remove the resized copies along with the original
+        for width in IMAGE_WIDTHS:
+            variant = os.path.join(IMAGE_FOLDER, variant_path(filename, width))
+            if os.path.exists(variant):
+                os.remove(variant)
+
     except OSError as e:
         LOGGER.error(f'Error while removing {filename}: {str(e)}')
 
@@ -261,6 +767,142 @@ def remove_files(files:List[str]):
         except OSError as e:
             LOGGER.error(f'Error while removing {file}: {str(e)}')
 
+# ========================================================================================================================================
+# Functions for highlighting code
+# ========================================================================================================================================
+# Code types whose Prism name differs from the Pygments lexer name
+LEXER_ALIASES = {
+    'markup': 'html',
+    'aspnet': 'aspx-cs',
+}
+
+def highlight_code(code_example:str, code_type:str):
+    '''
+    Highlights a code figure on the server with Pygments, so the browser does not have to
+
+    Parameter(s):
+        code_example (str): the block of code
+        code_type (str): the programming language of the code
+
+    Output(s):
+        str: the code as html spans styled by pygments.css, else None if Pygments is not installed or does not 
+        know the language
+    '''
+    if highlight is None or not code_example or not code_type:
+        return None
+
+    try:
+        name = code_type.strip().lower()
+        lexer = get_lexer_by_name(LEXER_ALIASES.get(name, name), stripnl=False, ensurenl=False)
+        return highlight(code_example, lexer, HtmlFormatter(nowrap=True))
+
+    except ClassNotFound:
+        return None
+
+    except Exception as e:
+        LOGGER.error(f"An error occurred when highlighting {code_type} code: {e}")
+        return None
+
+# ----------------------------------------------------------------------------------------------------------------------------
+# Prism components and the components they require, in the order they must be loaded
+PRISM_FOLDER = os.path.join(PATH, "./static/js/prism")
+PRISM_COMPONENTS = {
+    'markup': [],
+    'css': [],
+    'clike': [],
+    'javascript': ['clike'],
+    'csharp': ['clike'],
+    'aspnet': ['markup', 'csharp'],
+    'c': ['clike'],
+    'cpp': ['c'],
+    'cmake': [],
+    'markup-templating': ['markup'],
+    'django': ['markup-templating'],
+    'docker': [],
+    'git': [],
+    'java': ['clike'],
+    'js-extras': ['javascript'],
+    'json': [],
+    'json5': ['json'],
+    'jsonp': ['json'],
+    'js-templates': ['javascript'],
+    'makefile': [],
+    'markdown': ['markup'],
+    'matlab': [],
+    'python': [],
+    'sql': [],
+}
+# Components loaded along with a language since they extend it
+PRISM_EXTENSIONS = {
+    'javascript': ['js-extras', 'js-templates'],
+}
+# Other names of the Prism components
+PRISM_ALIASES = {
+    'html': 'markup', 'xml': 'markup', 'svg': 'markup', 'mathml': 'markup', 'ssml': 'markup', 'atom': 'markup', 'rss': 'markup',
+    'js': 'javascript',
+    'cs': 'csharp', 'dotnet': 'csharp', 'c#': 'csharp',
+    'c++': 'cpp',
+    'jinja2': 'django',
+    'dockerfile': 'docker',
+    'webmanifest': 'json',
+    'md': 'markdown',
+    'py': 'python',
+}
+
+def prism_languages(flashcards:list):
+    '''
+    Finds the Prism languages needed to highlight the code figures of a page in the browser. Figures highlighted
+    on the server do not need Prism.
+
+    Parameter(s):
+        flashcards (list): the flashcard dictionaries displayed by the page
+
+    Output(s):
+        str: the component names joined by '+', else an empty string if the page needs no highlighting
+    '''
+    languages = set()
+
+    for flashcard in flashcards or []:
+        for f in ('q', 'a'):
+            if flashcard.get(f'{f}_code_example') and not flashcard.get(f'{f}_code_html'):
+                name = (flashcard.get(f'{f}_code_type') or '').strip().lower()
+                name = PRISM_ALIASES.get(name, name)
+                if name in PRISM_COMPONENTS:
+                    languages.add(name)
+
+    return '+'.join(sorted(languages))
+
+# ----------------------------------------------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=64)
+def prism_bundle(languages:str):
+    '''
+    Builds a script with the Prism core and the components of the requested languages and their requirements
+
+    Parameter(s):
+        languages (str): the component names joined by '+'
+
+    Output(s):
+        str: the script, else None if a language is unknown
+    '''
+    names = [name for name in languages.split('+') if name]
+    if not names or any(name not in PRISM_COMPONENTS for name in names):
+        return None
+
+    # Collect the requested components with everything they require or are extended by
+    needed, pending = set(), list(names)
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(PRISM_COMPONENTS[name] + PRISM_EXTENSIONS.get(name, []))
+
+    scripts = []
+    for name in ['core'] + [name for name in PRISM_COMPONENTS if name in needed]:
+        with open(os.path.join(PRISM_FOLDER, f'prism-{name}.js'), encoding='utf-8') as file:
+            scripts.append(file.read())
+
+    return ''.join(scripts)
+
 # ========================================================================================================================================
 # Error Handling
 # ========================================================================================================================================
@@ -282,16 +924,225 @@ def sanitize(text:str):
     '''
     return re.sub(r'[\\/*?:"<>|]', '_', text)
 
+# ========================================================================================================================================
+# Functions for paginating queries
+# ========================================================================================================================================
+def encode_cursor(category:str, id:int):
+    '''
+    Encodes the position of the last item in a page into an opaque url safe cursor
+
+    Parameter(s):
+        category (str): the category of the last item in the page
+        id (int): the primary key of the last item in the page
+
+    Output(s):
+        str: the encoded cursor
+    '''
+    data = json.dumps([category, id]).encode('utf-8')
+    return base64.urlsafe_b64encode(data).decode('ascii')
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def decode_cursor(cursor:str):
+    '''
+    Decodes a cursor created by encode_cursor
+
+    Parameter(s):
+        cursor (str): the encoded cursor
+
+    Output(s):
+        a tuple containing the category and id if the cursor is valid, else None
+    '''
+    try:
+        category, id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+
+        if not isinstance(category, str) or not isinstance(id, int):
+            raise InvalidInput("Malformed cursor!")
+
+        return (category, id)
+
+    except Exception as e:
+        LOGGER.error(f"Invalid cursor {cursor}: {e}")
+        return None
+
+# ----------------------------------------------------------------------------------------------------------------------------
+def get_page_args(request, default_limit:int=50, max_limit:int=500):
+    '''
+    Reads the pagination arguments (?after=&limit=) from the request
+
+    Parameter(s):
+        request (request): the incoming request
+        default_limit (int, default=50): page size used when no limit is given
+        max_limit (int, default=500): the largest page size a client can request
+
+    Output(s):
+        a tuple containing the cursor (str or None) and the page size (int)
+    '''
+    after = request.args.get('after', default=None, type=str) or None
+    limit = request.args.get('limit', default=default_limit, type=int)
+
+    # Keep the page size within bounds
+    limit = max(1, min(limit, max_limit))
+
+    return (after, limit)
+
+# ========================================================================================================================================
+def set_validators(response, etag:str, last_modified=None, weak:bool=False, private:bool=False):
+    '''
+    Adds the validators of a page to its response, the browser keeps the page but revalidates it on every visit.
+    Pages that showed flashed messages are not stored, since the messages are only shown once.
+
+    Parameter(s):
+        response (Response): the response of the page
+        etag (str): the entity tag of the page
+        last_modified (datetime, default=None): the time the page last changed
+        weak (bool, default=False): marks the tag as weak, for pages that are equivalent but not byte identical
+        private (bool, default=False): keeps shared caches from storing the page
+
+    Output(s):
+        response (Response): the same response
+    '''
+    # Messages popped from the session by get_flashed_messages() while the page was rendered
+    if request_ctx and request_ctx.flashes:
+        response.cache_control.no_store = True
+        return response
+
+    response.set_etag(etag, weak=weak)
+    if last_modified:
+        response.last_modified = last_modified
+
+    response.cache_control.no_cache = True
+    if private:
+        response.cache_control.private = True
+
+    return response
+
+# ========================================================================================================================================
+def not_modified(request, etag:str, last_modified=None, weak:bool=False, private:bool=False):
+    '''
+    Checks the conditional headers of a request against the validators of a page before the page is built
+
+    Parameter(s):
+        request (request): the incoming request
+        etag (str): the entity tag of the page
+        last_modified (datetime, default=None): the time the page last changed
+        weak (bool, default=False): marks the tag as weak, for pages that are equivalent but not byte identical
+        private (bool, default=False): keeps shared caches from storing the page
+
+    Output(s):
+        response (Response): an empty 304 response if the client's copy is current, else None
+    '''
+    # Pending flashed messages are shown by building the page
+    if request.method not in ('GET', 'HEAD') or session.get('_flashes'):
+        return None
+
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        return None
+
+    response = current_app.response_class(status=304)
+    return set_validators(response, etag, last_modified, weak=weak, private=private)
+
 # ========================================================================================================================================
 class Cache:
     '''
-    Creates a cache of data to prevent repetitive calls
+    Creates a thread-safe, size-bounded LRU cache of data to prevent repetitive calls. Entries can optionally expire
+    after a time to live (TTL), and hits, misses, and evictions are counted for monitoring.
     '''
-    def __init__(self):
+    def __init__(self, max_size:int=128, ttl:float=None):
+        '''
+        Initializes the cache with an empty ordered dictionary
+
+        Parameter(s):
+            max_size (int, default=128): the maximum number of entries before the least recently used is evicted
+            ttl (float, default=None): seconds an entry stays valid, entries never expire if None
+        '''
+        self.cache = OrderedDict()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------
+    def configure(self, max_size:int=None, ttl:float=None):
+        '''
+        Changes the size and TTL of the cache and drops all the cached entries
+
+        Parameter(s):
+            max_size (int, default=None): the maximum number of entries, unchanged if None
+            ttl (float, default=None): seconds an entry stays valid, entries never expire if None
+        '''
+        with self.lock:
+            if max_size is not None:
+                self.max_size = max_size
+            self.ttl = ttl
+            self.cache.clear()
+
+    # ------------------------------------------------------------
+    def get(self, key, default=None):
+        '''
+        Gets a cached value and marks it as recently used
+
+        Parameter(s):
+            key (hashable): the key of the cached value
+            default (any, default=None): returned if the key is missing or expired
+
+        Output(s):
+            the cached value if it is present and valid, else the default
+        '''
+        with self.lock:
+            entry = self.cache.get(key)
+
+            if entry is None or self._expired(entry):
+                if entry is not None:
+                    del self.cache[key]
+                self.misses += 1
+                return default
+
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    # ------------------------------------------------------------
+    def set(self, key, value):
+        '''
+        Caches a value, evicting the least recently used entries if the cache is full
+
+        Parameter(s):
+            key (hashable): the key of the cached value
+            value (any): the value being cached
+
+        Output(s): None
         '''
-        Initializes the cache with an empty dictionary
+        with self.lock:
+            expires = time.monotonic() + self.ttl if self.ttl else None
+            self.cache[key] = (value, expires)
+            self.cache.move_to_end(key)
+
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+                self.evictions += 1
+
+    # ------------------------------------------------------------
+    def get_or_set(self, key, load):
         '''
-        self.cache = {}
+        Reads through the cache, calling load to fetch and cache the value on a miss
+
+        Parameter(s):
+            key (hashable): the key of the cached value
+            load (callable): function with no arguments that returns the value
+
+        Output(s):
+            the cached or freshly loaded value
+        '''
+        value = self.get(key, _MISSING)
+
+        if value is _MISSING:
+            value = load()
+            self.set(key, value)
+
+        return value
 
     # ------------------------------------------------------------
     def update(self, dict1:dict):
@@ -303,7 +1154,8 @@ class Cache:
 
         Output(s): None
         '''
-        self.cache.update(dict1)
+        for key, value in dict1.items():
+            self.set(key, value)
 
     # ------------------------------------------------------------
     def drop(self, key:str):
@@ -316,14 +1168,61 @@ class Cache:
         Output(s):
             Raises a keyError if an error occurs, else None
         '''
-        if key in self.cache:
-            self.cache.pop(key)
-        else:
-            raise KeyError(f"Key '{key}' not found in cache")
+        with self.lock:
+            if key in self.cache:
+                self.cache.pop(key)
+            else:
+                raise KeyError(f"Key '{key}' not found in cache")
+
+    # ------------------------------------------------------------
+    def drop_if(self, predicate):
+        '''
+        Drops every key element that matches the predicate
+
+        Parameter(s):
+            predicate (callable): function taking a key and returning True if it should be dropped
+
+        Output(s): None
+        '''
+        with self.lock:
+            for key in [key for key in self.cache if predicate(key)]:
+                del self.cache[key]
 
     # ------------------------------------------------------------
     def clear(self):
         '''
         Resets the cache to an empty dictionary
         '''
-        self.cache = {}
\ No newline at end of file
+        with self.lock:
+            self.cache.clear()
+
+    # ------------------------------------------------------------
+    def stats(self):
+        '''
+        Gets the cache counters
+
+        Output(s):
+            response (dict): the size of the cache and its hit, miss, and eviction counts
+        '''
+        with self.lock:
+            return {
+                'size': len(self.cache),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    # ------------------------------------------------------------
+    def _expired(self, entry:tuple):
+        '''
+        Checks if a cache entry has passed its expiry time
+        '''
+        return entry[1] is not None and entry[1] <= time.monotonic()
+
+    # ------------------------------------------------------------
+    def __len__(self):
+        return len(self.cache)
+
+# Sentinel used to tell a cached None apart from a miss
+_MISSING = object()
@@ -1,10 +1,15 @@
-import unittest, click
+import unittest, click, time, os, sys, tempfile
+from flask import current_app
 from flask.cli import FlaskGroup
 
 import app
-from app.utils import LOGGER, from_json
+from app.utils import LOGGER, DATA_FOLDER, from_json, JSONStream, write_json_stream, remove_image
+from app.importer import import_cards
 from app.extensions import db
-from app.models.flashcard_model import FlashcardModel, FigureModel
+from app.models.flashcard_model import FlashcardModel, FigureModel, rebuild_category_counts, rebuild_code_html, export_cards, find_orphaned_images, find_dangling_figures
+from app.models.deletion_model import drain_image_deletions
+from app.jobs import run_worker
+from app.models.search_model import rebuild_search_index
 
 cli = FlaskGroup(app)
 
@@ -41,6 +46,64 @@ def init_database():
         LOGGER.error(f"An error occurred when initializing database: {e}")
         return 1
 # ============================================================================================================== 
+@cli.command("rebuild_category_counts")
+def rebuild_counts():
+    '''
+    Rebuilds the category card counts from the flashcards table
+    '''
+    try:
+        print("Rebuilding Category Counts ...")
+        counts = rebuild_category_counts()
+
+        for category, count in counts.items():
+            print(f"{category}: {count}")
+
+        print("Successfully rebuilt the category counts!")
+        LOGGER.info(f"Successfully rebuilt the category counts!")
+        return 0
+    
+    except Exception as e:
+        print(f"Failed to rebuild the category counts: {e}")
+        LOGGER.error(f"An error occurred when rebuilding the category counts: {e}")
+        return 1
+# ============================================================================================================== 
+@cli.command("rebuild_search_index")
+def rebuild_search():
+    '''
+    Rebuilds the full-text search index from the flashcards and figures tables
+    '''
+    try:
+        print("Rebuilding Search Index ...")
+        count = rebuild_search_index()
+
+        print(f"Successfully indexed {count} flashcards!")
+        LOGGER.info(f"Successfully indexed {count} flashcards!")
+        return 0
+    
+    except Exception as e:
+        print(f"Failed to rebuild the search index: {e}")
+        LOGGER.error(f"An error occurred when rebuilding the search index: {e}")
+        return 1
+# ============================================================================================================== 
+@cli.command("rebuild_code_html")
+@click.option('--batch-size', default=1000, show_default=True, help='Number of figures highlighted per transaction')
+def rebuild_highlighting(batch_size):
+    '''
+    Highlights the code figures on the server again, figures Pygments cannot highlight are left to the browser
+    '''
+    try:
+        print("Highlighting Code Figures ...")
+        count = rebuild_code_html(batch_size=batch_size)
+
+        print(f"Successfully highlighted {count} code figures!")
+        LOGGER.info(f"Successfully highlighted {count} code figures!")
+        return 0
+
+    except Exception as e:
+        print(f"Failed to highlight the code figures: {e}")
+        LOGGER.error(f"An error occurred when highlighting the code figures: {e}")
+        return 1
+# ============================================================================================================== 
 @cli.command("test")
 def test():
     '''
@@ -104,7 +167,7 @@ def test_forms(form_name):
 @click.argument('model_name', required=False)
 def test_models(model_name):
     '''
-    Runs the unit tests for models: FlashcardModel, FigureModel
+    Runs the unit tests for models: FlashcardModel, FigureModel, CategoryModel, Search, JobModel
     '''
     if not model_name:
         tests = unittest.TestLoader().discover("tests/test_models")
@@ -112,6 +175,12 @@ def test_models(model_name):
         tests = unittest.TestLoader().discover("tests/test_models", pattern="test_flashcard_model.py")
     elif model_name == 'figure':
         tests = unittest.TestLoader().discover("tests/test_models", pattern="test_figure_model.py")
+    elif model_name == 'category':
+        tests = unittest.TestLoader().discover("tests/test_models", pattern="test_category_model.py")
+    elif model_name == 'search':
+        tests = unittest.TestLoader().discover("tests/test_models", pattern="test_search_model.py")
+    elif model_name == 'job':
+        tests = unittest.TestLoader().discover("tests/test_models", pattern="test_job_model.py")
     else:
         print(f"Invalid argument: {model_name}!")
         return 1
@@ -125,41 +194,181 @@ def test_models(model_name):
 # ============================================================================================================== 
 @cli.command("import_json")
 @click.argument('filename', required=False)
-def import_json(filename):
+@click.option('--batch-size', default=1000, show_default=True, help='Number of flashcards written per transaction')
+@click.option('--stream', is_flag=True, help='Parse the file incrementally instead of loading it into memory')
+@click.option('--workers', default=1, show_default=True, help='Number of processes validating cards, the database has one writer')
+def import_json(filename, batch_size, stream, workers):
     '''
-    Runs the unit tests for models: FlashcardModel, FigureModel
+    Imports the flashcards in a JSON file into the database
     '''
     try:
-        if not filename:
-            # NOTE: file must be in the data directory and named data.json
-            print("Importing JSON File: data.json ...")
-            LOGGER.info("Importing JSON File: data.json ...")
-            data = from_json()
+        # NOTE: file must be in the data directory and named data.json if no filename is given
+        filename = filename or os.path.join(DATA_FOLDER, "data.json")
+        print(f"Importing JSON File: {filename} ...")
+        LOGGER.info(f"Importing JSON File: {filename} ...")
+
+        start = time.perf_counter()
+
+        if stream:
+            data = JSONStream(filename=filename)
+            # Progress is measured by the bytes read since the number of cards is unknown
+            fraction = lambda count: data.bytes_read / data.total_bytes if data.total_bytes else 1
         else:
-            print(f"Importing JSON File: {filename} ...")
-            LOGGER.info(f"Importing JSON File: {filename} ...")
             data = from_json(filename=filename)
+            fraction = lambda count: count / len(data) if data else 1
 
-        for card in data:
-            FlashcardModel(
-                category=card['category'],
-                question=card['question'],
-                answer=card['answer'],
-                q_code_type=card['q_code_type'],
-                q_code_example=card['q_code_block'],
-                a_code_type=card['a_code_type'],
-                a_code_example=card['a_code_block'],
-            )
-
-        print(f"Successfully imported JSON file.")
-        LOGGER.info(f"Successfully imported JSON file.")
-        return 0
+        def report(summary):
+            count = sum(summary[name] for name in ('inserted', 'updated', 'unchanged', 'duplicates')) + len(summary['errors'])
+            elapsed = time.perf_counter() - start
+            done = fraction(count)
+            eta = elapsed / done - elapsed if done else 0
+            print(f"\rProcessed {count} flashcards ({done:.1%}) {count / elapsed:,.0f} rows/sec, ETA {eta:.0f}s", end='', flush=True)
+
+        # Cards are matched on their key, so re-importing a file only writes the cards that changed
+        summary = import_cards(
+            data,
+            write=lambda cards: FlashcardModel.bulk_upsert(cards, batch_size=batch_size),
+            workers=workers,
+            chunk_size=batch_size,
+            progress=report
+        )
+        count = summary['inserted'] + summary['updated'] + summary['unchanged']
+        elapsed = time.perf_counter() - start
+
+        rate = count / elapsed if elapsed > 0 else 0
+        result = f"{summary['inserted']} inserted, {summary['updated']} updated, {summary['unchanged']} unchanged"
+        print(f"\nSuccessfully imported {count} flashcards ({result}) in {elapsed:.2f}s ({rate:,.0f} rows/sec).")
+        LOGGER.info(f"Successfully imported {count} flashcards ({result}) in {elapsed:.2f}s ({rate:,.0f} rows/sec).")
+
+        if summary['duplicates']:
+            print(f"Skipped {summary['duplicates']} duplicate flashcards.")
+
+        # Errors are reported in the order of the cards in the file
+        for position, message in summary['errors']:
+            print(f"Skipped card {position}: {message}")
+
+        return 1 if summary['errors'] else 0
     
     except Exception as e:
-        print(f"Failed to import JSON file: {e}")
+        print(f"\nFailed to import JSON file: {e}")
         LOGGER.error(f"Failed to import JSON file: {e}")
         return 1
+# ============================================================================================================== 
+@cli.command("export_json")
+@click.argument('filename', required=False)
+@click.option('--ndjson', is_flag=True, help='Write one flashcard per line instead of a JSON object')
+@click.option('--chunk-size', default=1000, show_default=True, help='Number of rows read from the database at a time')
+def export_json(filename, ndjson, chunk_size):
+    '''
+    Exports the flashcards to a JSON file in the format read by import_json, writes to stdout if no filename is given
+    '''
+    try:
+        start = time.perf_counter()
+        cards = export_cards(chunk_size=chunk_size)
+
+        if not filename or filename == '-':
+            count = write_json_stream(cards, sys.stdout, ndjson=ndjson)
+            LOGGER.info(f"Successfully exported {count} flashcards to stdout")
+            return 0
+
+        # Write to a temporary file in the same directory so a failed export never replaces a good backup
+        directory = os.path.dirname(os.path.abspath(filename))
+        file, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(file, 'w', encoding='utf-8') as f:
+                count = write_json_stream(cards, f, ndjson=ndjson)
+            os.replace(temp_path, filename)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed if elapsed > 0 else 0
+        print(f"Successfully exported {count} flashcards to {filename} in {elapsed:.2f}s ({rate:,.0f} rows/sec).")
+        LOGGER.info(f"Successfully exported {count} flashcards to {filename} in {elapsed:.2f}s.")
+        return 0
+    
+    except Exception as e:
+        print(f"Failed to export JSON file: {e}", file=sys.stderr)
+        LOGGER.error(f"Failed to export JSON file: {e}")
+        return 1
+
+# ============================================================================================================== 
+@cli.command("gc_images")
+@click.option('--dry-run', is_flag=True, help='Report the orphaned files without removing them')
+@click.option('--batch-size', default=1000, show_default=True, help='Number of files checked and removed at a time')
+@click.option('--min-age', default=3600, show_default=True, help='Seconds since a file was modified before it can be removed')
+def gc_images(dry_run, batch_size, min_age):
+    '''
+    Removes stored images that no figure references and reports figures whose image file is missing
+    '''
+    try:
+        start = time.perf_counter()
+        orphaned = 0
+
+        # Finish deletions queued by writes that were interrupted before the queue was drained
+        if not dry_run:
+            print("Removing Queued Images ...")
+            print(f"Handled {drain_image_deletions(batch_size=batch_size)} queued deletions")
+
+        print("Finding Orphaned Images ...")
+        for batch in find_orphaned_images(batch_size=batch_size, min_age=min_age):
+            for filename in batch:
+                if dry_run:
+                    print(f"Orphaned: {filename}")
+                else:
+                    remove_image(filename)
+            orphaned += len(batch)
 
+        print("Finding Missing Images ...")
+        dangling = 0
+        for id, filename in find_dangling_figures(chunk_size=batch_size):
+            print(f"Figure {id} references missing image {filename}")
+            dangling += 1
+
+        elapsed = time.perf_counter() - start
+        action = "Found" if dry_run else "Removed"
+        print(f"{action} {orphaned} orphaned images and found {dangling} figures with missing images in {elapsed:.2f}s.")
+        LOGGER.info(f"{action} {orphaned} orphaned images and found {dangling} figures with missing images.")
+        return 0
+
+    except Exception as e:
+        print(f"Failed to collect orphaned images: {e}", file=sys.stderr)
+        LOGGER.error(f"Failed to collect orphaned images: {e}")
+        return 1
+
+# ============================================================================================================== 
+@cli.command("worker")
+@click.option('--burst', is_flag=True, help='Stop once the queue is empty instead of waiting for more jobs')
+@click.option('--poll-interval', default=1.0, show_default=True, help='Seconds between checks of an empty queue')
+def worker(burst, poll_interval):
+    '''
+    Runs the background jobs queued by the web app
+    '''
+    try:
+        config = current_app.config
+        print("Starting Worker ...")
+        LOGGER.info("Starting worker")
+
+        count = run_worker(
+            poll_interval=poll_interval,
+            visibility_timeout=config['JOB_VISIBILITY_TIMEOUT'],
+            retry_delay=config['JOB_RETRY_DELAY'],
+            burst=burst
+        )
+
+        print(f"Successfully ran {count} jobs!")
+        LOGGER.info(f"Worker stopped after running {count} jobs")
+        return 0
+
+    except KeyboardInterrupt:
+        print("Stopping Worker ...")
+        return 0
+
+    except Exception as e:
+        print(f"Worker failed: {e}", file=sys.stderr)
+        LOGGER.error(f"Worker failed: {e}")
+        return 1
 
 
 if __name__ == "__main__":
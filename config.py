@@ -15,6 +15,42 @@ Configuration Variables:
 FLASK_DEBUG: provides logging for debugging purposes
 SECRET_KEY: strings used to encrypt sensitive data
 SERVER_NAME: app's domian name
+CARDS_PER_PAGE: number of flashcards in a page when no limit is requested
+MAX_CARDS_PER_PAGE: largest page of flashcards a client can request
+DECK_CACHE_SIZE: number of deck queries kept in the in-process cache
+DECK_CACHE_TTL: seconds a cached deck query is kept, queries are keyed on the deck versions so writes by other
+    worker processes are seen by the next read
+FRAGMENT_CACHE_SIZE: number of rendered card fragments kept in the in-process cache
+PAGE_CACHE: serves the pages of the main blueprint from the in-process response cache
+PAGE_CACHE_SIZE: number of responses kept in the page cache
+PAGE_CACHE_MAX_BYTES: total size of the responses kept in the page cache
+PAGE_CACHE_TTL: seconds a cached page is served before it is rebuilt, pages are rebuilt after any deck write
+PAGE_CACHE_STALE_TTL: seconds past the TTL a cached page is served while a background thread rebuilds it
+PAGE_CACHE_REFRESH_AHEAD: seconds before the TTL a requested page starts being rebuilt in the background
+METRICS: records request latency, SQL statements, template render time, and cache counters, served at /metrics
+SLOW_QUERY_THRESHOLD: seconds a statement can take before it is logged with its query plan, None disables the log
+N_PLUS_ONE_THRESHOLD: number of times a request can issue the same statement before it is logged, None disables
+    the check
+N_PLUS_ONE_RAISE: raises a RepeatedQueryError when a request goes over N_PLUS_ONE_THRESHOLD
+PROFILING: profiles requests that carry PROFILE_SECRET in the X-Profile header or the _profile query argument
+PROFILE_SECRET: the secret that turns on profiling for a request, profiling stays off without one
+PROFILE_FOLDER: directory the collapsed stacks, speedscope files, and top function tables are written to
+PROFILE_TOP: number of functions in the table of a profile
+PROFILE_INTERVAL: seconds between the stack samples of a profiled request
+MAX_IMAGE_SIZE: largest accepted image upload in bytes, larger uploads are rejected while they are received
+DELETE_FILES_ASYNC: removes released images in a background thread after the commit instead of in the request
+IMAGE_RELEASE_MIN_AGE: released images modified less than this many seconds before their release are kept, since
+    an upload of the same image may not have committed its figure yet. gc_images removes them later if it never does
+BACKGROUND_JOBS: queues image processing and file removal as jobs for the worker command instead of running
+    them in threads of the web process
+JOB_VISIBILITY_TIMEOUT: seconds a claimed job is hidden from other workers before it is retried
+JOB_RETRY_DELAY: seconds before the first retry of a failed job, doubled on every attempt
+IMAGE_CACHE_MAX_AGE: seconds browsers may cache uploaded images, which are immutable once stored
+IMAGE_FALLBACK_MAX_AGE: seconds browsers may cache a larger copy served while the copy for the requested width
+    is being created
+USE_X_SENDFILE: lets a proxy that supports X-Sendfile (Apache, lighttpd) send uploaded images
+IMAGE_ACCEL_REDIRECT: nginx internal location mapped to the image directory, images are sent with
+    X-Accel-Redirect when set
 
 More Info:
 https://flask.palletsprojects.com/en/3.0.x/config/
@@ -40,6 +76,54 @@ class Config:
     UPLOAD_FOLDER = path.join(BASEDIR, 'app/uploads/images')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16 MB max size for uploaded files
 
+    # Pagination
+    CARDS_PER_PAGE = 50
+    MAX_CARDS_PER_PAGE = 500
+
+    # Deck query cache
+    DECK_CACHE_SIZE = 256
+    DECK_CACHE_TTL = 300
+
+    # Rendered card cache, fragments are keyed on a digest of the card data so they never go stale
+    FRAGMENT_CACHE_SIZE = 4096
+
+    # Response cache of the main blueprint, pages are keyed by URL and deck version
+    PAGE_CACHE = True
+    PAGE_CACHE_SIZE = 512
+    PAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    PAGE_CACHE_TTL = 60
+    PAGE_CACHE_STALE_TTL = 300
+    PAGE_CACHE_REFRESH_AHEAD = 10
+
+    # Prometheus metrics
+    METRICS = environ.get('METRICS', 'true').lower() in ('1', 'true')
+
+    # Query analysis
+    SLOW_QUERY_THRESHOLD = 0.1
+    N_PLUS_ONE_THRESHOLD = 10
+    N_PLUS_ONE_RAISE = False
+
+    # Request profiling
+    PROFILING = environ.get('PROFILING', '').lower() in ('1', 'true')
+    PROFILE_SECRET = environ.get('PROFILE_SECRET')
+    PROFILE_FOLDER = path.join(BASEDIR, 'logs/profiles')
+    PROFILE_TOP = 30
+    PROFILE_INTERVAL = 0.001
+
+    # Uploaded images
+    MAX_IMAGE_SIZE = 8 * 1024 * 1024
+    DELETE_FILES_ASYNC = True
+    IMAGE_RELEASE_MIN_AGE = 3600
+
+    # Background jobs
+    BACKGROUND_JOBS = environ.get('BACKGROUND_JOBS', '').lower() in ('1', 'true')
+    JOB_VISIBILITY_TIMEOUT = 300
+    JOB_RETRY_DELAY = 10
+    IMAGE_CACHE_MAX_AGE = 365 * 24 * 60 * 60
+    IMAGE_FALLBACK_MAX_AGE = 60
+    USE_X_SENDFILE = environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true')
+    IMAGE_ACCEL_REDIRECT = environ.get('IMAGE_ACCEL_REDIRECT')
+
     SECRET_KEY = environ.get('SECRET_KEY') or 'df0331cefc6c2b9a5dserknvwier726a5d1c0fd37324feba25506'
 
     # Database
@@ -70,5 +154,11 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
     WTF_CSRF_ENABLED = False
+    # Removes released images before returning so tests can check the files
+    DELETE_FILES_ASYNC = False
+    IMAGE_RELEASE_MIN_AGE = 0
+    BACKGROUND_JOBS = False
+    # Fails the test of a route that queries per card
+    N_PLUS_ONE_RAISE = True
     SQLALCHEMY_DATABASE_URI = environ.get('TEST_DATABASE_URI')\
         or 'sqlite:///' + path.join(BASEDIR, './data/app_test.db')
\ No newline at end of file
@@ -1,12 +1,34 @@
 from flask_testing import TestCase
+from contextlib import contextmanager
+from sqlalchemy import event
 
 from app import init_app
 
 from app.utils import remove_image
-from app.extensions import db
+from app.extensions import db, deck_cache, fragment_cache, page_cache
 from app.models.flashcard_model import FlashcardModel, FigureModel
 
 
+@contextmanager
+def count_queries():
+    '''
+    Records every SQL statement executed on the database engine while the context is open
+
+    Output(s):
+        statements (list): the executed SQL statements
+    '''
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
 class BaseTestCase(TestCase):
     '''
     Creates a base test class for test cases
@@ -20,12 +42,31 @@ class BaseTestCase(TestCase):
         # Set up the database
         self.client = self.app.test_client()
         db.create_all()  
+        deck_cache.clear()
+        fragment_cache.clear()
+        page_cache.clear()
 
     def tearDown(self):
         # Tear down the database
         db.session.remove()
         db.drop_all()
 
+    def create_test_deck(self, size:int, category:str='Test Category'):
+        # Populates the database with cards that have both question and answer figures
+        for i in range(size):
+            FlashcardModel(
+                category=category,
+                question=f'Is this test question {i}?',
+                answer=f'This is test answer {i}.',
+                q_code_type='python',
+                q_code_example=f"print('Test Question Example {i}')",
+                a_code_type='python',
+                a_code_example=f"print('Test Answer Example {i}')"
+            )
+
+        db.session.remove()
+
+
 class RouteTestCase(BaseTestCase):
     '''
     Creates a base test class for routes
@@ -54,4 +95,3 @@ class RouteTestCase(BaseTestCase):
 
         db.session.flush()
         db.session.commit()
-        
\ No newline at end of file
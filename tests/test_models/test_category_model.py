@@ -0,0 +1,143 @@
+import unittest
+
+from tests.base_test import BaseTestCase
+
+from app.extensions import db
+from app.models.category_model import CategoryModel as cm, get_deck_versions
+from app.models.flashcard_model import FlashcardModel as fm, view_all_categories, rebuild_category_counts, rebuild_code_html
+
+class Test_Category_Counts(BaseTestCase):
+    '''Tests the category counts maintained by the flashcard model'''
+
+    def test_1_category_counts(self):
+        '''
+        Tests creating flashcards increments the category count
+        '''
+        self.create_test_deck(3, category='Test Category')
+        self.create_test_deck(2, category='Other Category')
+
+        self.assertTrue(view_all_categories() == {'Other Category': 2, 'Test Category': 3})
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_category_counts(self):
+        '''
+        Tests changing the category of a flashcard moves it between counts
+        '''
+        flashcard = fm(
+            category='Old Test Category',
+            question='Is this a test question?',
+            answer='This is an answer example.'
+        )
+
+        flashcard.update(
+            category='New Test Category',
+            question='Is this a test question?',
+            answer='This is an answer example.'
+        )
+
+        self.assertTrue(view_all_categories() == {'New Test Category': 1})
+        self.assertTrue(cm.query.filter_by(name='Old Test Category').one().card_count == 0)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_category_counts(self):
+        '''
+        Tests deleting a flashcard decrements the category count
+        '''
+        self.create_test_deck(2, category='Test Category')
+
+        flashcard = fm.query.filter_by(category='Test Category').first()
+        flashcard.delete()
+
+        self.assertTrue(view_all_categories() == {'Test Category': 1})
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_category_counts(self):
+        '''
+        Tests a failed flashcard does not change the category count
+        '''
+        with self.assertRaises(Exception):
+            fm(category='Test Category', question='Is this a test question?')
+
+        self.assertTrue(view_all_categories() == {})
+
+
+class Test_Category_Rebuild(BaseTestCase):
+    '''Tests rebuilding the category counts'''
+
+    def test_1_category_rebuild(self):
+        '''
+        Tests rebuilding corrects drifted counts
+        '''
+        self.create_test_deck(3, category='Test Category')
+
+        category = cm.query.filter_by(name='Test Category').one()
+        category.card_count = 10
+        db.session.add(cm(name='Empty Category', card_count=4))
+        db.session.commit()
+
+        counts = rebuild_category_counts()
+
+        self.assertTrue(counts == {'Test Category': 3})
+        self.assertTrue(cm.query.filter_by(name='Empty Category').one().card_count == 0)
+        self.assertTrue(view_all_categories() == {'Test Category': 3})
+
+
+class Test_Deck_Versions(BaseTestCase):
+    '''Tests the category and deck versions bumped by the flashcard writes'''
+
+    def test_1_deck_versions(self):
+        '''
+        Tests creating flashcards bumps their category and the deck
+        '''
+        self.assertTrue(get_deck_versions('Test Category') == (0, 0, None))
+
+        self.create_test_deck(2, category='Test Category')
+        self.create_test_deck(1, category='Other Category')
+
+        category_version, deck_version, updated_at = get_deck_versions('Test Category')
+        self.assertTrue(category_version == 2)
+        self.assertTrue(deck_version == 3)
+        self.assertTrue(updated_at is not None)
+        self.assertTrue(get_deck_versions('Other Category')[0] == 1)
+        self.assertTrue(get_deck_versions()[0] == 3)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_deck_versions(self):
+        '''
+        Tests updating and deleting a flashcard bumps the categories it leaves and joins
+        '''
+        flashcard = fm(category='Old Category', question='Question?', answer='Answer.', a_code_type='python', a_code_example="print('Old')")
+        flashcard.update(category='New Category', question='Question?', answer='Answer.', a_code_type='python', a_code_example="print('New')")
+
+        self.assertTrue(get_deck_versions('Old Category')[0] == 2)
+        self.assertTrue(get_deck_versions('New Category')[0] >= 1)
+
+        new_version = get_deck_versions('New Category')[0]
+        flashcard.answer_figure.update(code_type='python', code_example="print('Figure')")
+        self.assertTrue(get_deck_versions('New Category')[0] == new_version + 1)
+
+        flashcard.delete()
+        self.assertTrue(get_deck_versions('New Category')[0] == new_version + 2)
+        self.assertTrue(get_deck_versions('Old Category')[0] == 2)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_deck_versions(self):
+        '''
+        Tests the rebuild commands bump every category
+        '''
+        self.create_test_deck(1, category='Test Category')
+        self.create_test_deck(1, category='Other Category')
+
+        rebuild_category_counts()
+        rebuild_code_html()
+
+        self.assertTrue(get_deck_versions('Test Category')[:2] == (3, 4))
+        self.assertTrue(get_deck_versions('Other Category')[0] == 3)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_deck_versions(self):
+        '''
+        Tests a failed flashcard does not bump the versions
+        '''
+        with self.assertRaises(Exception):
+            fm(category='Test Category', question='Is this a test question?')
+
+        self.assertTrue(get_deck_versions('Test Category') == (0, 0, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
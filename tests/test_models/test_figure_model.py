@@ -2,7 +2,10 @@ import unittest
 
 from tests.base_test import BaseTestCase
 
-from app.models.flashcard_model import FigureModel as fm
+from app import utils
+from app.extensions import db
+from app.utils import highlight_code
+from app.models.flashcard_model import FigureModel as fm, rebuild_code_html
 
 class Test_Figure_Model(BaseTestCase):
     '''Test the constructor method within the figure model'''
@@ -136,4 +139,37 @@ class Test_Figure_Delete(BaseTestCase):
         figure.delete()
 
         db_figure = fm.query.get(figure.id)
-        self.assertTrue(db_figure == None)
\ No newline at end of file
+        self.assertTrue(db_figure == None)
+
+@unittest.skipIf(utils.highlight is None, "Pygments is not installed")
+class Test_Figure_Highlighting(BaseTestCase):
+    '''Tests code figures are highlighted on the server'''
+
+    def test_1_figure_highlighting(self):
+        '''
+        Tests the highlighted code is stored with the figure and escaped
+        '''
+        figure = fm(code_type='python', code_example="print('<b>')")
+
+        self.assertTrue('<span class="nb">print</span>' in figure.code_html)
+        self.assertTrue('&lt;b&gt;' in figure.code_html)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_figure_highlighting(self):
+        '''
+        Tests the highlighted code is replaced on update and rebuilt by rebuild_code_html
+        '''
+        figure = fm(code_type='python', code_example="print('Code')")
+        figure.update(code_type='javascript', code_example="let value = 1;")
+        self.assertTrue('<span class="kd">let</span>' in figure.code_html)
+
+        figure.code_html = None
+        db.session.commit()
+        self.assertTrue(rebuild_code_html() == 1)
+        self.assertTrue('<span class="kd">let</span>' in figure.code_html)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_figure_highlighting(self):
+        '''
+        Tests languages Pygments does not know are left to the browser
+        '''
+        self.assertTrue(highlight_code("code", 'not-a-language') == None)
+        self.assertTrue(highlight_code("<p>Text</p>", 'markup') != None)
@@ -2,7 +2,11 @@ import unittest
 
 from tests.base_test import BaseTestCase
 
-from app.models.flashcard_model import FlashcardModel as fm
+from app.extensions import db
+from sqlalchemy import text
+from app.importer import import_cards
+
+from app.models.flashcard_model import FlashcardModel as fm, get_flashcard, view_cards_page, view_all_cards, view_all_categories, export_cards
 
 class Test_Flashcard_Model(BaseTestCase):
     '''Test the constructor method within the Flashcard model'''
@@ -313,4 +317,185 @@ class Test_Flashcard_Delete(BaseTestCase):
         flashcard.delete()
 
         db_flashcard = fm.query.get(flashcard.id)
-        self.assertTrue(db_flashcard == None)
\ No newline at end of file
+        self.assertTrue(db_flashcard == None)
+
+
+class Test_Flashcard_Pages(BaseTestCase):
+    '''Tests the keyset pagination of flashcards'''
+
+    def test_1_flashcard_pages(self):
+        '''Test paging through every card with the returned cursors'''
+        self.create_test_deck(3, category='B Category')
+        self.create_test_deck(4, category='A Category')
+
+        ids, after = [], None
+        while True:
+            page = view_cards_page(after=after, limit=3)
+            self.assertTrue(len(page['flashcards']) <= 3)
+            ids += [(card['category'], card['id']) for card in page['flashcards']]
+
+            after = page['next']
+            if not after:
+                break
+
+        self.assertTrue(len(ids) == 7)
+        self.assertTrue(ids == sorted(ids))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_flashcard_pages(self):
+        '''Test paging through a single category'''
+        self.create_test_deck(3, category='B Category')
+        self.create_test_deck(4, category='A Category')
+
+        page = view_cards_page(category='B Category', limit=2)
+        self.assertTrue(len(page['flashcards']) == 2)
+        self.assertFalse(page['next'] == None)
+
+        page = view_cards_page(category='B Category', after=page['next'], limit=2)
+        self.assertTrue(len(page['flashcards']) == 1)
+        self.assertTrue(page['flashcards'][0]['category'] == 'B Category')
+        self.assertTrue(page['next'] == None)
+
+
+class Test_Flashcard_Bulk_Create(BaseTestCase):
+    '''Tests the bulk insert of flashcards'''
+
+    def test_1_flashcard_bulk_create(self):
+        '''Test inserting cards with figures across several batches'''
+        cards = ({
+            'category': 'Test Category',
+            'question': f'Is this test question {i}?',
+            'answer': f'This is test answer {i}.',
+            'q_code_type': 'python' if i % 2 else None,
+            'q_code_example': f"print('Question {i}')" if i % 2 else None,
+            'a_code_type': 'python',
+            'a_code_example': f"print('Answer {i}')"
+        } for i in range(7))
+
+        count = fm.bulk_create(cards, batch_size=3)
+
+        self.assertTrue(count == 7)
+        self.assertTrue(view_all_categories() == {'Test Category': 7})
+
+        flashcards = view_all_cards(category='Test Category')
+        self.assertTrue(flashcards[1]['q_code_example'] == "print('Question 1')")
+        self.assertTrue(flashcards[2]['q_code_example'] == None)
+        self.assertTrue(flashcards[6]['a_code_example'] == "print('Answer 6')")
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_flashcard_bulk_create(self):
+        '''Test an invalid card rolls back its batch but keeps earlier batches'''
+        cards = [{'category': 'Test Category', 'question': 'Question?', 'answer': 'Answer.'}] * 2
+        cards += [{'category': 'Test Category', 'question': 'Question?'}]
+
+        with self.assertRaises(Exception) as context:
+            fm.bulk_create(cards, batch_size=2)
+
+        self.assertTrue("No answer inputs!" in str(context.exception))
+        self.assertTrue(view_all_categories() == {'Test Category': 2})
+
+
+class Test_Flashcard_Bulk_Upsert(BaseTestCase):
+    '''Tests synchronizing flashcards keyed on their external key'''
+
+    def make_card(self, key:int, answer:str):
+        return {
+            'key': key,
+            'category': 'Test Category',
+            'question': f'Is this test question {key}?',
+            'answer': answer,
+            'content_hash': f'{key}-{answer}'
+        }
+
+    def test_1_flashcard_bulk_upsert(self):
+        '''Test re-importing only writes new and changed cards'''
+        cards = [self.make_card(i, 'Old answer.') for i in range(4)]
+        response = fm.bulk_upsert(cards, batch_size=3)
+        self.assertTrue(response == {'inserted': 4, 'updated': 0, 'unchanged': 0})
+
+        cards[1] = self.make_card(1, 'New answer.')
+        cards.append(self.make_card(4, 'Old answer.'))
+        response = fm.bulk_upsert(cards, batch_size=3)
+        self.assertTrue(response == {'inserted': 1, 'updated': 1, 'unchanged': 3})
+
+        flashcard = fm.query.filter_by(external_key='1').one()
+        self.assertTrue(flashcard.answer == 'New answer.')
+        self.assertTrue(flashcard.content_hash == '1-New answer.')
+        self.assertTrue(view_all_categories() == {'Test Category': 5})
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_flashcard_bulk_upsert(self):
+        '''Test a key repeated in a later chunk of an import is matched by the upsert instead of inserted again'''
+        cards = [{'key': i, 'category': 'Test Category', 'question': f'Question {i}?', 'answer': 'Answer.'} for i in range(4)]
+        cards.append(dict(cards[0]))
+
+        summary = import_cards(cards, write=fm.bulk_upsert, chunk_size=2)
+
+        self.assertTrue(summary['inserted'] == 4 and summary['unchanged'] == 1 and summary['duplicates'] == 0)
+        self.assertTrue(view_all_categories() == {'Test Category': 4})
+
+
+class Test_Flashcard_Export(BaseTestCase):
+    '''Tests exporting flashcards in the import format'''
+
+    def test_1_flashcard_export(self):
+        '''Test the exported cards include their figures and keys'''
+        fm.bulk_create([{
+            'key': 22,
+            'category': 'Test Category',
+            'question': 'Is this a test question?',
+            'answer': 'This is a test answer.',
+            'a_code_type': 'python',
+            'a_code_example': "print('Answer')"
+        }])
+        self.create_test_deck(2)
+
+        cards = list(export_cards(chunk_size=1))
+
+        self.assertTrue(len(cards) == 3)
+        self.assertTrue(cards[0]['key'] == '22')
+        self.assertTrue(cards[0]['a_code_block'] == "print('Answer')")
+        self.assertTrue(cards[0]['q_code_block'] == None)
+        self.assertTrue(len(cards[1]['key']) == 32 and cards[1]['key'] != cards[2]['key'])
+        self.assertTrue(cards[1]['q_code_type'] == 'python')
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_flashcard_export(self):
+        '''Test an export of imported and added cards is re-imported without losing cards'''
+        cards = [{'key': key, 'category': 'Test Category', 'question': f'Question {key}?', 'answer': 'Answer.'} for key in (3, 5)]
+        import_cards(cards, write=fm.bulk_upsert)
+        # Gets id 3, the key of the first imported card
+        self.create_test_deck(1)
+
+        exported = list(export_cards())
+        self.assertTrue([card['key'] for card in exported][:2] == ['3', '5'])
+
+        db.drop_all()
+        db.create_all()
+
+        summary = import_cards(exported, write=fm.bulk_upsert)
+        self.assertTrue(summary['inserted'] == 3 and summary['duplicates'] == 0)
+        self.assertTrue(view_all_categories() == {'Test Category': 3})
+
+        summary = import_cards(exported, write=fm.bulk_upsert)
+        self.assertTrue(summary['inserted'] == 0 and summary['unchanged'] == 3)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_flashcard_export(self):
+        '''Test an export re-imported into the same database leaves every card unchanged'''
+        cards = [{'key': key, 'category': 'Test Category', 'question': f'Question {key}?', 'answer': 'Answer.'} for key in ('007', '²')]
+        import_cards(cards, write=fm.bulk_upsert)
+        self.create_test_deck(2)
+        # Edited in the app, so the stored hash no longer matches its content
+        get_flashcard(1).update(category='Test Category', question='Edited question?', answer='Answer.')
+        # Written before every card was given a key
+        db.session.execute(text("UPDATE flashcards SET external_key = NULL WHERE id = 4"))
+        db.session.commit()
+
+        before = [get_flashcard(id).view() for id in range(1, 5)]
+        exported = list(export_cards())
+        self.assertTrue([card['key'] for card in exported][:2] == ['007', '²'])
+        self.assertTrue(all(card['key'] for card in exported))
+
+        summary = import_cards(exported, write=fm.bulk_upsert)
+        self.assertTrue(summary['inserted'] == 0 and summary['updated'] == 0 and summary['unchanged'] == 4)
+        self.assertTrue([get_flashcard(id).view() for id in range(1, 5)] == before)
+        self.assertTrue(view_all_categories() == {'Test Category': 4})
+
+        summary = import_cards(exported, write=fm.bulk_upsert)
+        self.assertTrue(summary['inserted'] == 0 and summary['unchanged'] == 4)
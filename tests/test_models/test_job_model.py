@@ -0,0 +1,212 @@
+import unittest, io, json, os
+from datetime import timedelta
+from unittest import mock
+
+from flask import url_for
+from sqlalchemy import update
+
+from tests.base_test import BaseTestCase
+
+from app.extensions import db
+from app.jobs import JOBS, run_next_job, run_worker, keep_alive
+from app.models.job_model import JobModel, enqueue, claim_job, extend_job, finish_job, utcnow, QUEUED, RUNNING, DONE, FAILED
+from app.models.flashcard_model import FlashcardModel
+
+class Test_Job_Queue(BaseTestCase):
+    '''Tests queueing and claiming jobs'''
+
+    def test_1_job_queue(self):
+        '''
+        Tests a queued job is claimed once and hidden from other workers
+        '''
+        job = enqueue('example', {'value': 1})
+
+        claimed = claim_job(visibility_timeout=60)
+        self.assertTrue(claimed.id == job.id)
+        self.assertTrue(claimed.status == RUNNING)
+        self.assertTrue(claimed.attempts == 1)
+
+        self.assertTrue(claim_job(visibility_timeout=60) == None)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_job_queue(self):
+        '''
+        Tests a job is claimed again after its visibility timeout passes
+        '''
+        job = enqueue('example')
+        claimed = claim_job(visibility_timeout=60)
+
+        claimed.locked_until = utcnow() - timedelta(seconds=1)
+        db.session.commit()
+
+        claimed = claim_job(visibility_timeout=60)
+        self.assertTrue(claimed.id == job.id)
+        self.assertTrue(claimed.attempts == 2)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_job_queue(self):
+        '''
+        Tests delayed jobs are not claimed early
+        '''
+        enqueue('example', delay=60)
+        self.assertTrue(claim_job() == None)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_job_queue(self):
+        '''
+        Tests failed jobs are retried with backoff until they run out of attempts
+        '''
+        enqueue('example', max_attempts=2)
+
+        job = claim_job()
+        before = utcnow()
+        finish_job(job, error='First failure', retry_delay=10)
+        self.assertTrue(job.status == QUEUED)
+        self.assertTrue(job.last_error == 'First failure')
+        self.assertTrue(job.run_at >= before + timedelta(seconds=10))
+
+        job.run_at = utcnow()
+        db.session.commit()
+
+        job = claim_job()
+        finish_job(job, error='Second failure', retry_delay=10)
+        self.assertTrue(job.status == FAILED)
+        self.assertTrue(job.attempts == 2)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_5_job_queue(self):
+        '''
+        Tests a job that timed out on its last attempt is marked failed
+        '''
+        job = enqueue('example', max_attempts=1)
+        claimed = claim_job(visibility_timeout=60)
+        claimed.locked_until = utcnow() - timedelta(seconds=1)
+        db.session.commit()
+
+        self.assertTrue(claim_job() == None)
+        self.assertTrue(db.session.get(JobModel, job.id).status == FAILED)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_6_job_queue(self):
+        '''
+        Tests a worker whose job was claimed again can not extend it or record its result
+        '''
+        job = enqueue('example')
+        claimed = claim_job(visibility_timeout=60)
+        self.assertTrue(extend_job(claimed, attempt=1, visibility_timeout=600))
+        self.assertTrue(claimed.locked_until > utcnow() + timedelta(seconds=300))
+
+        claimed.locked_until = utcnow() - timedelta(seconds=1)
+        db.session.commit()
+        claimed = claim_job(visibility_timeout=60)
+        self.assertTrue(claimed.attempts == 2)
+
+        self.assertFalse(extend_job(claimed, attempt=1))
+        self.assertFalse(finish_job(claimed, attempt=1))
+        self.assertTrue(db.session.get(JobModel, job.id).status == RUNNING)
+
+        self.assertTrue(finish_job(claimed, attempt=2))
+        self.assertTrue(db.session.get(JobModel, job.id).status == DONE)
+
+
+class Test_Job_Worker(BaseTestCase):
+    '''Tests running queued jobs'''
+
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+        JOBS['record'] = lambda **kwargs: self.calls.append(kwargs)
+        JOBS['broken'] = mock.Mock(side_effect=ValueError('Broken job'))
+
+    def tearDown(self):
+        JOBS.pop('record')
+        JOBS.pop('broken')
+        super().tearDown()
+
+    def test_1_job_worker(self):
+        '''
+        Tests the worker runs jobs with their payload until the queue is empty
+        '''
+        first = enqueue('record', {'value': 1})
+        second = enqueue('record', {'value': 2})
+
+        self.assertTrue(run_worker(burst=True) == 2)
+        self.assertTrue(self.calls == [{'value': 1}, {'value': 2}])
+        self.assertTrue(db.session.get(JobModel, first.id).status == DONE)
+        self.assertTrue(db.session.get(JobModel, second.id).status == DONE)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_job_worker(self):
+        '''
+        Tests a failing job is queued for a retry with its error
+        '''
+        job = enqueue('broken')
+        run_next_job(retry_delay=60)
+
+        job = db.session.get(JobModel, job.id)
+        self.assertTrue(job.status == QUEUED)
+        self.assertTrue(job.last_error == 'Broken job')
+        self.assertTrue(run_next_job() == None)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_job_worker(self):
+        '''
+        Tests an uploaded JSON file is queued and imported by the worker
+        '''
+        data = {'questions': [{'key': 1, 'category': 'Jobs', 'question': 'Question', 'answer': 'Answer'}]}
+        response = self.client.post(
+            url_for('manage.import_flashcards'),
+            data={'file': (io.BytesIO(json.dumps(data).encode()), 'data.json')},
+            content_type='multipart/form-data'
+        )
+        self.assertEqual(response.status_code, 302)
+
+        job = JobModel.query.one()
+        filename = json.loads(job.payload)['filename']
+        self.assertTrue(os.path.exists(filename))
+
+        run_worker(burst=True)
+
+        self.assertTrue(FlashcardModel.query.filter_by(category='Jobs').count() == 1)
+        self.assertFalse(os.path.exists(filename))
+
+        response = self.client.get(url_for('manage.job_status', id=job.id))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json['status'] == DONE)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_job_worker(self):
+        '''
+        Tests files that are not JSON are not queued
+        '''
+        response = self.client.post(
+            url_for('manage.import_flashcards'),
+            data={'file': (io.BytesIO(b'text'), 'data.txt')},
+            content_type='multipart/form-data'
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(JobModel.query.count() == 0)
+
+        response = self.client.get(url_for('manage.job_status', id=1))
+        self.assertEqual(response.status_code, 404)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_5_job_worker(self):
+        '''
+        Tests a running job extends its visibility timeout and stops once another worker claims it
+        '''
+        def long_job():
+            job = JobModel.query.one()
+            keep_alive()
+            self.calls.append(job.locked_until)
+
+            # The timeout passes and another worker claims the job
+            db.session.execute(update(JobModel).values(attempts=JobModel.attempts + 1))
+            db.session.commit()
+            keep_alive()
+            self.calls.append('not stopped')
+
+        JOBS['long'] = long_job
+        try:
+            job = enqueue('long')
+            run_next_job(visibility_timeout=600)
+        finally:
+            JOBS.pop('long')
+
+        self.assertTrue(len(self.calls) == 1 and self.calls[0] > utcnow() + timedelta(seconds=300))
+        job = db.session.get(JobModel, job.id)
+        self.assertTrue(job.status == RUNNING and job.attempts == 2)
+
+if __name__ == "__main__":
+    unittest.main()
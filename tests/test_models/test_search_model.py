@@ -0,0 +1,88 @@
+import unittest
+
+from tests.base_test import BaseTestCase
+
+from app.extensions import db
+from app.models.flashcard_model import FlashcardModel as fm
+from app.models.search_model import search_flashcards, rebuild_search_index, build_match
+
+class Test_Search_Index(BaseTestCase):
+    '''Tests the full-text search index is kept in sync with the flashcards'''
+
+    def setUp(self):
+        super().setUp()
+        self.flashcard = fm(
+            category='Test Category',
+            question='What is a binary tree?',
+            answer='A tree where every node has at most two children.',
+            a_code_type='python',
+            a_code_example="class Node:\n    left = right = None"
+        )
+        self.id = self.flashcard.id
+
+    def test_1_search_index(self):
+        '''
+        Tests searching the question, answer, and code
+        '''
+        for query in ['binary', 'children', 'Node']:
+            results = search_flashcards(query)['results']
+            self.assertTrue([result['id'] for result in results] == [self.id])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_search_index(self):
+        '''
+        Tests the snippet highlights the match and escapes the text
+        '''
+        fm(
+            category='Test Category',
+            question='What does <b>bold</b> do?',
+            answer='Makes text bold.'
+        )
+
+        results = search_flashcards('bold')['results']
+        self.assertTrue(len(results) == 1)
+        self.assertIn('<mark>', results[0]['snippet'])
+        self.assertIn('&lt;', results[0]['snippet'])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_search_index(self):
+        '''
+        Tests updates and deletes are reflected in the index
+        '''
+        self.flashcard.update(
+            category='Test Category',
+            question='What is a heap?',
+            answer='A tree based priority queue.'
+        )
+
+        self.assertTrue(search_flashcards('binary')['results'] == [])
+        self.assertTrue(len(search_flashcards('heap')['results']) == 1)
+
+        self.flashcard.delete()
+        self.assertTrue(search_flashcards('heap')['results'] == [])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_search_index(self):
+        '''
+        Tests paginating the results
+        '''
+        self.create_test_deck(5)
+
+        page = search_flashcards('test question', page=1, limit=3)
+        self.assertTrue(len(page['results']) == 3)
+        self.assertTrue(page['has_next'])
+
+        page = search_flashcards('test question', page=2, limit=3)
+        self.assertTrue(len(page['results']) == 2)
+        self.assertFalse(page['has_next'])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_5_search_index(self):
+        '''
+        Tests rebuilding the index and query sanitization
+        '''
+        self.assertTrue(rebuild_search_index() == 1)
+        self.assertTrue(len(search_flashcards('binary')['results']) == 1)
+
+        self.assertTrue(build_match('"tree" AND (') == '"tree"* "AND"*')
+        self.assertTrue(search_flashcards('')['results'] == [])
+
+
+if __name__ == "__main__":
+    unittest.main()
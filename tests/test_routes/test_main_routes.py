@@ -1,8 +1,11 @@
 import unittest
+from unittest import mock
 
 from flask import url_for
 
-from tests.base_test import BaseTestCase
+from tests.base_test import BaseTestCase, RouteTestCase, count_queries
+
+from app.models.flashcard_model import FlashcardModel, get_flashcard
 
 class Test_Main_Pages(BaseTestCase):
 
@@ -29,7 +32,170 @@ class Test_Main_Pages(BaseTestCase):
         response = self.client.get('/nonexistent')
         self.assertEqual(response.status_code, 404)
         self.assertIn(b'<title>Page Not Found</title>', response.data)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_highlighted_code(self):
+        '''
+        Tests code figures highlighted on the server are not left for Prism
+        '''
+        FlashcardModel(category='Code Category', question='Question', a_code_type='python', a_code_example="print('Code')")
+
+        response = self.client.get(url_for('main.flashcard', category='Code Category'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'<pre class="highlight"><code><span class="nb">print</span>', response.data)
+        self.assertNotIn(b'language-python', response.data)
+        self.assertNotIn(b'/prism/', response.data)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_prism_script(self):
+        '''
+        Tests pages load Prism only for the code left to the browser
+        '''
+        response = self.client.get(url_for('main.index'))
+        self.assertNotIn(b'/prism/', response.data)
+
+        with mock.patch('app.models.flashcard_model.highlight_code', return_value=None):
+            FlashcardModel(category='Code Category', question='Question', a_code_type='sql', a_code_example="SELECT 1;")
+
+        response = self.client.get(url_for('main.flashcard', category='Code Category'))
+        self.assertIn(b'<script src="/prism/sql.js" async></script>', response.data)
+
+        response = self.client.get('/prism/sql.js')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'Prism.languages.sql=', response.data)
+
+        response = self.client.get('/prism/sql.js', headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get('/prism/unknown.js')
+        self.assertEqual(response.status_code, 404)
         
 
+class Test_Flashcard_API(RouteTestCase):
+
+    def test_1_flashcard_api(self):
+        '''
+        Tests the flashcard api returns a page of cards and the next cursor
+        '''
+        self.create_test_deck(4)
+
+        response = self.client.get(url_for('main.flashcards_api', category='Test Category', limit=2))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json['flashcards']), 2)
+        self.assertIsNotNone(response.json['next'])
+
+        response = self.client.get(url_for('main.flashcards_api', category='Test Category', after=response.json['next'], limit=2))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json['flashcards']), 2)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_flashcard_api(self):
+        '''
+        Tests the flashcard api with an invalid cursor
+        '''
+        response = self.client.get(url_for('main.flashcards_api', after='invalid'))
+        self.assertEqual(response.status_code, 400)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_flashcard_api(self):
+        '''
+        Tests the flashcard page links to the next page
+        '''
+        self.create_test_deck(4)
+
+        response = self.client.get(url_for('main.flashcard', category='Test Category', limit=2))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'Next Page', response.data)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_flashcard_api(self):
+        '''
+        Tests the flashcard api returns the version of each card, bumped only for the edited card
+        '''
+        self.create_test_deck(2)
+        url = url_for('main.flashcards_api', category='Test Category')
+        versions = {card['id']: card['version'] for card in self.client.get(url).json['flashcards']}
+
+        get_flashcard(1).update(category='Test Category', question='Edited question?', answer='Answer.')
+
+        edited = {card['id']: card['version'] for card in self.client.get(url).json['flashcards']}
+        self.assertEqual(edited[1], versions[1] + 1)
+        self.assertEqual({id: version for id, version in edited.items() if id != 1}, {id: version for id, version in versions.items() if id != 1})
+
+
+class Test_Search_API(RouteTestCase):
+
+    def test_1_search_api(self):
+        '''
+        Tests the search api returns ranked results with snippets
+        '''
+        response = self.client.get(url_for('main.search_api', q='test answer'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json['results']), 1)
+        self.assertIn('<mark>', response.json['results'][0]['snippet'])
+        self.assertFalse(response.json['has_next'])
+
+
+class Test_Flashcard_Queries(RouteTestCase):
+
+    def test_1_flashcard_queries(self):
+        '''
+        Tests the flashcard page issues the same number of queries regardless of deck size
+        '''
+        with count_queries() as small:
+            response = self.client.get(url_for('main.flashcard', category='Test Category'))
+        self.assertEqual(response.status_code, 200)
+
+        self.create_test_deck(25)
+
+        with count_queries() as large:
+            response = self.client.get(url_for('main.flashcard', category='Test Category'))
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(small), len(large))
+
+
+class Test_Deck_Validators(RouteTestCase):
+
+    def test_1_deck_validators(self):
+        '''
+        Tests a repeat visit to an unchanged category is answered with a 304 from a single query
+        '''
+        url = url_for('main.flashcard', category='Test Category')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.headers.get('ETag'))
+        self.assertIsNotNone(response.headers.get('Last-Modified'))
+        self.assertIn('no-cache', response.headers.get('Cache-Control'))
+
+        with count_queries() as statements:
+            cached = self.client.get(url, headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b'')
+        self.assertEqual(len(statements), 1)
+        self.assertIn('deck_versions', statements[0])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_deck_validators(self):
+        '''
+        Tests a write to the category or to the deck changes the ETag
+        '''
+        url = url_for('main.flashcard', category='Test Category')
+        etag = self.client.get(url).headers['ETag']
+
+        FlashcardModel(category='Other Category', question='Question?', answer='Answer.')
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_deck_validators(self):
+        '''
+        Tests the json api only changes with its own category
+        '''
+        url = url_for('main.flashcards_api', category='Test Category')
+        etag = self.client.get(url).headers['ETag']
+        self.assertFalse(etag.startswith('W/'))
+
+        FlashcardModel(category='Other Category', question='Question?', answer='Answer.')
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': etag}).status_code, 304)
+
+        self.create_test_deck(1)
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': etag}).status_code, 200)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,8 +1,11 @@
-import unittest
+import unittest, io, os, tempfile, shutil, hashlib
+from unittest import mock
 
 from flask import url_for
 
-from tests.base_test import BaseTestCase, RouteTestCase
+from tests.base_test import BaseTestCase, RouteTestCase, count_queries
+
+from app import utils
 
 
 class Test_Manage_Page(BaseTestCase):
@@ -172,5 +175,180 @@ class Test_Delete_Route(RouteTestCase):
         self.assertIn(b"<title>Manage Flashcards</title>", response.data)
 
 
+class Test_Manage_Queries(RouteTestCase):
+
+    def assertConstantQueries(self, url):
+        '''
+        Asserts the url issues the same number of queries before and after the deck grows
+        '''
+        with count_queries() as small:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        self.create_test_deck(25)
+
+        with count_queries() as large:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(small), len(large))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_1_manage_queries(self):
+        '''
+        Tests the manage page issues a constant number of queries
+        '''
+        self.assertConstantQueries(url_for('manage.index'))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_manage_queries(self):
+        '''
+        Tests the view page issues a constant number of queries
+        '''
+        self.assertConstantQueries(url_for('manage.view_flashcard', id=1))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_manage_queries(self):
+        '''
+        Tests the edit page issues a constant number of queries
+        '''
+        self.assertConstantQueries(url_for('manage.edit_flashcard', id=1))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_manage_queries(self):
+        '''
+        Tests the view page loads the flashcard and its figures in a single query
+        '''
+        with count_queries() as statements:
+            response = self.client.get(url_for('manage.view_flashcard', id=1))
+        self.assertEqual(response.status_code, 200)
+
+        flashcard_queries = [s for s in statements if 'FROM flashcards' in s and 'GROUP BY' not in s]
+        self.assertEqual(len(flashcard_queries), 1)
+        self.assertIn('JOIN figures', flashcard_queries[0])
+
+
+class Test_Manage_Validators(RouteTestCase):
+
+    def test_1_manage_validators(self):
+        '''
+        Tests an unchanged manage page is answered with a 304 and kept out of shared caches
+        '''
+        response = self.client.get(url_for('manage.index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('private', response.headers['Cache-Control'])
+        self.assertIsNone(response.headers.get('Last-Modified'))
+
+        cached = self.client.get(url_for('manage.index'), headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(cached.status_code, 304)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_manage_validators(self):
+        '''
+        Tests a page with flashed messages is built and not stored
+        '''
+        etag = self.client.get(url_for('manage.index')).headers['ETag']
+
+        with self.client.session_transaction() as session:
+            session['_flashes'] = [('success', 'Flashed message')]
+
+        response = self.client.get(url_for('manage.index'), headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'Flashed message', response.data)
+        self.assertIn('no-store', response.headers['Cache-Control'])
+        self.assertIsNone(response.headers.get('ETag'))
+
+
+class Test_Get_Image(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.folder = tempfile.mkdtemp()
+        self.patches = [mock.patch('app.utils.IMAGE_FOLDER', self.folder), mock.patch('app.manage.routes.IMAGE_FOLDER', self.folder)]
+        for patch in self.patches:
+            patch.start()
+
+        # Store an image under its content hash
+        self.content = b'\x89PNG\r\n\x1a\n' + bytes(range(256))
+        self.digest = hashlib.sha256(self.content).hexdigest()
+        self.filename = f"{self.digest}.png"
+        with open(os.path.join(self.folder, self.filename), 'wb') as f:
+            f.write(self.content)
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        shutil.rmtree(self.folder)
+        super().tearDown()
+    #-----------------------------------------------------------------------------------------------------------
+    def test_1_get_image(self):
+        '''
+        Tests images are cached as immutable with a strong ETag
+        '''
+        response = self.client.get(url_for('manage.get_image', filename=self.filename))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, self.content)
+        self.assertEqual(response.headers['ETag'], f'"{self.digest}"')
+        self.assertIn('immutable', response.headers['Cache-Control'])
+        self.assertIn('max-age=31536000', response.headers['Cache-Control'])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_get_image(self):
+        '''
+        Tests a matching ETag returns not modified
+        '''
+        response = self.client.get(
+            url_for('manage.get_image', filename=self.filename),
+            headers={'If-None-Match': f'"{self.digest}"'}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_get_image(self):
+        '''
+        Tests range requests return part of the image
+        '''
+        response = self.client.get(url_for('manage.get_image', filename=self.filename), headers={'Range': 'bytes=0-7'})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.data, self.content[:8])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_get_image(self):
+        '''
+        Tests the proxy sends the image when X-Accel-Redirect is configured
+        '''
+        self.app.config['IMAGE_ACCEL_REDIRECT'] = '/protected/images/'
+        try:
+            response = self.client.get(url_for('manage.get_image', filename=self.filename))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data, b'')
+            self.assertEqual(response.headers['X-Accel-Redirect'], f'/protected/images/{self.filename}')
+            self.assertEqual(response.headers['Content-Type'], 'image/png')
+
+            response = self.client.get(url_for('manage.get_image', filename='missing.png'))
+            self.assertEqual(response.status_code, 404)
+        finally:
+            self.app.config['IMAGE_ACCEL_REDIRECT'] = None
+    #-----------------------------------------------------------------------------------------------------------
+    @unittest.skipIf(utils.Image is None, "Pillow is not installed")
+    def test_5_get_image(self):
+        '''
+        Tests the original served for a copy that is not created yet is not cached as immutable
+        '''
+        file = io.BytesIO()
+        utils.Image.new('RGB', (600, 300), 'white').save(file, format='PNG')
+        filename = f"{hashlib.sha256(file.getvalue()).hexdigest()}.png"
+        with open(os.path.join(self.folder, filename), 'wb') as f:
+            f.write(file.getvalue())
+
+        response = self.client.get(url_for('manage.get_image', filename=filename, w=160))
+        self.assertEqual(response.data, file.getvalue())
+        self.assertNotIn('immutable', response.headers['Cache-Control'])
+        self.assertIn('max-age=60', response.headers['Cache-Control'])
+
+        utils.create_image_variants(filename)
+        response = self.client.get(url_for('manage.get_image', filename=filename, w=160))
+        self.assertIn('immutable', response.headers['Cache-Control'])
+        self.assertIn('max-age=31536000', response.headers['Cache-Control'])
+
+        # No copy is created as wide as the original, so the original is final
+        response = self.client.get(url_for('manage.get_image', filename=filename, w=960))
+        self.assertEqual(response.data, file.getvalue())
+        self.assertIn('immutable', response.headers['Cache-Control'])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,2 @@
+# tests/test_utils/__init__.py
+# This file is intentionally left empty.
\ No newline at end of file
@@ -0,0 +1,160 @@
+import unittest
+from unittest import mock
+from sqlalchemy import update
+
+from tests.base_test import BaseTestCase, count_queries
+
+from app.utils import Cache
+from app.extensions import db
+from app.models.category_model import bump_deck_versions, get_deck_versions
+from app.models.flashcard_model import FlashcardModel, view_all_cards, view_cards_page, view_all_categories
+
+class Test_Cache(unittest.TestCase):
+    '''Tests the LRU cache'''
+
+    def test_1_cache(self):
+        '''
+        Tests getting and setting values counts hits and misses
+        '''
+        cache = Cache(max_size=2)
+
+        self.assertTrue(cache.get('a') == None)
+        cache.set('a', 1)
+        self.assertTrue(cache.get('a') == 1)
+
+        stats = cache.stats()
+        self.assertTrue(stats['hits'] == 1)
+        self.assertTrue(stats['misses'] == 1)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_cache(self):
+        '''
+        Tests the least recently used entry is evicted when full
+        '''
+        cache = Cache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertTrue(cache.get('a') == 1)
+        self.assertTrue(cache.get('b') == None)
+        self.assertTrue(cache.get('c') == 3)
+        self.assertTrue(cache.stats()['evictions'] == 1)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_cache(self):
+        '''
+        Tests entries expire after the TTL
+        '''
+        cache = Cache(max_size=2, ttl=10)
+
+        with mock.patch('app.utils.time.monotonic', return_value=100):
+            cache.set('a', 1)
+            self.assertTrue(cache.get('a') == 1)
+
+        with mock.patch('app.utils.time.monotonic', return_value=111):
+            self.assertTrue(cache.get('a') == None)
+            self.assertTrue(len(cache) == 0)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_cache(self):
+        '''
+        Tests read-through loading only calls the loader on a miss
+        '''
+        cache = Cache()
+        load = mock.Mock(return_value=[1, 2, 3])
+
+        self.assertTrue(cache.get_or_set('a', load) == [1, 2, 3])
+        self.assertTrue(cache.get_or_set('a', load) == [1, 2, 3])
+        load.assert_called_once()
+    #-----------------------------------------------------------------------------------------------------------
+    def test_5_cache(self):
+        '''
+        Tests dropping keys
+        '''
+        cache = Cache()
+        cache.update({('cards', 'A'): 1, ('cards', 'B'): 2})
+
+        cache.drop_if(lambda key: key[1] == 'A')
+        self.assertTrue(cache.get(('cards', 'A')) == None)
+
+        cache.drop(('cards', 'B'))
+        with self.assertRaises(KeyError):
+            cache.drop(('cards', 'B'))
+
+
+class Test_Deck_Cache(BaseTestCase):
+    '''Tests the deck queries read through the cache'''
+
+    def test_1_deck_cache(self):
+        '''
+        Tests repeated deck queries only look up the deck versions, or skip the database if they are given
+        '''
+        self.create_test_deck(2)
+        view_all_cards(category='Test Category')
+        view_all_categories()
+
+        with count_queries() as statements:
+            cards = view_all_cards(category='Test Category')
+            categories = view_all_categories()
+
+        self.assertTrue(len(statements) == 2)
+        self.assertTrue(all('deck_versions' in statement for statement in statements))
+
+        category_version, deck_version, _ = get_deck_versions('Test Category')
+        with count_queries() as statements:
+            view_all_cards(category='Test Category', version=category_version)
+            view_all_categories(version=deck_version)
+        self.assertTrue(len(statements) == 0)
+
+        self.assertTrue(len(cards) == 2)
+        self.assertTrue(categories == {'Test Category': 2})
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_deck_cache(self):
+        '''
+        Tests writes invalidate the cached deck queries
+        '''
+        self.create_test_deck(2)
+        self.assertTrue(len(view_all_cards(category='Test Category')) == 2)
+        self.assertTrue(len(view_all_cards()) == 2)
+
+        self.create_test_deck(1)
+        self.assertTrue(len(view_all_cards(category='Test Category')) == 3)
+        self.assertTrue(len(view_all_cards()) == 3)
+        self.assertTrue(view_all_categories() == {'Test Category': 3})
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_deck_cache(self):
+        '''
+        Tests a figure write only invalidates the cached queries of the categories using the figure
+        '''
+        self.create_test_deck(1)
+        self.create_test_deck(1, category='Other Category')
+        view_all_cards(category='Test Category')
+        view_all_cards(category='Other Category')
+
+        figure = FlashcardModel.query.filter_by(category='Test Category').one().question_figure
+        figure.update(code_type='python', code_example="print('Updated')")
+
+        with count_queries() as statements:
+            view_all_cards(category='Other Category')
+        self.assertTrue(len(statements) == 1)
+
+        cards = view_all_cards(category='Test Category')
+        self.assertTrue(cards[0]['q_code_example'] == "print('Updated')")
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_deck_cache(self):
+        '''
+        Tests a write by another process is seen by the next read even though this process did not invalidate
+        '''
+        self.create_test_deck(1)
+        view_cards_page(category='Test Category')
+
+        # Written without invalidating the cache of this process
+        db.session.execute(update(FlashcardModel).values(question='Changed question?'))
+        bump_deck_versions('Test Category')
+        db.session.commit()
+
+        page = view_cards_page(category='Test Category')
+        self.assertTrue(page['flashcards'][0]['question'] == 'Changed question?')
+
+
+if __name__ == "__main__":
+    unittest.main()
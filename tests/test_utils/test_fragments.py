@@ -0,0 +1,124 @@
+import unittest
+
+from flask import url_for
+from sqlalchemy import delete, update
+
+from tests.base_test import BaseTestCase
+
+from app.extensions import db, deck_cache, fragment_cache
+from app.fragments import fragment_stats
+from app.models.category_model import bump_deck_versions
+from app.models.flashcard_model import FlashcardModel, FigureModel, get_flashcard
+
+class Test_Card_Fragments(BaseTestCase):
+    '''Tests caching the rendered html of each card'''
+
+    def test_1_fragment_cache(self):
+        '''
+        Tests a card is rendered once and served from the cache afterwards
+        '''
+        FlashcardModel(category='Fragment Category', question='Cached question?', answer='Cached answer.')
+        before = fragment_stats()
+
+        # The page cache would serve the repeated requests without rendering the page
+        self.app.config['PAGE_CACHE'] = False
+        try:
+            for _ in range(3):
+                response = self.client.get(url_for('main.flashcard', category='Fragment Category'))
+                self.assertTrue(response.status_code == 200)
+                self.assertTrue(b'Cached question?' in response.data)
+        finally:
+            self.app.config['PAGE_CACHE'] = True
+
+        stats = fragment_stats()
+        self.assertTrue(stats['renders'] - before['renders'] == 1)
+        self.assertTrue(stats['hits'] - before['hits'] == 2)
+        self.assertTrue(stats['hit_rate'] > 0)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_fragment_version(self):
+        '''
+        Tests updating a card bumps its version so the new html is rendered
+        '''
+        flashcard = FlashcardModel(category='Fragment Category', question='Old question?', answer='Answer.')
+        self.assertTrue(flashcard.version == 1)
+        self.client.get(url_for('manage.index'))
+
+        flashcard = get_flashcard(flashcard.id)
+        flashcard.update(category='Fragment Category', question='New question?', answer='Answer.')
+        self.assertTrue(flashcard.version == 2)
+
+        response = self.client.get(url_for('manage.index'))
+        self.assertTrue(b'New question?' in response.data)
+        self.assertTrue(b'Old question?' not in response.data)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_fragment_delete(self):
+        '''
+        Tests deleting a card drops its fragments, so a card reusing the id is not served the old html
+        '''
+        flashcard = FlashcardModel(category='Fragment Category', question='Deleted question?', answer='Answer.')
+        id = flashcard.id
+        self.client.get(url_for('main.flashcard', category='Fragment Category'))
+        self.assertTrue(len(fragment_cache) == 1)
+
+        get_flashcard(id).delete()
+        self.assertTrue(len(fragment_cache) == 0)
+
+        flashcard = FlashcardModel(category='Fragment Category', question='Reused question?', answer='Answer.')
+        response = self.client.get(url_for('main.flashcard', category='Fragment Category'))
+        self.assertTrue(flashcard.id == id)
+        self.assertTrue(b'Reused question?' in response.data)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_fragment_digest(self):
+        '''
+        Tests a figure highlighted again by another process is rendered again without clearing the cache
+        '''
+        flashcard = FlashcardModel(
+            category='Fragment Category', question='Question?', answer='Answer.', q_code_type='python', q_code_example="print('Code')"
+        )
+        url = url_for('main.flashcard', category='Fragment Category')
+        self.client.get(url)
+
+        # rebuild_code_html run by the command line, the version of the card is unchanged
+        db.session.execute(update(FigureModel).values(code_html='<span class="highlighted">Code</span>'))
+        bump_deck_versions()
+        db.session.commit()
+        # The deck cache of this process expires after DECK_CACHE_TTL, the fragment cache has no TTL
+        deck_cache.clear()
+
+        response = self.client.get(url)
+        self.assertTrue(b'<span class="highlighted">Code</span>' in response.data)
+        self.assertTrue(get_flashcard(flashcard.id).version == 1)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_5_fragment_digest(self):
+        '''
+        Tests a card reusing the id of a card deleted by another process is not served the old html
+        '''
+        flashcard = FlashcardModel(category='Fragment Category', question='Deleted question?', answer='Answer.')
+        id = flashcard.id
+        url = url_for('main.flashcard', category='Fragment Category')
+        self.client.get(url)
+
+        # The card is deleted without dropping the fragments of this process
+        db.session.execute(delete(FlashcardModel).where(FlashcardModel.id == id))
+        db.session.commit()
+        deck_cache.clear()
+
+        flashcard = FlashcardModel(category='Fragment Category', question='Reused question?', answer='Answer.')
+        response = self.client.get(url)
+        self.assertTrue(flashcard.id == id and flashcard.version == 1)
+        self.assertTrue(b'Reused question?' in response.data)
+        self.assertTrue(b'Deleted question?' not in response.data)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_6_cache_stats(self):
+        '''
+        Tests the cache counters are exposed for monitoring
+        '''
+        response = self.client.get(url_for('manage.cache_stats'))
+        self.assertTrue(response.status_code == 200)
+        self.assertTrue('hit_rate' in response.json['fragment_cache'])
+        self.assertTrue('render_seconds' in response.json['fragment_cache'])
+        self.assertTrue('hits' in response.json['deck_cache'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,373 @@
+import unittest, io, os, tempfile, shutil, hashlib, time
+from unittest import mock
+from flask import request
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import RequestEntityTooLarge, UnsupportedMediaType
+
+from tests.base_test import BaseTestCase
+
+from app import utils
+from app.utils import save_image_file, create_image_variants, nearest_image, variant_path
+from app.extensions import db
+from app.models.flashcard_model import FigureModel as fm, FlashcardModel, find_orphaned_images, find_dangling_figures
+from app.models.deletion_model import PendingDeletionModel, queue_image_deletion, schedule_image_deletions, drain_image_deletions
+
+PNG = b'\x89PNG\r\n\x1a\n'
+
+def make_file(content:bytes, filename:str='example.png'):
+    # Creates an uploaded file
+    return FileStorage(stream=io.BytesIO(content), filename=filename)
+
+class Test_Save_Image(unittest.TestCase):
+    '''Tests saving uploaded images under their content hash'''
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.patch = mock.patch('app.utils.IMAGE_FOLDER', self.folder)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.folder)
+
+    def test_1_save_image(self):
+        '''
+        Tests identical uploads are stored once
+        '''
+        first = save_image_file(make_file(PNG + b'image data', 'first.png'))
+        second = save_image_file(make_file(PNG + b'image data', 'second.png'))
+        third = save_image_file(make_file(PNG + b'other data', 'first.png'))
+
+        self.assertTrue(first == second)
+        self.assertFalse(first == third)
+        self.assertTrue(first.endswith('.png'))
+        self.assertTrue(sorted(os.listdir(self.folder)) == sorted([first, third]))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_save_image(self):
+        '''
+        Tests unsupported files are not saved
+        '''
+        self.assertTrue(save_image_file(make_file(b'text', 'example.txt')) == None)
+        self.assertTrue(os.listdir(self.folder) == [])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_save_image(self):
+        '''
+        Tests files that do not start with the signature of their extension are not saved
+        '''
+        self.assertTrue(save_image_file(make_file(b'image data', 'example.png')) == None)
+        self.assertTrue(save_image_file(make_file(PNG + b'image data', 'example.jpg')) == None)
+        self.assertTrue(save_image_file(make_file(PNG[:4], 'example.png')) == None)
+        self.assertTrue(os.listdir(self.folder) == [])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_save_image(self):
+        '''
+        Tests an upload is rejected on the first chunk past the size limit
+        '''
+        upload = utils.ImageUpload('.png', max_size=16)
+        upload.write(PNG)
+
+        with self.assertRaises(RequestEntityTooLarge):
+            upload.write(b'x' * 16)
+        self.assertTrue(os.listdir(self.folder) == [])
+
+
+class Test_Upload_Request(BaseTestCase):
+    '''Tests images are streamed to disk while the form is parsed'''
+
+    def setUp(self):
+        super().setUp()
+        self.folder = tempfile.mkdtemp()
+        self.patch = mock.patch('app.utils.IMAGE_FOLDER', self.folder)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.folder)
+        super().tearDown()
+
+    def test_1_upload_request(self):
+        '''
+        Tests an uploaded image is parsed into an ImageUpload and saved without copying
+        '''
+        content = PNG + b'image data'
+        with self.app.test_request_context(method='POST', data={'image': (io.BytesIO(content), 'example.png')}):
+            file = request.files['image']
+            self.assertTrue(isinstance(file.stream, utils.ImageUpload))
+
+            filename = save_image_file(file)
+
+        self.assertTrue(filename == f"{hashlib.sha256(content).hexdigest()}.png")
+        self.assertTrue(os.listdir(self.folder) == [filename])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_upload_request(self):
+        '''
+        Tests invalid uploads are rejected while parsing and leave no temporary files
+        '''
+        with self.app.test_request_context(method='POST', data={'image': (io.BytesIO(b'not an image'), 'example.png')}):
+            with self.assertRaises(UnsupportedMediaType):
+                request.files['image']
+
+        self.app.config['MAX_IMAGE_SIZE'] = 16
+        try:
+            data = {'first': (io.BytesIO(PNG), 'first.png'), 'second': (io.BytesIO(PNG + b'x' * 32), 'second.png')}
+            with self.app.test_request_context(method='POST', data=data):
+                with self.assertRaises(RequestEntityTooLarge):
+                    request.files['first']
+        finally:
+            self.app.config['MAX_IMAGE_SIZE'] = 8 * 1024 * 1024
+
+        self.assertTrue(os.listdir(self.folder) == [])
+
+
+
+@unittest.skipIf(utils.Image is None, "Pillow is not installed")
+class Test_Image_Variants(unittest.TestCase):
+    '''Tests the resized copies of uploaded images'''
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.patch = mock.patch('app.utils.IMAGE_FOLDER', self.folder)
+        self.patch.start()
+
+        # Save a 600 pixel wide image
+        file = io.BytesIO()
+        utils.Image.new('RGB', (600, 300), 'white').save(file, format='PNG')
+        self.filename = 'example.png'
+        with open(os.path.join(self.folder, self.filename), 'wb') as f:
+            f.write(file.getvalue())
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.folder)
+
+    def test_1_image_variants(self):
+        '''
+        Tests copies are only created for widths smaller than the original
+        '''
+        self.assertTrue(create_image_variants(self.filename) == [160, 480])
+
+        with utils.Image.open(os.path.join(self.folder, variant_path(self.filename, 160))) as image:
+            self.assertTrue(image.size == (160, 80))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_image_variants(self):
+        '''
+        Tests the nearest copy at least as wide as requested is used
+        '''
+        create_image_variants(self.filename)
+
+        self.assertTrue(nearest_image(self.filename, 100) == variant_path(self.filename, 160))
+        self.assertTrue(nearest_image(self.filename, 300) == variant_path(self.filename, 480))
+        self.assertTrue(nearest_image(self.filename, 700) == self.filename)
+        self.assertTrue(nearest_image(self.filename) == self.filename)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_image_variants(self):
+        '''
+        Tests removing an image removes its copies
+        '''
+        create_image_variants(self.filename)
+        utils.remove_image(self.filename)
+
+        self.assertFalse(os.path.exists(os.path.join(self.folder, variant_path(self.filename, 160))))
+
+
+class Test_Image_References(BaseTestCase):
+    '''Tests stored images are only removed when the last figure referencing them is gone'''
+
+    def setUp(self):
+        super().setUp()
+        self.folder = tempfile.mkdtemp()
+        self.patch = mock.patch('app.utils.IMAGE_FOLDER', self.folder)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.folder)
+        super().tearDown()
+
+    def test_1_image_references(self):
+        '''
+        Tests deleting figures that share an image
+        '''
+        first = fm(image_example=make_file(PNG + b'image data'))
+        second = fm(image_example=make_file(PNG + b'image data'))
+        path = os.path.join(self.folder, first.image_example)
+
+        self.assertTrue(first.image_example == second.image_example)
+
+        first.delete()
+        self.assertTrue(os.path.exists(path))
+
+        second.delete()
+        self.assertFalse(os.path.exists(path))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_image_references(self):
+        '''
+        Tests replacing an image with the same content keeps the file
+        '''
+        figure = fm(image_example=make_file(PNG + b'image data'))
+        path = os.path.join(self.folder, figure.image_example)
+
+        figure.update(image_example=make_file(PNG + b'image data', 'renamed.png'))
+        self.assertTrue(os.path.exists(path))
+
+        figure.update(code_type='python', code_example="print('Code')")
+        self.assertTrue(figure.image_example == None)
+        self.assertFalse(os.path.exists(path))
+
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_image_references(self):
+        '''
+        Tests deleting a flashcard removes its figures and queues their images in one transaction
+        '''
+        flashcard = FlashcardModel(category='Images', question='Question', a_image_example=make_file(PNG + b'image data'))
+        filename = flashcard.answer_figure.image_example
+
+        with mock.patch('app.models.flashcard_model.schedule_image_deletions') as schedule:
+            flashcard.delete()
+
+        self.assertTrue(schedule.called)
+        self.assertTrue(fm.query.count() == 0)
+        self.assertTrue([entry.filename for entry in PendingDeletionModel.query.all()] == [filename])
+        self.assertTrue(os.path.exists(os.path.join(self.folder, filename)))
+
+        schedule_image_deletions()
+        self.assertTrue(PendingDeletionModel.query.count() == 0)
+        self.assertFalse(os.path.exists(os.path.join(self.folder, filename)))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_image_references(self):
+        '''
+        Tests a rolled back deletion never removes the image
+        '''
+        figure = fm(image_example=make_file(PNG + b'image data'))
+        path = os.path.join(self.folder, figure.image_example)
+
+        queue_image_deletion(figure.image_example)
+        db.session.rollback()
+        schedule_image_deletions()
+
+        self.assertTrue(os.path.exists(path))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_5_image_references(self):
+        '''
+        Tests queued images are removed by a background thread when DELETE_FILES_ASYNC is enabled
+        '''
+        figure = fm(image_example=make_file(PNG + b'image data'))
+        path = os.path.join(self.folder, figure.image_example)
+
+        self.app.config['DELETE_FILES_ASYNC'] = True
+        try:
+            with mock.patch('app.models.flashcard_model.schedule_image_deletions'):
+                figure.delete()
+            schedule_image_deletions().result(timeout=10)
+        finally:
+            self.app.config['DELETE_FILES_ASYNC'] = False
+
+        self.assertFalse(os.path.exists(path))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_6_image_references(self):
+        '''
+        Tests a queued image reused by an upload before the queue is drained is kept
+        '''
+        figure = fm(image_example=make_file(PNG + b'image data'))
+        path = os.path.join(self.folder, figure.image_example)
+        os.utime(path, (0, 0))
+
+        with mock.patch('app.models.flashcard_model.schedule_image_deletions'):
+            figure.delete()
+
+        # The figure of the upload is not committed yet
+        self.assertTrue(save_image_file(make_file(PNG + b'image data')) == os.path.basename(path))
+        schedule_image_deletions()
+
+        self.assertTrue(PendingDeletionModel.query.count() == 0)
+        self.assertTrue(os.path.exists(path))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_7_image_references(self):
+        '''
+        Tests an image saved by an upload before it is queued is kept until the upload can commit its figure
+        '''
+        figure = fm(image_example=make_file(PNG + b'image data'))
+        path = os.path.join(self.folder, figure.image_example)
+        os.utime(path, (0, 0))
+
+        # The upload saves the file, then the figure is deleted before the upload commits
+        self.assertTrue(save_image_file(make_file(PNG + b'image data')) == os.path.basename(path))
+        with mock.patch('app.models.flashcard_model.schedule_image_deletions'):
+            figure.delete()
+
+        self.assertTrue(drain_image_deletions(min_age=3600) == 1)
+        self.assertTrue(os.path.exists(path))
+
+        # Without the window the file is removed under the upload
+        queue_image_deletion(os.path.basename(path))
+        db.session.commit()
+        self.assertTrue(drain_image_deletions(min_age=0) == 1)
+        self.assertTrue(not os.path.exists(path))
+
+
+class Test_Orphaned_Images(BaseTestCase):
+    '''Tests finding stored images and figures that are out of sync'''
+
+    def setUp(self):
+        super().setUp()
+        self.folder = tempfile.mkdtemp()
+        self.patch = mock.patch('app.utils.IMAGE_FOLDER', self.folder)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.folder)
+        super().tearDown()
+
+    def write_file(self, path:str, age:int=7200):
+        # Writes a file last modified age seconds ago
+        path = os.path.join(self.folder, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(PNG)
+        os.utime(path, (time.time() - age, time.time() - age))
+
+    def test_1_orphaned_images(self):
+        '''
+        Tests only old unreferenced files are found, in batches
+        '''
+        figure = fm(image_example=make_file(PNG + b'image data'))
+        os.utime(os.path.join(self.folder, figure.image_example), (0, 0))
+        self.write_file('orphan1.png')
+        self.write_file('orphan2.png')
+        self.write_file('.upload-abc')
+        self.write_file('recent.png', age=0)
+
+        batches = list(find_orphaned_images(batch_size=2, min_age=3600))
+        orphaned = sorted(filename for batch in batches for filename in batch)
+
+        self.assertTrue(orphaned == ['.upload-abc', 'orphan1.png', 'orphan2.png'])
+        self.assertTrue(all(len(batch) <= 2 for batch in batches))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_orphaned_images(self):
+        '''
+        Tests resized copies are found when their original is gone
+        '''
+        self.write_file('kept.png')
+        self.write_file(os.path.join('variants', '160', 'kept.png'))
+        self.write_file(os.path.join('variants', '160', 'removed.png'))
+
+        orphaned = [filename for batch in find_orphaned_images(min_age=3600) for filename in batch]
+
+        self.assertTrue('kept.png' in orphaned)
+        self.assertTrue(os.path.join('variants', '160', 'removed.png') in orphaned)
+        self.assertFalse(os.path.join('variants', '160', 'kept.png') in orphaned)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_orphaned_images(self):
+        '''
+        Tests figures whose image file is missing are found
+        '''
+        figure = fm(image_example=make_file(PNG + b'image data'))
+        kept = fm(image_example=make_file(PNG + b'other data'))
+        os.remove(os.path.join(self.folder, figure.image_example))
+
+        self.assertTrue(list(find_dangling_figures()) == [(figure.id, figure.image_example)])
+
+
+if __name__ == "__main__":
+    unittest.main()
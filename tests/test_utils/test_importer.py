@@ -0,0 +1,104 @@
+import unittest
+
+from app.importer import prepare_card, import_cards
+
+def make_card(i:int, **kwargs):
+    # Creates a card in the JSON export format
+    card = {
+        'key': i,
+        'category': 'Test Category',
+        'question': f'Is this test question {i}?',
+        'answer': f'This is test answer {i}.',
+        'q_code_type': None,
+        'q_code_block': None,
+        'a_code_type': None,
+        'a_code_block': None
+    }
+    card.update(kwargs)
+    return card
+
+class Test_Prepare_Card(unittest.TestCase):
+    '''Tests validating and normalizing cards'''
+
+    def test_1_prepare_card(self):
+        '''
+        Tests a valid card is converted and hashed
+        '''
+        card = prepare_card(make_card(1, q_code_type=' Py ', q_code_block="print('Question')"))
+
+        self.assertTrue(card['q_code_type'] == 'python')
+        self.assertTrue(card['q_code_example'] == "print('Question')")
+        self.assertTrue(len(card['content_hash']) == 64)
+        self.assertTrue(card['content_hash'] == prepare_card(make_card(1, q_code_type='python', q_code_block="print('Question')"))['content_hash'])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_prepare_card(self):
+        '''
+        Tests invalid cards raise errors
+        '''
+        with self.assertRaises(ValueError) as context:
+            prepare_card(make_card(1, category='  '))
+        self.assertTrue("Missing category input!" in str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            prepare_card(make_card(1, a_code_type='python'))
+        self.assertTrue("Missing answer figure inputs!" in str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            prepare_card(make_card(1, answer=None))
+        self.assertTrue("No answer inputs!" in str(context.exception))
+
+
+class Test_Import_Cards(unittest.TestCase):
+    '''Tests the import pipeline'''
+
+    def setUp(self):
+        self.cards = [make_card(i) for i in range(20)]
+        self.cards[3] = make_card(3, category=None)
+        self.cards[11] = make_card(11, answer=None)
+        self.cards[15] = make_card(14)
+
+    def run_import(self, workers:int):
+        written = []
+
+        def write(cards):
+            written.append(cards)
+            return {'inserted': len(cards)}
+
+        summary = import_cards(self.cards, write=write, workers=workers, chunk_size=4, max_pending=2)
+        return summary, written
+
+    def test_1_import_cards(self):
+        '''
+        Tests importing inline skips invalid and duplicate cards
+        '''
+        summary, written = self.run_import(workers=1)
+
+        self.assertTrue(summary['inserted'] == 17)
+        self.assertTrue(summary['duplicates'] == 1)
+        self.assertTrue([position for position, _ in summary['errors']] == [3, 11])
+        self.assertTrue(sum(len(chunk) for chunk in written) == 17)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_import_cards(self):
+        '''
+        Tests importing with worker processes writes the same cards in the same order
+        '''
+        serial, serial_written = self.run_import(workers=1)
+        parallel, parallel_written = self.run_import(workers=2)
+
+        self.assertTrue(serial == parallel)
+        self.assertTrue(serial_written == parallel_written)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_import_cards(self):
+        '''
+        Tests a key repeated in a later chunk is left to the writer instead of being remembered by the import
+        '''
+        self.cards[15] = make_card(15)
+        self.cards[18] = make_card(2)
+        summary, written = self.run_import(workers=1)
+
+        self.assertTrue(summary['duplicates'] == 0)
+        self.assertTrue([card['key'] for card in written[-1]] == [16, 17, 2, 19])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest, json, os, io, tempfile
+
+from app.utils import JSONStream, write_json_stream
+
+class Test_JSON_Stream(unittest.TestCase):
+    '''Tests streaming the items of a JSON array'''
+
+    def setUp(self):
+        self.questions = [{'key': i, 'category': 'Test Category', 'question': f'Question {i} é?', 'answer': None} for i in range(50)]
+
+        file, self.filename = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(file, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'questions': self.questions}, f, indent=4, ensure_ascii=False)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_1_json_stream(self):
+        '''
+        Tests the streamed items match the file with chunks smaller than an item
+        '''
+        stream = JSONStream(self.filename, chunk_size=7)
+
+        self.assertTrue(list(stream) == self.questions)
+        self.assertTrue(stream.bytes_read == stream.total_bytes)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_json_stream(self):
+        '''
+        Tests a truncated file raises a decode error
+        '''
+        with open(self.filename, 'rb+') as f:
+            f.truncate(os.path.getsize(self.filename) // 2)
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(JSONStream(self.filename, chunk_size=64))
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_json_stream(self):
+        '''
+        Tests a file without the array raises a decode error
+        '''
+        with open(self.filename, 'w') as f:
+            json.dump({'cards': []}, f)
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(JSONStream(self.filename))
+
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_json_stream(self):
+        '''
+        Tests written files can be read back by the stream and json.load
+        '''
+        with open(self.filename, 'w', encoding='utf-8') as f:
+            count = write_json_stream(iter(self.questions), f)
+
+        self.assertTrue(count == 50)
+        self.assertTrue(list(JSONStream(self.filename, chunk_size=16)) == self.questions)
+        with open(self.filename, encoding='utf-8') as f:
+            self.assertTrue(json.load(f) == {'questions': self.questions})
+    #-----------------------------------------------------------------------------------------------------------
+    def test_5_json_stream(self):
+        '''
+        Tests writing an empty array and newline delimited JSON
+        '''
+        file = io.StringIO()
+        write_json_stream([], file)
+        self.assertTrue(json.loads(file.getvalue()) == {'questions': []})
+
+        file = io.StringIO()
+        write_json_stream(self.questions[:2], file, ndjson=True)
+        self.assertTrue([json.loads(line) for line in file.getvalue().splitlines()] == self.questions[:2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from flask import url_for
+
+from tests.base_test import RouteTestCase
+
+from app.metrics import Counter, Histogram
+
+class Test_Metric_Types(unittest.TestCase):
+    '''Tests formatting the metrics in the Prometheus text format'''
+
+    def test_1_counter(self):
+        '''
+        Tests counters are summed per label values
+        '''
+        counter = Counter('test_total', 'Test counter', ('endpoint',))
+        counter.inc('main.index')
+        counter.inc('main.index', amount=2)
+
+        lines = counter.collect()
+        self.assertTrue('# TYPE test_total counter' in lines)
+        self.assertTrue('test_total{endpoint="main.index"} 3' in lines)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_histogram(self):
+        '''
+        Tests histogram buckets are cumulative and escaped labels are kept on one line
+        '''
+        histogram = Histogram('test_seconds', 'Test histogram', ('template',), buckets=(0.1, 1))
+        histogram.observe(0.05, 'a"b')
+        histogram.observe(0.5, 'a"b')
+
+        lines = histogram.collect()
+        self.assertTrue('test_seconds_bucket{template="a\\"b",le="0.1"} 1' in lines)
+        self.assertTrue('test_seconds_bucket{template="a\\"b",le="1"} 2' in lines)
+        self.assertTrue('test_seconds_bucket{template="a\\"b",le="+Inf"} 2' in lines)
+        self.assertTrue('test_seconds_count{template="a\\"b"} 2' in lines)
+
+
+class Test_Metrics_Route(RouteTestCase):
+    '''Tests the metrics recorded by the request, SQL, and template hooks'''
+
+    def test_1_metrics_route(self):
+        '''
+        Tests a request is counted with its latency, statements, templates, and cache lookups
+        '''
+        self.client.get(url_for('main.flashcard', category='Test Category'))
+
+        response = self.client.get('/metrics')
+        self.assertTrue(response.status_code == 200)
+        self.assertTrue(response.mimetype == 'text/plain')
+
+        text = response.data.decode()
+        self.assertTrue('flashcards_requests_total{endpoint="main.flashcard",method="GET",status="200"}' in text)
+        self.assertTrue('flashcards_request_duration_seconds_bucket{endpoint="main.flashcard",method="GET",le="+Inf"}' in text)
+        self.assertTrue('flashcards_sql_statements_total{endpoint="main.flashcard"}' in text)
+        self.assertTrue('flashcards_template_render_seconds_count{template="flashcards.html"}' in text)
+        self.assertTrue('flashcards_cache_hit_ratio{cache="fragment"}' in text)
+        self.assertTrue('flashcards_cache_hits_total{cache="page"}' in text)
+
+
+if __name__ == "__main__":
+    unittest.main()
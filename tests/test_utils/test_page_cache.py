@@ -0,0 +1,177 @@
+import threading, time, unittest
+from unittest import mock
+
+from flask import Response, url_for
+from sqlalchemy import update
+
+from tests.base_test import RouteTestCase, count_queries
+
+from app.extensions import db
+from app.page_cache import PageCache
+from app.models.category_model import bump_deck_versions
+from app.models.flashcard_model import FlashcardModel
+
+class Test_Page_Cache(unittest.TestCase):
+    '''Tests the response cache'''
+
+    def build(self, body:str='page', status:int=200):
+        return lambda: Response(body, status=status)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_1_page_cache(self):
+        '''
+        Tests a page is built once per version
+        '''
+        cache = PageCache()
+
+        page, response, state = cache.get('/page', 1, self.build('one'), self.build('one'))
+        self.assertTrue(state == 'miss' and response is not None)
+
+        page, response, state = cache.get('/page', 1, self.build('two'), self.build('two'))
+        self.assertTrue(state == 'hit' and response is None)
+        self.assertTrue(page.body == b'one')
+
+        page, response, state = cache.get('/page', 2, self.build('two'), self.build('two'))
+        self.assertTrue(state == 'miss' and page.body == b'two')
+        self.assertTrue(cache.stats()['size'] == 1)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_page_cache(self):
+        '''
+        Tests failed responses are not cached
+        '''
+        cache = PageCache()
+
+        page, response, state = cache.get('/page', 1, self.build('error', 500), self.build())
+        self.assertTrue(page is None and response.status_code == 500)
+        self.assertTrue(cache.stats()['size'] == 0)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_page_cache(self):
+        '''
+        Tests concurrent requests for the same page wait for a single build
+        '''
+        cache = PageCache()
+        started, release = threading.Event(), threading.Event()
+        builds = []
+
+        def build():
+            builds.append(1)
+            started.set()
+            release.wait(5)
+            return Response('page')
+
+        states = []
+        threads = [threading.Thread(target=lambda: states.append(cache.get('/page', 1, build, build)[2]))]
+        threads[0].start()
+        started.wait(5)
+
+        for _ in range(4):
+            thread = threading.Thread(target=lambda: states.append(cache.get('/page', 1, build, build)[2]))
+            thread.start()
+            threads.append(thread)
+
+        # Let the waiting requests reach the build in progress
+        while cache.stats()['coalesced'] < 4:
+            time.sleep(0.01)
+        release.set()
+
+        for thread in threads:
+            thread.join(5)
+
+        self.assertTrue(len(builds) == 1)
+        self.assertTrue(sorted(states) == ['miss', 'wait', 'wait', 'wait', 'wait'])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_4_page_cache(self):
+        '''
+        Tests an expired page is served stale while it is rebuilt in the background
+        '''
+        cache = PageCache(ttl=60, stale_ttl=60, refresh_ahead=0)
+        cache.get('/page', 1, self.build('old'), self.build('old'))
+
+        refreshed = threading.Event()
+        def rebuild():
+            refreshed.set()
+            return Response('new')
+
+        with mock.patch('app.page_cache.time.monotonic', return_value=time.monotonic() + 90):
+            page, response, state = cache.get('/page', 1, self.build('inline'), rebuild)
+        self.assertTrue(state == 'stale' and page.body == b'old')
+
+        refreshed.wait(5)
+        cache.executor.submit(lambda: None).result(5)
+        page, response, state = cache.get('/page', 1, self.build('inline'), rebuild)
+        self.assertTrue(state == 'hit' and page.body == b'new')
+        self.assertTrue(cache.stats()['refreshes'] == 1)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_5_page_cache(self):
+        '''
+        Tests the least recently used pages are evicted to stay within the size limit
+        '''
+        cache = PageCache(max_bytes=300)
+
+        for key in ('/a', '/b', '/c'):
+            cache.get(key, 1, self.build('x' * 100), self.build())
+
+        stats = cache.stats()
+        self.assertTrue(stats['bytes'] <= 300)
+        self.assertTrue(stats['evictions'] >= 1)
+        self.assertTrue(cache.get('/a', 1, self.build('a'), self.build())[2] == 'miss')
+
+
+class Test_Cached_Pages(RouteTestCase):
+    '''Tests the main blueprint pages are served from the page cache'''
+
+    def test_1_cached_pages(self):
+        '''
+        Tests a repeat request is served from the cache until the deck changes
+        '''
+        url = url_for('main.flashcard', category='Test Category')
+
+        response = self.client.get(url)
+        self.assertTrue(response.headers['X-Page-Cache'] == 'miss')
+
+        with count_queries() as statements:
+            cached = self.client.get(url)
+        self.assertTrue(cached.headers['X-Page-Cache'] == 'hit')
+        self.assertTrue(cached.data == response.data)
+        self.assertTrue(len(statements) == 1)
+
+        FlashcardModel(category='Test Category', question='New question?', answer='Answer.')
+        response = self.client.get(url)
+        self.assertTrue(response.headers['X-Page-Cache'] == 'miss')
+        self.assertTrue(b'New question?' in response.data)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_cached_pages(self):
+        '''
+        Tests cached pages still answer conditional requests with a 304
+        '''
+        url = url_for('main.flashcards_api', category='Test Category')
+        etag = self.client.get(url).headers['ETag']
+
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertTrue(response.status_code == 304)
+        self.assertTrue(response.headers['X-Page-Cache'] == 'hit')
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_cached_pages(self):
+        '''
+        Tests a write by another process rebuilds the page with the new data even though no cache was invalidated
+        '''
+        url = url_for('main.flashcard', category='Test Category')
+        self.client.get(url)
+        self.assertTrue(self.client.get(url).headers['X-Page-Cache'] == 'hit')
+
+        # Written without invalidating the deck, fragment, or page caches of this process
+        db.session.execute(update(FlashcardModel).values(question='Changed question?'))
+        bump_deck_versions('Test Category')
+        db.session.commit()
+
+        response = self.client.get(url)
+        self.assertTrue(response.headers['X-Page-Cache'] == 'miss')
+        self.assertTrue(b'Changed question?' in response.data)
+
+        etag = response.headers['ETag']
+        response = self.client.get(url)
+        self.assertTrue(response.headers['X-Page-Cache'] == 'hit' and response.headers['ETag'] == etag)
+        self.assertTrue(b'Changed question?' in response.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from app.utils import prism_languages, prism_bundle
+
+class Test_Prism_Languages(unittest.TestCase):
+    '''Tests finding the Prism languages needed by a page'''
+
+    def test_1_prism_languages(self):
+        '''
+        Tests only code left for the browser needs Prism
+        '''
+        flashcards = [
+            {'q_code_example': "print('Code')", 'q_code_type': 'py', 'q_code_html': None},
+            {'a_code_example': "SELECT 1;", 'a_code_type': 'sql', 'a_code_html': '<span>SELECT</span> 1;'},
+            {'q_code_example': "<p>Text</p>", 'q_code_type': 'HTML', 'a_code_example': "code", 'a_code_type': 'unknown'},
+        ]
+
+        self.assertTrue(prism_languages(flashcards) == 'markup+python')
+        self.assertTrue(prism_languages([{'question': 'Question', 'answer': 'Answer'}]) == '')
+
+
+class Test_Prism_Bundle(unittest.TestCase):
+    '''Tests building the Prism script of a page'''
+
+    def test_1_prism_bundle(self):
+        '''
+        Tests the core is followed by the required components in load order
+        '''
+        script = prism_bundle('cpp')
+
+        core = script.index('var _self=')
+        clike = script.index('Prism.languages.clike=')
+        c = script.index('Prism.languages.c=')
+        self.assertTrue(core < clike < c)
+        self.assertTrue('languages.python=' not in script)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_prism_bundle(self):
+        '''
+        Tests unknown languages are rejected
+        '''
+        self.assertTrue(prism_bundle('python+unknown') == None)
+        self.assertTrue(prism_bundle('') == None)
+
+
+if __name__ == "__main__":
+    unittest.main()
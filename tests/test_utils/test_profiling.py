@@ -0,0 +1,76 @@
+import json, os, tempfile, unittest
+
+from flask import url_for
+
+from tests.base_test import RouteTestCase
+
+from app.profiling import init_profiling
+
+class Test_Profiling(RouteTestCase):
+    '''Tests profiling single requests'''
+
+    def setUp(self):
+        super().setUp()
+        self.folder = tempfile.TemporaryDirectory()
+        self.app.config.update(PROFILE_SECRET='secret', PROFILE_FOLDER=self.folder.name)
+        init_profiling(self.app)
+
+    def tearDown(self):
+        self.folder.cleanup()
+        super().tearDown()
+    #-----------------------------------------------------------------------------------------------------------
+    def test_1_profiling(self):
+        '''
+        Tests a request with the secret writes the collapsed stacks, speedscope file, and top function table
+        '''
+        response = self.client.get(url_for('main.flashcard', category='Test Category'), headers={'X-Profile': 'secret'})
+        self.assertTrue(response.status_code == 200)
+
+        name = response.headers.get('X-Profile')
+        self.assertTrue(name is not None and 'main-flashcard' in name)
+
+        files = sorted(os.listdir(self.folder.name))
+        self.assertTrue(files == [f"{name}.collapsed", f"{name}.speedscope.json", f"{name}.txt"])
+
+        with open(os.path.join(self.folder.name, f"{name}.speedscope.json")) as file:
+            profile = json.load(file)
+        self.assertTrue(profile['profiles'][0]['type'] == 'sampled')
+        self.assertTrue(len(profile['profiles'][0]['samples']) == len(profile['profiles'][0]['weights']))
+
+        with open(os.path.join(self.folder.name, f"{name}.txt")) as file:
+            self.assertTrue('cumulative' in file.read())
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_profiling(self):
+        '''
+        Tests requests without the secret, or with a wrong one, are not profiled
+        '''
+        response = self.client.get(url_for('main.index'))
+        self.assertTrue('X-Profile' not in response.headers)
+
+        response = self.client.get(url_for('main.index', _profile='wrong'))
+        self.assertTrue('X-Profile' not in response.headers)
+        self.assertTrue(os.listdir(self.folder.name) == [])
+
+        response = self.client.get(url_for('main.index', _profile='secret'))
+        self.assertTrue('X-Profile' in response.headers)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_profiling(self):
+        '''
+        Tests a profiled request to a cached page builds the page instead of being served from the caches
+        '''
+        self.app.config['PROFILE_TOP'] = 1000
+        url = url_for('main.flashcard', category='Test Category')
+        self.client.get(url)
+        self.assertTrue(self.client.get(url).headers['X-Page-Cache'] == 'hit')
+
+        response = self.client.get(url, headers={'X-Profile': 'secret'})
+        self.assertTrue('X-Page-Cache' not in response.headers)
+
+        with open(os.path.join(self.folder.name, f"{response.headers['X-Profile']}.txt")) as file:
+            table = file.read()
+        for function in ('view_cards_page', 'render_template', 'render_card', 'view'):
+            self.assertTrue(f"({function})" in table)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest import mock
+
+from flask import jsonify
+
+from tests.base_test import RouteTestCase
+
+from app.extensions import RepeatedQueryError
+from app.models.flashcard_model import FlashcardModel, FigureModel
+
+class Test_Query_Analysis(RouteTestCase):
+    '''Tests the slow query log and the repeated statement detector'''
+
+    def add_per_card_route(self):
+        # A route loading the figures of each card with its own query
+        def per_card():
+            cards = FlashcardModel.query.all()
+            figures = [FigureModel.query.filter_by(id=card.q_figure).first() for card in cards]
+            return jsonify(count=len(figures))
+
+        self.app.add_url_rule('/per_card', 'per_card', per_card)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_1_query_analysis(self):
+        '''
+        Tests a request repeating a statement raises in testing
+        '''
+        self.add_per_card_route()
+        self.create_test_deck(10)
+
+        with mock.patch('app.extensions.LOGGER') as logger:
+            with self.assertRaises(RepeatedQueryError):
+                self.client.get('/per_card')
+        self.assertTrue('Repeated query in per_card' in logger.warning.call_args[0][0])
+    #-----------------------------------------------------------------------------------------------------------
+    def test_2_query_analysis(self):
+        '''
+        Tests repeats under the threshold are allowed and only logged when raising is disabled
+        '''
+        self.add_per_card_route()
+        self.create_test_deck(4)
+        self.assertTrue(self.client.get('/per_card').status_code == 200)
+
+        self.create_test_deck(6)
+        self.app.config['N_PLUS_ONE_RAISE'] = False
+        with mock.patch('app.extensions.LOGGER') as logger:
+            self.assertTrue(self.client.get('/per_card').status_code == 200)
+        self.assertTrue(logger.warning.called)
+    #-----------------------------------------------------------------------------------------------------------
+    def test_3_query_analysis(self):
+        '''
+        Tests slow statements are logged with their query plan
+        '''
+        self.app.config['SLOW_QUERY_THRESHOLD'] = 0
+
+        with mock.patch('app.extensions.LOGGER') as logger:
+            FlashcardModel.query.filter_by(category='Test Category').all()
+
+        messages = [call[0][0] for call in logger.warning.call_args_list]
+        self.assertTrue(any('Slow query' in message and 'plan:' in message and 'flashcards' in message for message in messages))
+        self.assertTrue(any('SEARCH' in message or 'SCAN' in message for message in messages))
+
+
+if __name__ == "__main__":
+    unittest.main()